@@ -1,6 +1,9 @@
 import time
 
 from automation_utils.cli.cli_session import CliSession
+from automation_utils.common.vendors import Vendors
+from automation_utils.session_registry import SessionFactoryRegistry
+from automation_utils.common.decorators.caching import invalidates_command_cache
 from automation_utils.common.exceptions import (
     CommandFailed,
     SessionClosed,
@@ -27,6 +30,7 @@ EOF_KEYWORD = "EOF"
 logger = common.get_logger(__file__)
 
 
+@SessionFactoryRegistry.register_session_factory(Vendors.ARISTA)
 class CliCeos(CliSession):
     def __init__(self, hostname, username, password):
         super().__init__(hostname, username, password)
@@ -52,6 +56,7 @@ class CliCeos(CliSession):
         finally:
             self.ssh.close()
 
+    @invalidates_command_cache
     def edit_config(
         self,
         candidate,
@@ -140,12 +145,14 @@ class CliCeos(CliSession):
             raise ex
         return changes
 
+    @invalidates_command_cache
     def execute_request_command(self, command: str):
         self.ssh.execute_shell_command(
             command, match_reg="\?\s+\[(yes|confirm)\]", shows_output=False
         )
         self.ssh.execute_shell_command("y")
 
+    @invalidates_command_cache
     def confirm_commit(self, session_name=None) -> None:
         try:
             cmd = (
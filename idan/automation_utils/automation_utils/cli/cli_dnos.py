@@ -1,4 +1,11 @@
+import os
+import re
+import tempfile
+
 from automation_utils.cli.cli_session import CliSession
+from automation_utils.common.vendors import Vendors
+from automation_utils.session_registry import SessionFactoryRegistry
+from automation_utils.common.decorators.caching import invalidates_command_cache
 from automation_utils.common.exceptions import (
     CommandFailed,
     SessionClosed,
@@ -23,14 +30,24 @@ COMMIT_CONFIRMED = "Commit confirmed"
 ROLLBACK_COMPLETE = "rollback complete"
 LOAD_OVERRIDE_COMMAND = "load override factory-default"
 ROLLBACK_KEYWORD = "rollback"
+LOAD_MERGE_KEYWORD = "load merge"
+LOAD_OVERRIDE_KEYWORD = "load override"
+# bulk candidates are uploaded to the device config files folder, and loaded by their full path from there
+CONFIG_FILES_DIR = "/config"
+BULK_CANDIDATE_FILE = "automation_utils_candidate.cfg"
+LOAD_FAILURES = ("ERROR", "Error", "error:")
+FAILED_LINE_REGEX = re.compile(r"line\s+(\d+)", flags=re.IGNORECASE)
 
 
 logger = common.get_logger(__file__)
 
 
+@SessionFactoryRegistry.register_session_factory(Vendors.DRIVENETS)
 class CliDnos(CliSession):
-    def __init__(self, hostname, username, password):
+    def __init__(self, hostname, username, password, config_files_dir=CONFIG_FILES_DIR):
+        """:param config_files_dir: the device folder the bulk candidates are uploaded to, see edit_config()"""
         super().__init__(hostname, username, password)
+        self.config_files_dir = config_files_dir
 
     @property
     def disable_pagination_suffix(self) -> str:
@@ -47,6 +64,7 @@ class CliDnos(CliSession):
         finally:
             self.ssh.close()
 
+    @invalidates_command_cache
     def edit_config(
         self,
         candidate,
@@ -54,9 +72,18 @@ class CliDnos(CliSession):
         diff=False,
         confirm_timeout=None,
         stop_on_error=True,
+        bulk=False,
     ) -> str:
+        """
+        :param bulk: upload the candidate as a file and load it with a single 'load merge' ('load override' when
+                     replace is set) command, instead of sending it line by line. The load is all or nothing, so
+                     stop_on_error doesn't apply, and a failure is attributed to the candidate line it reports.
+        """
         changes = None
 
+        if bulk:
+            self._upload_candidate(candidate)
+
         try:
             self.ssh.execute_shell_command(
                 CONFIGURE_KEYWORD, shows_output=False
@@ -65,6 +92,37 @@ class CliDnos(CliSession):
             logger.error(f"Failed to enter configure mode: {ex}")
             raise ex
 
+        if bulk:
+            self._load_candidate(candidate, replace)
+        else:
+            self._apply_candidate_lines(candidate, replace, stop_on_error)
+
+        try:
+            commit_cmd = COMMIT_AND_EXIT_KEYWORD
+            if confirm_timeout:
+                commit_cmd = f"{COMMIT_CONFIRM_KEYWORD} {confirm_timeout}"
+            logger.debug(f"Executing '{commit_cmd}'...")
+            res = self.ssh.execute_shell_command(commit_cmd, shows_output=True)
+            if COMMIT_SUCCEEDED not in res:
+                logger.error(f"Commit failed: {res}")
+                logger.debug("Trying to discard changes...")
+                self.ssh.execute_shell_command(
+                    DISCARD_CANDIDATE, shows_output=False
+                )
+                raise CommitFailedException(res)
+            logger.debug("COMMIT succeeded")
+            if diff:
+                changes = self.ssh.execute_shell_command(
+                    DIFF_COMMAND, shows_output=True
+                )
+        except (CommandFailed, UnexpectedOutput) as ex:
+            logger.error(
+                f"An error occurred while applying configuration: {ex}"
+            )
+            raise ex
+        return changes
+
+    def _apply_candidate_lines(self, candidate, replace, stop_on_error):
         if replace:
             try:
                 self.ssh.execute_shell_command(
@@ -93,37 +151,61 @@ class CliDnos(CliSession):
                 )
                 raise ex
 
+    @property
+    def _bulk_candidate_path(self) -> str:
+        return f"{self.config_files_dir.rstrip('/')}/{BULK_CANDIDATE_FILE}"
+
+    def _upload_candidate(self, candidate):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".cfg", delete=False
+        ) as candidate_file:
+            candidate_file.write(candidate)
         try:
-            commit_cmd = COMMIT_AND_EXIT_KEYWORD
-            if confirm_timeout:
-                commit_cmd = f"{COMMIT_CONFIRM_KEYWORD} {confirm_timeout}"
-            logger.debug(f"Executing '{commit_cmd}'...")
-            res = self.ssh.execute_shell_command(commit_cmd, shows_output=True)
-            if COMMIT_SUCCEEDED not in res:
-                logger.error(f"Commit failed: {res}")
-                logger.debug("Trying to discard changes...")
-                self.ssh.execute_shell_command(
-                    DISCARD_CANDIDATE, shows_output=False
-                )
-                raise CommitFailedException(res)
-            logger.debug("COMMIT succeeded")
-            if diff:
-                changes = self.ssh.execute_shell_command(
-                    DIFF_COMMAND, shows_output=True
-                )
-        except (CommandFailed, UnexpectedOutput) as ex:
-            logger.error(
-                f"An error occurred while applying configuration: {ex}"
+            logger.debug(
+                f"Uploading a candidate of {len(candidate.splitlines())} lines..."
             )
-            raise ex
-        return changes
+            self.ssh.scp_put(candidate_file.name, self._bulk_candidate_path)
+        finally:
+            os.remove(candidate_file.name)
 
+    def _load_candidate(self, candidate, replace):
+        load_cmd = f"{LOAD_OVERRIDE_KEYWORD if replace else LOAD_MERGE_KEYWORD} {self._bulk_candidate_path}"
+        logger.debug(f"Executing '{load_cmd}'...")
+        try:
+            self.ssh.execute_shell_command(
+                load_cmd,
+                shows_output=None,
+                additional_cmd_failures=list(LOAD_FAILURES),
+            )
+        except (CommandFailed, UnexpectedOutput) as ex:
+            logger.warning(
+                "An error occurred while loading the configuration. The candidate will be disregarded"
+            )
+            self.ssh.execute_shell_command(
+                DISCARD_CANDIDATE, shows_output=False
+            )
+            raise CommandFailed(
+                self._attribute_load_failure(candidate, str(ex))
+            ) from ex
+
+    @staticmethod
+    def _attribute_load_failure(candidate, output) -> str:
+        """:returns: the load failure output, with the candidate line it refers to when it reports a line number"""
+        match = FAILED_LINE_REGEX.search(output)
+        lines = candidate.split("\n")
+        if match and 0 < int(match.group(1)) <= len(lines):
+            line_number = int(match.group(1))
+            return f"{output}\nFailed candidate line {line_number}: '{lines[line_number - 1].strip()}'"
+        return output
+
+    @invalidates_command_cache
     def execute_request_command(self, command: str):
         self.ssh.execute_shell_command(
             command, match="(yes/no) [no]?", shows_output=False
         )
         self.ssh.execute_shell_command("yes")
 
+    @invalidates_command_cache
     def confirm_commit(self, session_name=None) -> None:
         try:
             logger.debug("Entering configure mode...")
@@ -154,6 +236,7 @@ class CliDnos(CliSession):
             logger.exception(ex)
             raise ex
 
+    @invalidates_command_cache
     def rollback(self, index) -> None:
         try:
             self.ssh.execute_shell_command(
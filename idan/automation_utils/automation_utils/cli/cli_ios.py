@@ -2,6 +2,9 @@ import re
 import threading
 
 from automation_utils.cli.cli_session import CliSession
+from automation_utils.common.vendors import Vendors
+from automation_utils.session_registry import SessionFactoryRegistry
+from automation_utils.common.decorators.caching import invalidates_command_cache
 from automation_utils.common.exceptions import (
     CommandFailed,
     SessionClosed,
@@ -63,6 +66,7 @@ COMMIT_EXTRA_TIME = 1
 logger = common.get_logger(__file__)
 
 
+@SessionFactoryRegistry.register_session_factory(Vendors.CISCO)
 class CliIos(CliSession):
     def __init__(self, hostname, username, password):
         super().__init__(
@@ -95,6 +99,7 @@ class CliIos(CliSession):
         finally:
             self.ssh.close()
 
+    @invalidates_command_cache
     def edit_config(
         self,
         candidate,
@@ -174,6 +179,7 @@ class CliIos(CliSession):
             raise ex
         return changes
 
+    @invalidates_command_cache
     def _on_commit_timeout(self):
         logger.info(
             f"Commit was not confirmed. Configuration rolled back to the previous configuration\nExiting configuration mode..."
@@ -187,6 +193,7 @@ class CliIos(CliSession):
             )
             raise ex
 
+    @invalidates_command_cache
     def execute_request_command(self, command: str):
         if self.awaiting_commit_confirm:
             raise CommandFailed("Awaiting for commit confirm")
@@ -198,6 +205,7 @@ class CliIos(CliSession):
         )
         self.ssh.execute_shell_command("y", shows_output=True)
 
+    @invalidates_command_cache
     def confirm_commit(self, session_name=None) -> None:
         if not self.awaiting_commit_confirm:
             raise CommandFailed("There is no commit awaiting for confirmation")
@@ -216,6 +224,7 @@ class CliIos(CliSession):
             logger.exception(ex)
             raise ex
 
+    @invalidates_command_cache
     def rollback(self, index) -> None:
         if self.awaiting_commit_confirm:
             raise CommandFailed("Awaiting for commit confirm")
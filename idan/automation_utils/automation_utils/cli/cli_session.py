@@ -1,10 +1,19 @@
+import contextlib
+import logging
 from abc import ABC, abstractmethod
 
+from automation_utils.cli.command_cache import CommandCache, DEFAULT_CACHE_TTL
 from automation_utils.ssh_client.ssh_client import SSHClient
+from automation_utils.ssh_client.async_ssh_client import AsyncSSHClient
 from automation_utils.helpers.deciphers.decipher_base import Decipher
 
 SHOW_COMMAND_PREFIX = "show "
 
+# paramiko logs every transport event, keep it out of the test logs
+paramiko_logger = logging.getLogger("paramiko")
+paramiko_logger.handlers = []
+paramiko_logger.propagate = False
+
 
 class CliSession(ABC):
     def __init__(self, hostname, username, password, session_conf=None):
@@ -14,13 +23,10 @@ class CliSession(ABC):
             password=password,
             session_conf=session_conf if session_conf else {},
         )
+        self.async_ssh = AsyncSSHClient(self.ssh)
+        # show commands outputs are cached only while a cache is set, see cached_commands()
+        self.command_cache: CommandCache = None
         self._pagination_disabled = False
-        import logging
-
-
-        module_logger = logging.getLogger('paramiko')
-        module_logger.handlers = []
-        module_logger.propagate = False
 
     def open_session(self):
         self.ssh.connect_wait_for_prompt(prompt_retries=3)
@@ -84,6 +90,29 @@ class CliSession(ABC):
         """
         pass
 
+    @contextlib.contextmanager
+    def cached_commands(self, ttl=DEFAULT_CACHE_TTL):
+        """Caches the show commands outputs (and the objects deciphered from them) within the context,
+        so repeated show commands are sent to the device only once.
+        The cache is invalidated whenever the device state might change - config edits, rollbacks and
+        non-show commands. When a cache is already set, it is used as is.
+
+            with cli.cached_commands():
+                cli.send_command("show interfaces", decipher=InterfacesStatusDecipher)
+        """
+        if self.command_cache is not None:
+            yield self.command_cache
+            return
+        self.command_cache = CommandCache(ttl)
+        try:
+            yield self.command_cache
+        finally:
+            self.command_cache = None
+
+    def invalidate_command_cache(self):
+        if self.command_cache is not None:
+            self.command_cache.invalidate()
+
     def send_command(
         self, command: str, sendonly: bool = False, decipher: Decipher = None
     ):
@@ -92,7 +121,9 @@ class CliSession(ABC):
         return the results to the caller.
         :param command: The command to send over the connection to the device
         :param sendonly: Bool value that will send the command but not wait for a result.
-        :param decipher: Callback method for processing the response
+        :param decipher: Callback method for processing the response. A decipher supporting streaming
+                         (see Decipher.streaming) deciphers the output while it is received, unless the output
+                         is cached
 
         :returns: The output from the device after executing the command.
                   If decipher is provided, it will return the correspondent data object
@@ -100,6 +131,116 @@ class CliSession(ABC):
         if not command:
             return None
 
+        cache = self.command_cache
+        cacheable = (
+            cache is not None
+            and not sendonly
+            and command.startswith(SHOW_COMMAND_PREFIX)
+        )
+        cli_output = None
+        if cacheable:
+            found, cached = cache.get(command, decipher)
+            if found:
+                return cached
+            cli_output = cache.get_output(command)
+        elif cache is not None:
+            # a command that is not a show command might change the device state
+            cache.invalidate()
+
+        if cli_output is None:
+            # the output of a command which is not cached is deciphered while it is received
+            stream = None
+            if decipher and not sendonly and not cacheable:
+                stream = decipher.streaming()
+            if stream is not None:
+                self._send_command(command, output_stream=stream)
+                return stream.finish()
+            cli_output = self._send_command(command, sendonly)
+
+        result = decipher.decipher(cli_output) if decipher else cli_output
+        if cacheable:
+            cache.set(command, cli_output, decipher, result)
+        return result
+
+    def send_commands(self, commands: list[str], deciphers=None) -> list:
+        """Sends several commands, pipelined over the shell - the commands are written without waiting for the
+        prompt between them, and their outputs are split back by the prompts.
+        Intended for show commands, saving a device round-trip per command. Same as send_command, show commands
+        are cached within cached_commands(), and other commands invalidate the cache.
+        :param deciphers: a decipher applied to all the outputs, or a list of a decipher (or None) per command
+        :returns: list of the outputs (or the deciphered objects) of the commands, in the order of the commands
+
+            system, interfaces = cli.send_commands(
+                ["show system", "show interfaces"], [SystemStatusDecipher, InterfacesStatusDecipher]
+            )
+        """
+        commands = list(commands)
+        if not isinstance(deciphers, (list, tuple)):
+            deciphers = [deciphers] * len(commands)
+        if len(deciphers) != len(commands):
+            raise ValueError(
+                f"got {len(deciphers)} deciphers for {len(commands)} commands"
+            )
+
+        cache = self.command_cache
+        cacheable = cache is not None and all(
+            command.startswith(SHOW_COMMAND_PREFIX) for command in commands
+        )
+        if cache is not None and not cacheable:
+            # a command that is not a show command might change the device state
+            cache.invalidate()
+
+        results = [None] * len(commands)
+        resolved = set()
+        outputs = {}
+        # index of the commands to send, a command repeated in the list is sent once
+        pending = {}
+        for i, (command, decipher) in enumerate(zip(commands, deciphers)):
+            if cacheable:
+                found, cached = cache.get(command, decipher)
+                if found:
+                    results[i] = cached
+                    resolved.add(i)
+                    continue
+                output = cache.get_output(command)
+                if output is not None:
+                    outputs[command] = output
+                    continue
+            pending.setdefault(command, i)
+
+        if pending:
+            sent_outputs = self.ssh.execute_shell_commands(
+                [self._prepare_command(command) for command in pending],
+                shows_output=True,
+            )
+            outputs.update(zip(pending, sent_outputs))
+
+        for i, (command, decipher) in enumerate(zip(commands, deciphers)):
+            if i in resolved:
+                continue
+            results[i] = (
+                decipher.decipher(outputs[command])
+                if decipher
+                else outputs[command]
+            )
+            if cacheable:
+                cache.set(command, outputs[command], decipher, results[i])
+        return results
+
+    def _send_command(
+        self, command: str, sendonly: bool = False, output_stream=None
+    ) -> str:
+        """Sends the command to the device, disabling the pagination of show commands"""
+        command = self._prepare_command(command)
+        return self.ssh.execute_shell_command(
+            command,
+            wait_for_answer=not sendonly,
+            shows_output=not sendonly,
+            output_stream=output_stream,
+        )
+
+    def _prepare_command(self, command: str) -> str:
+        """Disables the pagination before the first show command, and adds the no pagination suffix to show commands"""
         if (
             not self._pagination_disabled
             and self.disable_pagination_cmd
@@ -116,13 +257,54 @@ class CliSession(ABC):
             SHOW_COMMAND_PREFIX
         ):
             command = f"{command}{self.disable_pagination_suffix}"
+        return command
+
+    async def open_session_async(self):
+        return await self.async_ssh.run(self.open_session)
+
+    async def close_session_async(self):
+        return await self.async_ssh.run(self.close_session)
+
+    async def execute_shell_command_async(self, command: str, **kwargs):
+        """Asyncio version of SSHClient.execute_shell_command.
+        The command runs in the async ssh thread pool, so many device sessions can be driven from one event loop.
+        """
+        return await self.async_ssh.execute_shell_command(command, **kwargs)
 
-        cli_output = self.ssh.execute_shell_command(
-            command, wait_for_answer=not sendonly, shows_output=not sendonly
+    async def send_command_async(
+        self, command: str, sendonly: bool = False, decipher: Decipher = None
+    ):
+        """Asyncio version of send_command, for example:
+
+            results = await asyncio.gather(
+                *(cli.send_command_async("show system", decipher=SystemStatusDecipher) for cli in sessions)
+            )
+        """
+        return await self.async_ssh.run(
+            self.send_command, command, sendonly, decipher
         )
-        if decipher:
-            return decipher.decipher(cli_output)
-        return cli_output
+
+    async def send_commands_async(
+        self, commands: list[str], deciphers=None
+    ) -> list:
+        """Asyncio version of send_commands"""
+        return await self.async_ssh.run(self.send_commands, commands, deciphers)
+
+    async def edit_config_async(self, candidate, **kwargs) -> str:
+        """Asyncio version of edit_config"""
+        return await self.async_ssh.run(self.edit_config, candidate, **kwargs)
+
+    async def execute_request_command_async(self, command: str):
+        """Asyncio version of execute_request_command"""
+        return await self.async_ssh.run(self.execute_request_command, command)
+
+    async def confirm_commit_async(self, session_name=None) -> None:
+        """Asyncio version of confirm_commit"""
+        return await self.async_ssh.run(self.confirm_commit, session_name)
+
+    async def rollback_async(self, index) -> None:
+        """Asyncio version of rollback"""
+        return await self.async_ssh.run(self.rollback, index)
 
     @abstractmethod
     def confirm_commit(self, session_name=None) -> None:
@@ -0,0 +1,71 @@
+import threading
+from time import monotonic
+
+# seconds a cached command output is valid
+DEFAULT_CACHE_TTL = 300
+
+
+class _CacheEntry:
+    def __init__(self, output: str):
+        self.created = monotonic()
+        self.output = output
+        # decipher -> the object deciphered from output
+        self.deciphered = {}
+
+
+class CommandCache:
+    """
+    Cache of show commands outputs of a single device, and of the objects deciphered from them.
+    Entries expire after ttl seconds. The cache is invalidated by the CLI session whenever
+    the device state might change (config edits, rollbacks, non-show commands).
+    """
+
+    def __init__(self, ttl=DEFAULT_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, command: str) -> _CacheEntry:
+        entry = self._entries.get(command)
+        if entry and monotonic() - entry.created > self.ttl:
+            del self._entries[command]
+            entry = None
+        return entry
+
+    def get(self, command: str, decipher=None):
+        """
+        :returns: a tuple of (found, value) - the cached output of the command, or the object deciphered
+                  from it if a decipher is provided.
+        """
+        with self._lock:
+            entry = self._get_entry(command)
+            if entry is None or (decipher and decipher not in entry.deciphered):
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            if decipher:
+                return True, entry.deciphered[decipher]
+            return True, entry.output
+
+    def get_output(self, command: str):
+        """:returns: the cached output of the command, or None"""
+        with self._lock:
+            entry = self._get_entry(command)
+            return entry.output if entry else None
+
+    def set(self, command: str, output: str, decipher=None, deciphered=None):
+        with self._lock:
+            entry = self._get_entry(command)
+            if entry is None or entry.output != output:
+                entry = self._entries[command] = _CacheEntry(output)
+            if decipher:
+                entry.deciphered[decipher] = deciphered
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
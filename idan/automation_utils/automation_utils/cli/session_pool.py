@@ -0,0 +1,197 @@
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import monotonic
+
+from automation_utils.cli.cli_session import CliSession
+from automation_utils.session_registry import LazySessions
+
+import orbital.common as common
+
+logger = common.get_logger(__file__)
+
+# maximum number of sessions connecting at the same time
+DEFAULT_MAX_WORKERS = 16
+# seconds between transport keepalive packets of the pooled sessions
+DEFAULT_KEEPALIVE_INTERVAL = 30
+# seconds between two health checks of the pooled sessions
+DEFAULT_MONITOR_INTERVAL = 30
+# upper bounds (seconds) of the connect latency histogram buckets, the last bucket is unbounded
+CONNECT_LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 30)
+
+
+@dataclass
+class SessionPoolStats:
+    open: int = 0
+    # open sessions not executing a command
+    idle: int = 0
+    closed: int = 0
+    reconnects: int = 0
+    connect_failures: int = 0
+    # bucket upper bound ("+Inf" for the last one) -> number of connects that took up to it
+    connect_latency: dict[str, int] = field(default_factory=dict)
+
+
+class SessionPool:
+    """
+    Owns the CLI sessions of the devices: opens them in parallel, keeps them alive with transport
+    keepalives, and reconnects the sessions that died in the background, so commands don't pay for
+    the connect and prompt wait.
+    Only the sessions opened by open_all() are kept alive and monitored, the sessions opened by their
+    commands are left as they are.
+    A session is used by one thread at a time (see SSHClient.lock), busy sessions are never touched by the monitor.
+    """
+
+    def __init__(
+        self,
+        sessions: dict[str, CliSession],
+        max_workers=DEFAULT_MAX_WORKERS,
+        keepalive_interval=DEFAULT_KEEPALIVE_INTERVAL,
+        monitor_interval=DEFAULT_MONITOR_INTERVAL,
+    ):
+        self.sessions = sessions
+        self.max_workers = max_workers
+        self.keepalive_interval = keepalive_interval
+        self.monitor_interval = monitor_interval
+        # sessions opened by the pool, only they are reconnected by the monitor
+        self._opened = set()
+        self._stats_lock = threading.Lock()
+        self._reconnects = 0
+        self._connect_failures = 0
+        self._latency_counts = [0] * (len(CONNECT_LATENCY_BUCKETS) + 1)
+        self._monitor = None
+        self._stop_monitor = threading.Event()
+
+    def _created_sessions(self) -> dict[str, CliSession]:
+        """:returns: the sessions that exist, without creating the lazy ones"""
+        if isinstance(self.sessions, LazySessions):
+            return self.sessions.created()
+        return self.sessions
+
+    def open_all(self, names=None) -> dict[str, Exception]:
+        """
+        Opens the sessions in parallel, up to max_workers at a time.
+        :param names: names of the sessions to open, all of them by default
+        :returns: the sessions that failed to open, name -> exception
+        """
+        names = list(self.sessions if names is None else names)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(names)))
+        ) as executor:
+            errors = executor.map(self._open, names)
+        failures = {
+            name: error for name, error in zip(names, errors) if error
+        }
+        logger.debug(
+            f"Opened {len(names) - len(failures)} out of {len(names)} sessions"
+        )
+        return failures
+
+    def _open(self, name):
+        session = self.sessions[name]
+        with session.ssh.lock:
+            # applied on the reconnects of the session as well
+            session.ssh.keepalive_interval = self.keepalive_interval
+            error = self._connect(name, session.open_session)
+        if error is None:
+            self._opened.add(name)
+        return error
+
+    def _connect(self, name, connect):
+        start = monotonic()
+        try:
+            connect()
+        except Exception as e:
+            logger.error(f"{name}: failed to connect: {e}")
+            with self._stats_lock:
+                self._connect_failures += 1
+            return e
+        latency = monotonic() - start
+        with self._stats_lock:
+            self._latency_counts[
+                bisect.bisect_left(CONNECT_LATENCY_BUCKETS, latency)
+            ] += 1
+        return None
+
+    def check_sessions(self):
+        """Reconnects the opened sessions whose connection died, skipping the sessions executing a command"""
+        dead = []
+        for name in list(self._opened):
+            ssh = self.sessions[name].ssh
+            if not ssh.lock.acquire(blocking=False):
+                continue
+            try:
+                if not ssh.is_connected():
+                    dead.append(name)
+            finally:
+                ssh.lock.release()
+        if not dead:
+            return
+        logger.warning(f"Reconnecting dead sessions: {dead}")
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(dead)))
+        ) as executor:
+            executor.map(self._reconnect, dead)
+
+    def _reconnect(self, name):
+        ssh = self.sessions[name].ssh
+        with ssh.lock:
+            # the session might have been reconnected by a command meanwhile
+            if ssh.is_connected():
+                return
+            if self._connect(name, ssh.reconnect) is None:
+                with self._stats_lock:
+                    self._reconnects += 1
+
+    def start_monitor(self):
+        """Starts checking the sessions every monitor_interval seconds in a background thread"""
+        if self._monitor and self._monitor.is_alive():
+            return
+        self._stop_monitor.clear()
+        self._monitor = threading.Thread(
+            target=self._monitor_sessions, name="session-pool-monitor", daemon=True
+        )
+        self._monitor.start()
+
+    def _monitor_sessions(self):
+        while not self._stop_monitor.wait(self.monitor_interval):
+            try:
+                self.check_sessions()
+            except Exception as e:
+                logger.exception(f"Sessions check failed: {e}")
+
+    def stop_monitor(self):
+        self._stop_monitor.set()
+        if self._monitor:
+            self._monitor.join()
+            self._monitor = None
+
+    def close_all(self):
+        """Stops the monitor and closes all the sessions"""
+        self.stop_monitor()
+        for session in self._created_sessions().values():
+            with session.ssh.lock:
+                if session.ssh.is_connected():
+                    session.close_session()
+        self._opened.clear()
+
+    def stats(self) -> SessionPoolStats:
+        stats = SessionPoolStats()
+        # sessions that were not created yet are closed
+        stats.closed = len(self.sessions) - len(self._created_sessions())
+        for session in self._created_sessions().values():
+            ssh = session.ssh
+            if not ssh.is_connected():
+                stats.closed += 1
+                continue
+            stats.open += 1
+            if ssh.lock.acquire(blocking=False):
+                ssh.lock.release()
+                stats.idle += 1
+        with self._stats_lock:
+            stats.reconnects = self._reconnects
+            stats.connect_failures = self._connect_failures
+            bounds = [str(bound) for bound in CONNECT_LATENCY_BUCKETS] + ["+Inf"]
+            stats.connect_latency = dict(zip(bounds, self._latency_counts))
+        return stats
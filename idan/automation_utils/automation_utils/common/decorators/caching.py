@@ -20,3 +20,19 @@ class KwargsCache:
             return wrapper
 
         return deco
+
+
+def invalidates_command_cache(func):
+    """
+    Decorator for CliSession methods that might change the device state.
+    The cached show commands outputs of the session are dropped once the method returns.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.invalidate_command_cache()
+
+    return wrapper
@@ -56,6 +56,16 @@ class RetryException(MainException):
     pass
 
 
+class TopologyValidationFailed(MainException):
+    """
+    thrown when topology validation fails on one or more devices, holds the full validation report
+    """
+
+    def __init__(self, report):
+        super().__init__(str(report))
+        self.report = report
+
+
 class SSHException(MainException, se):
     pass
 
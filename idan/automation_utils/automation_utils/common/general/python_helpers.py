@@ -1,4 +1,6 @@
+import gc
 import threading
+import contextlib
 import collections
 from copy import deepcopy
 
@@ -40,6 +42,22 @@ def trim_dict(dict_to_trim, dict_to_remove):
     return {k: v for k, v in dict_to_trim.items() if k not in dict_to_remove}
 
 
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector while building large trees of containers, such as parsing or
+    unpickling a big document, which would otherwise trigger many full collections on the way.
+    The collector is process wide, it is paused for all the threads.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 class Singleton(type):
     _instances = {}
 
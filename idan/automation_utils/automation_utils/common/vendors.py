@@ -4,3 +4,4 @@ class Vendors(Enum):
     DRIVENETS = "drivenets"
     CISCO = "cisco"
     ARISTA = "arista"
+    IXIA = "ixia"
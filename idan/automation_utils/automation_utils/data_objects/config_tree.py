@@ -0,0 +1,106 @@
+from fnmatch import fnmatchcase
+
+# path segment matching any number of levels, including none
+ANY_DEPTH = "**"
+GLOB_CHARS = frozenset("*?[")
+
+
+def _is_glob(segment: str) -> bool:
+    return not GLOB_CHARS.isdisjoint(segment)
+
+
+class ConfigNode:
+    """
+    A line of a hierarchical device configuration, and the lines nested under it.
+    Children are indexed by their line text and by their keyword (the first word of the line),
+    so exact and keyword prefixed path segments don't scan the siblings.
+
+        protocols
+          pim
+            address-family ipv4
+              interface bundle-340
+
+    config.find("protocols", "pim", "**", "interface *") returns the "interface bundle-340" node,
+    whose keyword is "interface" and value is "bundle-340".
+    """
+
+    __slots__ = ("name", "keyword", "value", "children", "_children_by_keyword")
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        keyword, _, value = name.partition(" ")
+        self.keyword = keyword
+        self.value = value
+        self.children: dict[str, ConfigNode] = {}
+        self._children_by_keyword: dict[str, list[ConfigNode]] = {}
+
+    def add_child(self, name: str) -> "ConfigNode":
+        """:returns: the child with the given line text, adding it if it doesn't exist"""
+        child = self.children.get(name)
+        if child is None:
+            child = self.children[name] = ConfigNode(name)
+            self._children_by_keyword.setdefault(child.keyword, []).append(child)
+        return child
+
+    def descendants(self):
+        """Yields all the nodes under this node, depth first"""
+        for child in self.children.values():
+            yield child
+            yield from child.descendants()
+
+    def _match_children(self, segment: str):
+        if not _is_glob(segment):
+            child = self.children.get(segment)
+            return [child] if child else []
+        keyword, separator, _ = segment.partition(" ")
+        if separator and not _is_glob(keyword):
+            candidates = self._children_by_keyword.get(keyword, [])
+        else:
+            candidates = self.children.values()
+        return [child for child in candidates if fnmatchcase(child.name, segment)]
+
+    def find(self, *path: str) -> list["ConfigNode"]:
+        """
+        :param path: line texts of the nodes leading to the requested nodes, one segment per level.
+                     A segment may contain glob patterns ("interface bundle-*"),
+                     and "**" matches any number of levels.
+        :returns: all the nodes matching the path, in configuration order
+        """
+        nodes = [self]
+        for segment in path:
+            if segment == ANY_DEPTH:
+                expanded = {}
+                for node in nodes:
+                    expanded.setdefault(id(node), node)
+                    for descendant in node.descendants():
+                        expanded.setdefault(id(descendant), descendant)
+                nodes = list(expanded.values())
+            else:
+                nodes = [
+                    child
+                    for node in nodes
+                    for child in node._match_children(segment)
+                ]
+            if not nodes:
+                break
+        return nodes
+
+    def get(self, *path: str):
+        """:returns: the first node matching the path, or None"""
+        nodes = self.find(*path)
+        return nodes[0] if nodes else None
+
+    def values(self, *path: str) -> list[str]:
+        """:returns: the values of all the nodes matching the path, e.g. the interface names of "interface *" """
+        return [node.value for node in self.find(*path)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.children
+
+    def __eq__(self, other):
+        if not isinstance(other, ConfigNode):
+            return False
+        return self.name == other.name and self.children == other.children
+
+    def __repr__(self):
+        return f"ConfigNode(name='{self.name}', children={list(self.children)})"
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, unsafe_hash=True)
 class InterfaceStatus:
     interface: str
     admin_status: str
-    operational_status: str
\ No newline at end of file
+    operational_status: str
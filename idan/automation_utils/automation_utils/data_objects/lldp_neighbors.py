@@ -1,22 +1,10 @@
-class LldpNeighbor:
-    def __init__(self, interface, system_name, neighbor_interface, ttl):
-        self.interface = interface
-        self.system_name = system_name
-        self.neighbor_interface = neighbor_interface
-        self.ttl = ttl
+from dataclasses import dataclass, field
 
-    def __eq__(self, other):
-        if not isinstance(other, LldpNeighbor):
-            return False
-        return (
-            self.interface == other.interface
-            and self.system_name == other.system_name
-            and self.neighbor_interface == other.neighbor_interface
-        )
 
-    def __repr__(self):
-        return (
-            f"LldpNeighbor(interface={self.interface}, "
-            f"system_name={self.system_name}, "
-            f"neighbor_interface={self.neighbor_interface}"
-        )
+@dataclass(slots=True, unsafe_hash=True)
+class LldpNeighbor:
+    interface: str
+    system_name: str
+    neighbor_interface: str
+    # the ttl counts down between two reads, it is not part of the neighbor equality
+    ttl: int = field(compare=False)
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, unsafe_hash=True)
 class PingResponse:
     source: str
     time: float
@@ -16,19 +16,14 @@ class PingResponse:
     ttl: int
 
 
-@dataclass
+@dataclass(slots=True, unsafe_hash=True)
 class Status:
     name: str
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PingData:
-    def __init__(self):
-        self.responses = {}
-        self.status = None
-        self.result_message = None
-
-    responses: dict[int, PingResponse]
-    status: Status
-    result_message: str
+    responses: dict[int, PingResponse] = field(default_factory=dict)
+    status: Status = None
+    result_message: str = None
@@ -1,4 +1,6 @@
 class SystemStatus:
+    __slots__ = ("status",)
+
     def __init__(self, status_dict: dict[str, str]):
         self.status = status_dict
 
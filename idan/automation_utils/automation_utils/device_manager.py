@@ -1,4 +1,9 @@
 from automation_utils.device import Device
+from automation_utils.cli.cli_session import CliSession
+from automation_utils.cli.session_pool import SessionPool
+from automation_utils.session_registry import LazySessions, SessionFactoryRegistry
+
+# imported to register the session classes of the vendors
 from automation_utils.cli.cli_ios import CliIos
 from automation_utils.cli.cli_ceos import CliCeos
 from automation_utils.cli.cli_dnos import CliDnos
@@ -14,34 +19,59 @@ class DeviceManager(metaclass=Singleton):
     def __init__(self):
         self.cli_sessions = {}
         self.otg_devices = {}
+        self.session_pool: SessionPool = None
 
-    def init_devices(self, devices: dict[str, Device]) -> None:
-        self.cli_sessions = {}
-        self.otg_devices = {}
+    def init_devices(
+        self,
+        devices: dict[str, Device],
+        open_sessions=False,
+        **pool_kwargs,
+    ) -> None:
+        """
+        Registers the devices. Their CLI sessions (and OTG clients) are created on first access to
+        cli_sessions[device_name] (otg_devices[device_name]) by the SessionFactoryRegistry of their vendor.
+        The CLI sessions are owned by a SessionPool.
+        :param open_sessions: open all the CLI sessions in parallel now, and keep them alive and connected
+                              in the background, instead of connecting each one on its first command
+        :param pool_kwargs: SessionPool arguments - max_workers, keepalive_interval, monitor_interval
+        """
+        if self.session_pool:
+            self.session_pool.stop_monitor()
+        cli_devices = {}
+        otg_devices = {}
         for device_name, device in devices.items():
             if not device.vendor:
                 raise ValueError(
                     f"Device vendor is mandatory for device {device.hostname}"
                 )
-            if device.vendor.lower() == "drivenets":
-                self.cli_sessions[device_name] = CliDnos(
-                    device.hostname, device.username, device.password
-                )
-            elif device.vendor.lower() == "arista":
-                self.cli_sessions[device_name] = CliCeos(
-                    device.hostname, device.username, device.password
-                )
-            elif device.vendor.lower() == "cisco":
-                self.cli_sessions[device_name] = CliIos(
-                    device.hostname, device.username, device.password
+            try:
+                session_class = SessionFactoryRegistry.get_session_class(
+                    device.vendor
                 )
-            elif device.vendor.lower() == "ixia":
-                self.otg_devices[device_name] = OtgApiClient(
-                    name=device_name,
-                    base_url=f"https://{device.hostname}",
-                    port=int(device.port),
-                )
-            else:
+            except ValueError:
                 raise ValueError(
                     f"Unsupported vendor '{device.vendor}' for device {device_name}"
                 )
+            if issubclass(session_class, CliSession):
+                cli_devices[device_name] = device
+            else:
+                otg_devices[device_name] = device
+        # the sessions are created on their first use, devices that are not used never open a connection
+        self.cli_sessions = LazySessions(cli_devices)
+        self.otg_devices = LazySessions(otg_devices)
+        self.session_pool = SessionPool(self.cli_sessions, **pool_kwargs)
+        if open_sessions:
+            self.open_sessions()
+
+    def open_sessions(self) -> dict[str, Exception]:
+        """
+        Opens the CLI sessions in parallel and starts reconnecting dead sessions in the background.
+        :returns: the sessions that failed to open, device name -> exception
+        """
+        failures = self.session_pool.open_all()
+        self.session_pool.start_monitor()
+        return failures
+
+    def close_sessions(self) -> None:
+        if self.session_pool:
+            self.session_pool.close_all()
@@ -1,69 +1,83 @@
 from automation_utils.data_objects.ip_route import IpRoute, NextHop
+from automation_utils.helpers.deciphers.decipher_base import Decipher, LineStreamingDecipher
 from typing import Optional
 
 
-class IpRouteDecipher:
+class IpRouteDecipher(Decipher):
     @staticmethod
     def decipher(route_text: str) -> Optional[IpRoute]:
-        lines = route_text.splitlines()
-        destination = None
-        protocol = None
-        next_hops = []
+        parser = IpRouteStreamingDecipher()
+        for line in route_text.splitlines():
+            parser.feed_line(line)
+        return parser.result()
 
-        is_alternate = False
-        for line in lines:
-            line = line.strip()
+    @classmethod
+    def streaming(cls) -> "IpRouteStreamingDecipher":
+        return IpRouteStreamingDecipher()
+
+
+class IpRouteStreamingDecipher(LineStreamingDecipher):
+    def __init__(self):
+        super().__init__()
+        self.destination = None
+        self.protocol = None
+        self.next_hops = []
+        self.is_alternate = False
+
+    def feed_line(self, line: str) -> None:
+        line = line.strip()
+        
+        # Extract destination
+        if "Routing entry for" in line:
+            self.destination = line.split("Routing entry for")[1].strip()
+        
+        # Extract protocol
+        elif "Known via" in line:
+            self.protocol = line.split('"')[1].strip()
+        
+        # Parse next hops
+        elif any(char.isdigit() for char in line):
+            # Skip lines that don't contain IP addresses
+            if "Last update" in line:
+                return
+            if not any(segment.count('.') == 3 or ':' in segment for segment in line.split()):
+                return
             
-            # Extract destination
-            if "Routing entry for" in line:
-                destination = line.split("Routing entry for")[1].strip()
+            is_active = line.startswith('*')
+            is_recursive = False
+            if '(recursive)' in line:
+                is_recursive = True
+                if 'alternate' not in line:
+                    # reset is_alternate to False for the next hops
+                    self.is_alternate = False
+            if 'alternate' in line:
+                # mark all the next hops as alternate
+                self.is_alternate = True
             
-            # Extract protocol
-            elif "Known via" in line:
-                protocol = line.split('"')[1].strip()
             
-            # Parse next hops
-            elif any(char.isdigit() for char in line):
-                # Skip lines that don't contain IP addresses
-                if "Last update" in line:
-                    continue
-                if not any(segment.count('.') == 3 or ':' in segment for segment in line.split()):
-                    continue
-                
-                is_active = line.startswith('*')
-                is_recursive = False
-                if '(recursive)' in line:
-                    is_recursive = True
-                    if 'alternate' not in line:
-                        # reset is_alternate to False for the next hops
-                        is_alternate = False
-                if 'alternate' in line:
-                    # mark all the next hops as alternate
-                    is_alternate = True
-                
-                
-                # Clean up the line by removing markers
-                clean_line = line.replace('*', '').replace('(recursive)', '').replace('alternate', '').strip()
-                
-                # Extract IP and interface
-                parts = clean_line.split(',', 1)
-                if len(parts) == 1:
-                    next_hop = NextHop(ip_address=parts[0].strip(), is_recursive=is_recursive, is_alternate=is_alternate)
-                    next_hops.append(next_hop)
-                    continue
-                    
-                ip_address = parts[0].strip()
-                interface = parts[1].replace('via', '').strip().split()[0]
+            # Clean up the line by removing markers
+            clean_line = line.replace('*', '').replace('(recursive)', '').replace('alternate', '').strip()
+            
+            # Extract IP and interface
+            parts = clean_line.split(',', 1)
+            if len(parts) == 1:
+                next_hop = NextHop(ip_address=parts[0].strip(), is_recursive=is_recursive, is_alternate=self.is_alternate)
+                self.next_hops.append(next_hop)
+                return
                 
-                next_hop = NextHop(
-                    ip_address=ip_address,
-                    interface=interface,
-                    is_active=is_active,
-                    is_alternate=is_alternate,
-                    is_recursive=is_recursive
-                )
-                next_hops.append(next_hop)
+            ip_address = parts[0].strip()
+            interface = parts[1].replace('via', '').strip().split()[0]
+            
+            next_hop = NextHop(
+                ip_address=ip_address,
+                interface=interface,
+                is_active=is_active,
+                is_alternate=self.is_alternate,
+                is_recursive=is_recursive
+            )
+            self.next_hops.append(next_hop)
 
-        if destination and protocol:
-            return IpRoute(destination=destination, protocol=protocol, next_hops=next_hops)
+    def result(self) -> Optional[IpRoute]:
+        if self.destination and self.protocol:
+            return IpRoute(destination=self.destination, protocol=self.protocol, next_hops=self.next_hops)
         return None
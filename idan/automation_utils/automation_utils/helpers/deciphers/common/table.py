@@ -0,0 +1,284 @@
+"""
+Parsing of the pipe tables of the CLI outputs, e.g.:
+
+| Interface    | Admin   | Operational |
++--------------+---------+-------------+
+| bundle-340   | enabled | up          |
+
+A decipher declares the columns it reads, by their header titles, and gets their values row by row:
+
+    INTERFACES_TABLE = Table(Column("Interface", required=True), Column("Admin"), Column("Operational"))
+    for interface, admin, operational in INTERFACES_TABLE.rows(cli_response):
+        ...
+
+The rows of a table have the same number of "|", so the whole table is split on "|" at once and every column is a
+slice of the cells with the number of "|" of a row as step. Tables with irregular rows (e.g. a "|" in a value), and
+tables streamed line by line while they are received (see TableDecipher), are parsed row by row.
+"""
+
+import re
+import typing
+from operator import itemgetter
+
+from automation_utils.helpers.deciphers.decipher_base import (
+    Decipher,
+    LineStreamingDecipher,
+)
+
+# the end of the rows of a table: a line not starting with "|"
+_TABLE_END_REGEX = re.compile(r"\n(?![ \t]*\|)")
+_ROW_REGEX = re.compile(r"^[ \t]*\|", re.MULTILINE)
+
+
+class Column:
+    __slots__ = ("title", "convert", "required")
+
+    def __init__(
+        self,
+        title: str,
+        convert: typing.Callable[[str], typing.Any] = None,
+        required=False,
+    ):
+        """
+        param: title: the title of the column in the table header
+        param: convert: converts the (stripped) value, e.g. int, the value is kept as a string by default
+        param: required: rows with an empty value in the column are skipped
+        """
+        self.title = title
+        self.convert = convert
+        self.required = required
+
+
+class Table:
+    def __init__(self, *columns: Column, first_title: str = None, skip_invalid_rows=False):
+        """
+        param: columns: the columns to read, the rows have their values in this order
+        param: first_title: the title of the first column of the table header, for outputs with other lines
+               starting with "|" before the table. By default the table starts at the first such line
+        param: skip_invalid_rows: whether the rows whose values fail to convert (ValueError) are skipped,
+               the error is raised otherwise
+        """
+        self.columns = columns
+        self.first_title = first_title
+        self.skip_invalid_rows = skip_invalid_rows
+        self._required = [i for i, column in enumerate(columns) if column.required]
+        self._converters = [
+            (i, column.convert) for i, column in enumerate(columns) if column.convert
+        ]
+
+    def rows(self, cli_response: str) -> list[tuple]:
+        """
+        :returns: the values of the columns of every row of the table
+        :raises ValueError: when the header misses a column
+        """
+        header = self._header(cli_response)
+        if header is None:
+            return []
+        titles, body_start = header
+        indices = self._indices(titles)
+
+        rows = self._split_table(cli_response, body_start, len(titles) - 1, indices)
+        if rows is None:
+            parser = _RowParser(self, titles)
+            return [
+                row
+                for row in map(parser.parse, cli_response[body_start:].splitlines())
+                if row is not None
+            ]
+        required = self._required
+        # rows are filtered only when a required column has an empty value
+        if required and not all(all(map(itemgetter(i), rows)) for i in required):
+            rows = [row for row in rows if all(row[i] for i in required)]
+        if self._converters:
+            rows = self._convert(rows)
+        return rows
+
+    def _header(self, cli_response: str) -> tuple[list[str], int] | None:
+        """
+        :returns: the titles of the header, with the text before its first "|" and after its last one,
+        and the position of the line below it, or None when there is no table
+        """
+        for match in _ROW_REGEX.finditer(cli_response):
+            line_end = cli_response.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(cli_response)
+            titles = self._titles(cli_response[match.start():line_end])
+            if titles is not None:
+                return titles, line_end + 1
+        return None
+
+    def _titles(self, line: str) -> list[str] | None:
+        """:returns: the titles of the header line, or None when the line is not the header of the table"""
+        titles = [title.strip() for title in line.split("|")]
+        if self.first_title is None or titles[1] == self.first_title:
+            return titles
+        return None
+
+    def _indices(self, titles: list[str]) -> list[int]:
+        """
+        :returns: the indices of the columns in the header titles
+        :raises ValueError: when the header misses a column
+        """
+        try:
+            return [titles.index(column.title) for column in self.columns]
+        except ValueError:
+            missing = [c.title for c in self.columns if c.title not in titles]
+            raise ValueError(f"table header {titles[1:-1]} misses the columns {missing}")
+
+    @staticmethod
+    def _split_table(text: str, start: int, pipes: int, indices: list[int]) -> list[tuple] | None:
+        """
+        :returns: the values of the rows, by slices of the whole table split on "|",
+        or None when the rows do not all have the number of "|" of the header
+        """
+        # the rows start below the separator line, "+----+" or "|----|"
+        row = _ROW_REGEX.search(text, start)
+        if row is None:
+            return []
+        start = row.start()
+        if text.startswith("-", row.end()):
+            row = _ROW_REGEX.search(text, row.end())
+            if row is None:
+                return []
+            start = row.start()
+        end = _TABLE_END_REGEX.search(text, start)
+        end = len(text) if end is None else end.start()
+        if _ROW_REGEX.search(text, end):
+            # rows after an empty line or a text
+            return None
+
+        cells = text[start:end].split("|")
+        # the cells between the rows, before the first one and after the last one are the line breaks
+        line_breaks = set(cells[pipes:-1:pipes])
+        if (
+            (len(cells) - 1) % pipes
+            or cells[0].strip()
+            or cells[-1].strip()
+            or any(line_break.count("\n") != 1 or line_break.strip() for line_break in line_breaks)
+        ):
+            return None
+        strip = str.strip
+        return list(zip(*(map(strip, cells[index::pipes]) for index in indices)))
+
+    def _convert(self, rows: list[tuple]) -> list[tuple]:
+        """converts the values column by column, and row by row to skip the rows failing to convert"""
+        if not rows:
+            return rows
+        columns = list(zip(*rows))
+        try:
+            for i, convert in self._converters:
+                columns[i] = list(map(convert, columns[i]))
+            return list(zip(*columns))
+        except ValueError:
+            if not self.skip_invalid_rows:
+                raise
+        return [row for row in map(self._convert_row, rows) if row is not None]
+
+    def _convert_row(self, row: tuple) -> tuple | None:
+        """:returns: the converted row, or None when it fails to convert and the invalid rows are skipped"""
+        row = list(row)
+        try:
+            for i, convert in self._converters:
+                row[i] = convert(row[i])
+        except ValueError:
+            if self.skip_invalid_rows:
+                return None
+            raise
+        return tuple(row)
+
+
+class _RowParser:
+    """Parses the lines of a table one by one, splitting every row up to its last read column"""
+
+    def __init__(self, table: Table, titles: list[str] = None):
+        """param: titles: the titles of the header, when it was already found"""
+        self.table = table
+        self._select = None
+        self._width = None
+        if titles is not None:
+            self._set_header(titles)
+
+    def _set_header(self, titles: list[str]) -> None:
+        indices = self.table._indices(titles)
+        self._width = max(indices) + 1
+        self._select = (
+            itemgetter(*indices)
+            if len(indices) > 1
+            else lambda fields: (fields[indices[0]],)
+        )
+
+    def parse(self, line: str) -> tuple | None:
+        """:returns: the values of the row, or None when the line is not a row of the table"""
+        line = line.lstrip()
+        # not a row, or the separator line below the header
+        if line[:1] != "|" or line[1:2] == "-":
+            return None
+        if self._select is None:
+            titles = self.table._titles(line)
+            if titles is not None:
+                self._set_header(titles)
+            return None
+        fields = line.split("|", self._width)
+        if len(fields) <= self._width:
+            return None
+        row = tuple(map(str.strip, self._select(fields)))
+        table = self.table
+        if table._required and not all(row[i] for i in table._required):
+            return None
+        if table._converters:
+            return table._convert_row(row)
+        return row
+
+
+class TableDecipher(Decipher):
+    """
+    A decipher of a table into a dict, declared by the TABLE it reads and the item of every row, e.g.:
+
+        class InterfacesStatusDecipher(TableDecipher):
+            TABLE = Table(Column("Interface"), Column("Admin"), Column("Operational"))
+
+            @staticmethod
+            def item(row):
+                return row[0], InterfaceStatus(*row)
+
+    The table is streamed row by row when the output is read while it is received, see Decipher.streaming.
+    """
+
+    TABLE: Table
+
+    @staticmethod
+    def item(row: tuple) -> tuple:
+        """:returns: the (key, value) of the row in the deciphered dict"""
+        return row
+
+    @staticmethod
+    def from_items(items: dict) -> object:
+        """:returns: the deciphered object of the items of the rows"""
+        return items
+
+    @classmethod
+    def decipher(cls, cli_response: str) -> object:
+        return cls.from_items(dict(map(cls.item, cls.TABLE.rows(cli_response))))
+
+    @classmethod
+    def streaming(cls) -> "TableStreamingDecipher":
+        return TableStreamingDecipher(cls)
+
+
+class TableStreamingDecipher(LineStreamingDecipher):
+    """Deciphers the rows of the table of a TableDecipher as they are received"""
+
+    def __init__(self, decipher: type[TableDecipher]):
+        super().__init__()
+        self.decipher = decipher
+        self._parser = _RowParser(decipher.TABLE)
+        self._items = {}
+
+    def feed_line(self, line: str) -> None:
+        row = self._parser.parse(line)
+        if row is not None:
+            key, value = self.decipher.item(row)
+            self._items[key] = value
+
+    def result(self) -> object:
+        return self.decipher.from_items(self._items)
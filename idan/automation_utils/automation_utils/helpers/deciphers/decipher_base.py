@@ -27,3 +27,58 @@ class Decipher(ABC):
     @abstractmethod
     def decipher(cli_response: str) -> object:
         pass
+
+    @classmethod
+    def streaming(cls) -> "StreamingDecipher | None":
+        """
+        :returns: a new StreamingDecipher, deciphering the output while it is received, or None when the whole
+        output is needed. Overridden by the deciphers which parse their output line by line.
+        """
+        return None
+
+
+class StreamingDecipher(ABC):
+    """
+    Deciphers an output fed in chunks, while it is received, so the whole output is never held in memory:
+
+        stream = InterfaceCountersDecipher.streaming()
+        for chunk in chunks:
+            stream.feed(chunk)
+        counters = stream.finish()
+    """
+
+    @abstractmethod
+    def feed(self, chunk: str) -> None:
+        pass
+
+    @abstractmethod
+    def finish(self) -> object:
+        """:returns: the deciphered object, the same as Decipher.decipher of the whole output"""
+        pass
+
+
+class LineStreamingDecipher(StreamingDecipher):
+    """A StreamingDecipher handing the lines of the output to feed_line, only the line being received is kept"""
+
+    def __init__(self):
+        self._partial_line = ""
+
+    def feed(self, chunk: str) -> None:
+        lines = (self._partial_line + chunk).split("\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            self.feed_line(line)
+
+    def finish(self) -> object:
+        if self._partial_line:
+            self.feed_line(self._partial_line)
+            self._partial_line = ""
+        return self.result()
+
+    @abstractmethod
+    def feed_line(self, line: str) -> None:
+        pass
+
+    @abstractmethod
+    def result(self) -> object:
+        pass
@@ -1,6 +1,5 @@
-import re
-
 from automation_utils.data_objects.bgp_summary import BgpSummary, BgpNeighbor
+from automation_utils.helpers.deciphers import patterns
 from automation_utils.helpers.deciphers.decipher_base import Decipher
 
 
@@ -24,9 +23,7 @@ class BgpSummaryIpv4Decipher(Decipher):
         # Extract AS number and router ID from the second line
         for line in lines:
             if "BGP router identifier" in line:
-                match = re.search(
-                    r"BGP router identifier (\S+), local AS number (\d+)", line
-                )
+                match = patterns.BGP_ROUTER_IDENTIFIER.search(line)
                 if match:
                     bgp_router_identifier = match.group(1)
                     as_number = int(match.group(2))
@@ -34,7 +31,7 @@ class BgpSummaryIpv4Decipher(Decipher):
 
         # Process each line for neighbor details
         for line in lines:
-            if re.match(r"^\d+\.\d+\.\d+\.\d+", line):
+            if patterns.BGP_NEIGHBOR_LINE.match(line):
                 fields = line.split()
                 neighbor = fields[0]
                 up_down_time = fields[8]
@@ -51,6 +48,6 @@ class BgpSummaryIpv4Decipher(Decipher):
 
     @staticmethod
     def get_state_pfx_accepted(field: str) -> int | str:
-        if re.match(r'^([\s\d]+)$', field):
+        if patterns.BGP_PFX_ACCEPTED.fullmatch(field):
             return int(field)
         return field
\ No newline at end of file
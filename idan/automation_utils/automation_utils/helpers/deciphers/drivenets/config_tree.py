@@ -0,0 +1,33 @@
+from automation_utils.data_objects.config_tree import ConfigNode
+from automation_utils.helpers.deciphers.decipher_base import Decipher
+
+CLOSING_LINE = "!"
+COMMENT_PREFIX = "#"
+
+
+class ConfigTreeDecipher(Decipher):
+    @staticmethod
+    def decipher(cli_response: str) -> ConfigNode:
+        """
+        Parse a DNOS configuration ("show config" or any of its sub-trees) into a tree of its lines.
+        The nesting of the lines is taken from their indentation, "!" closing lines and "#" comments are skipped.
+
+        Args:
+            cli_response (str): CLI response containing the configuration
+
+        Returns:
+            ConfigNode: The root of the configuration, its children are the top level lines
+        """
+        root = ConfigNode()
+        # (indentation, node) of the current line and its ancestors
+        stack = [(-1, root)]
+        for line in cli_response.splitlines():
+            text = line.strip()
+            if not text or text == CLOSING_LINE or text.startswith(COMMENT_PREFIX):
+                continue
+            indentation = len(line) - len(line.lstrip())
+            while stack[-1][0] >= indentation:
+                stack.pop()
+            node = stack[-1][1].add_child(text)
+            stack.append((indentation, node))
+        return root
@@ -1,9 +1,8 @@
-import re
-
 from automation_utils.data_objects.isis_neighbors import (
     IsisNeighbor,
     IsisNeighbors,
 )
+from automation_utils.helpers.deciphers import patterns
 from automation_utils.helpers.deciphers.decipher_base import Decipher
 
 
@@ -30,7 +29,7 @@ class IsisNeighborsDecipher(Decipher):
         ]
 
         # Extract instance ID from first line
-        instance_match = re.match(r"Instance (\d+):", lines[0])
+        instance_match = patterns.ISIS_INSTANCE.match(lines[0])
         if not instance_match:
             raise ValueError("Could not find ISIS instance ID in the output")
         instance_id = int(instance_match.group(1))
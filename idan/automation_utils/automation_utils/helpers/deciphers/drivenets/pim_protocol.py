@@ -1,4 +1,5 @@
 from automation_utils.helpers.deciphers.decipher_base import Decipher
+from automation_utils.helpers.deciphers.common.table import Column, Table, TableDecipher
 from automation_utils.data_objects.pim_data import PimData
 
 class PimConfigDecipher(Decipher):
@@ -25,38 +26,16 @@ class PimConfigDecipher(Decipher):
                 
         return interfaces
 
-class PimNeighborsDecipher(Decipher):
+class PimNeighborsDecipher(TableDecipher):
+    """
+    Decipher PIM operational data and extract neighbor information.
+    The result is a dictionary of PimData objects containing neighbor information,
+    the key is the interface name.
+    """
+
+    TABLE = Table(Column("Neighbor Address"), Column("Interface"), Column("Uptime"))
+
     @staticmethod
-    def decipher(cli_response: str) -> dict[str, PimData]:
-        """
-        Decipher PIM operational data and extract neighbor information.
-        
-        Args:
-            cli_response: CLI output containing PIM neighbor table
-            
-        Returns:
-            Dictionary of PimData objects containing neighbor information.
-            The key is the interface name.
-        """
-        pim_neighbors = {}
-        lines = cli_response.splitlines()
-        
-        # Skip header and footer lines
-        data_lines = [line.strip() for line in lines if line.startswith('|') and line.strip()]
-        
-        for line in data_lines[1:]:
-            if not line:
-                continue
-                
-            # Split on | and strip whitespace
-            fields = [f.strip() for f in line.split('|')[1:-1]]
-            
-            if len(fields) == 4:
-                neighbor_addr, interface, uptime, expires = fields
-                pim_neighbors[interface] = PimData(
-                    neighbor=neighbor_addr,
-                    interface=interface, 
-                    uptime=uptime
-                )
-                
-        return pim_neighbors
\ No newline at end of file
+    def item(row: tuple) -> tuple[str, PimData]:
+        neighbor_addr, interface, uptime = row
+        return interface, PimData(neighbor_addr, interface, uptime)
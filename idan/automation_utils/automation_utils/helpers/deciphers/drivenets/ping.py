@@ -1,10 +1,9 @@
-import re
-
 from automation_utils.data_objects.ping_data import (
     Status,
     PingData,
     PingResponse,
 )
+from automation_utils.helpers.deciphers import patterns
 from automation_utils.helpers.deciphers.decipher_base import Decipher
 
 """PING 1.1.1.1 (1.1.1.1) from 1.1.1.1 : 56(84) bytes of data.
@@ -127,20 +126,11 @@ class DnosPingDecipher(Decipher):
     @staticmethod
     def parse_raw_response(buffer):
         # header line of PING (line 1 , must)- if it exists, we assume the ping operation was executed (regardless of result)
-        header = re.compile(
-            r"(/s+)?PING (?P<NAME>\S+)(\s+)?\((?P<IPD>\S+)\) (from (?P<IPS>\S+) (.*)?:)?"
-        )
-
-        # compile a regular expression from ping line : "64 bytes from 2.2.2.2: icmp_seq=1 ttl=64 time=0.139 ms"
-        #                                                bytes         source   sequence   ttl    time"
-        pattern = re.compile(
-            "(?P<bytes>.*) bytes from (?P<source>.*): icmp_seq=(?P<sequence>.*) ttl=(?P<ttl>.*) time=(?P<time>.*) ms"
-        )
-
-        # this patters inrequired in case size < 16 , as the time field is NOT appearing in this case.
-        pattern1 = re.compile(
-            "(?P<bytes>.*) bytes from (?P<source>.*): icmp_seq=(?P<sequence>.*) ttl=(?P<ttl>.*)"
-        )
+        header = patterns.PING_HEADER
+        # ping line : "64 bytes from 2.2.2.2: icmp_seq=1 ttl=64 time=0.139 ms"
+        #              bytes         source   sequence   ttl    time
+        # the time field is NOT appearing in case size < 16
+        pattern = patterns.PING_REPLY
         index = 0
         check_header = True
         dest_ip = None
@@ -156,10 +146,9 @@ class DnosPingDecipher(Decipher):
                 continue
 
             parsed_line = pattern.match(line)
-            if not parsed_line:
-                parsed_line = pattern1.match(line)
             if parsed_line:
-                parsed_dict = parsed_line.groupdict()
+                # a missing time is 0
+                parsed_dict = parsed_line.groupdict(0)
 
                 ping_list_responses[index] = (
                     DnosPingDecipher._arrange_response_line(parsed_dict)
@@ -173,17 +162,13 @@ class DnosPingDecipher(Decipher):
 
     @staticmethod
     def parse_summary_line(buffer, source):
-        # compile a regular expression from ping line : "5 packets transmitted, 5 received"
-        #                                                sent                   received
-        pattern = re.compile(
-            "(?P<sent>.*) packets transmitted, (?P<received>.*) received.*"
-        )
-        # compile a regular expression from ping line : "rtt min / avg / max / mdev = 5.041 / 5.101 / 5.171 / 0.043 ms"
-        #                                                  min_time avg_time max_time std_dev
+        # ping line : "5 packets transmitted, 5 received"
+        #              sent                   received
+        pattern = patterns.PING_TRANSMITTED
+        # ping line : "rtt min / avg / max / mdev = 5.041 / 5.101 / 5.171 / 0.043 ms"
+        #                min_time avg_time max_time std_dev
         # NOTE! , this line maybe missing if size < 16
-        pattern1 = re.compile(
-            "rtt min/avg/max/mdev = (?P<min_time>.*)/(?P<avg_time>.*)/(?P<max_time>.*)/(?P<std_dev>.*) ms"
-        )
+        pattern1 = patterns.PING_RTT
 
         ping_parsed_dict = {"source": source}
         for line in buffer.splitlines():
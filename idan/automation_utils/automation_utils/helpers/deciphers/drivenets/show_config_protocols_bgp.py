@@ -1,5 +1,5 @@
-import re
 from automation_utils.data_objects.config_protocols_bgp import ConfigProtocolsBgp
+from automation_utils.helpers.deciphers import patterns
 from automation_utils.helpers.deciphers.decipher_base import Decipher
 
 
@@ -15,16 +15,7 @@ class ShowConfigProtocolsBgpDecipher(Decipher):
         Returns:
             ConfigProtocolsBgp: Object containing parsed BGP configuration data
         """
-        neighbors_ip_addresses = []
-        
-        # Regular expression to match neighbor IP addresses
-        # Excludes neighbor-group entries
-        neighbor_pattern = r'neighbor\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-        
         # Find all neighbor IP addresses
-        matches = re.finditer(neighbor_pattern, cli_response)
-        for match in matches:
-            neighbor_ip = match.group(1)
-            neighbors_ip_addresses.append(neighbor_ip)
+        neighbors_ip_addresses = patterns.BGP_CONFIG_NEIGHBOR.findall(cli_response)
 
         return ConfigProtocolsBgp(neighbors_ip_addresses=neighbors_ip_addresses)
@@ -0,0 +1,37 @@
+"""
+The regex patterns of the deciphers, compiled once at import instead of on every call (or line).
+The patterns are anchored where they are matched at the start of a line, and their fields match the field chars
+only, e.g. [^/]+ instead of .* followed by the separator, so they don't backtrack over the rest of the line.
+"""
+
+import re
+
+# drivenets bgp summary
+BGP_ROUTER_IDENTIFIER = re.compile(r"BGP router identifier (\S+), local AS number (\d+)")
+BGP_NEIGHBOR_LINE = re.compile(r"\d+\.\d+\.\d+\.\d+")
+# the State/PfxAccepted field, a number of prefixes when the session is established, its state otherwise
+BGP_PFX_ACCEPTED = re.compile(r"[\s\d]+")
+
+# drivenets show config protocols bgp, the neighbor-group entries are excluded
+BGP_CONFIG_NEIGHBOR = re.compile(r"neighbor\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})")
+
+# drivenets isis neighbors
+ISIS_INSTANCE = re.compile(r"Instance (\d+):")
+
+# drivenets ping
+# "PING 1.1.1.1 (1.1.1.1) from 1.1.1.1 : 56(84) bytes of data."
+PING_HEADER = re.compile(
+    r"[ \t]*PING (?P<NAME>\S+)\s*\((?P<IPD>[^)\s]+)\) ?(?:from (?P<IPS>\S+) [^:]*:)?"
+)
+# "64 bytes from 2.2.2.2: icmp_seq=1 ttl=64 time=0.139 ms", the time is missing when the size is < 16.
+# the reply and transmitted lines may be indented
+PING_REPLY = re.compile(
+    r"\s*(?P<bytes>[^ ]+) bytes from (?P<source>.+?): icmp_seq=(?P<sequence>[^ ]+) ttl=(?P<ttl>[^ ]+)"
+    r"(?: time=(?P<time>[^ ]+) ms)?"
+)
+# "5 packets transmitted, 5 received, 0% packet loss, time 4077ms"
+PING_TRANSMITTED = re.compile(r"\s*(?P<sent>\d+) packets transmitted, (?P<received>\d+) received")
+# "rtt min/avg/max/mdev = 5.041/5.101/5.171/0.043 ms", missing when the size is < 16
+PING_RTT = re.compile(
+    r"rtt min/avg/max/mdev = (?P<min_time>[^/]+)/(?P<avg_time>[^/]+)/(?P<max_time>[^/]+)/(?P<std_dev>[^ ]+) ms"
+)
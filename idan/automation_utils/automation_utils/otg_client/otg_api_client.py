@@ -4,12 +4,22 @@ from pathlib import Path
 import yaml
 import requests
 from automation_utils.otg_client.otg_request_sender import OtgRequestSender
+from automation_utils.common.vendors import Vendors
+from automation_utils.session_registry import SessionFactoryRegistry
 
 import orbital.common as common
 
 logger = common.get_logger(__file__)
 
 
+@SessionFactoryRegistry.register_session_factory(
+    Vendors.IXIA,
+    factory=lambda device_name, device: OtgApiClient(
+        name=device_name,
+        base_url=f"https://{device.hostname}",
+        port=int(device.port),
+    ),
+)
 class OtgApiClient:
     config_api_path: str = "/config"
     control_state_api_path: str = "/control/state"
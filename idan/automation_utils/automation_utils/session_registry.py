@@ -0,0 +1,89 @@
+import threading
+from collections.abc import Mapping
+
+from automation_utils.common.vendors import Vendors
+from automation_utils.device import Device
+
+
+# IMPORTANT: the session classes register themselves when imported, device_manager.py imports all of them
+
+
+class SessionFactoryRegistry():
+    """
+    Device session factory.
+    Registers the session classes (CLI sessions, API clients) by vendor, and creates the sessions of the devices.
+    """
+    # vendor -> (session class, factory(device_name, device))
+    _factories = {}
+
+    @staticmethod
+    def register_session_factory(vendor: Vendors, factory=None):
+        """
+        :param factory: callable creating the session from the device name and Device,
+                        by default cls(device.hostname, device.username, device.password)
+        """
+        def decorator(cls):
+            SessionFactoryRegistry._factories[vendor.value] = (
+                cls,
+                factory or (lambda device_name, device: cls(device.hostname, device.username, device.password)),
+            )
+            return cls
+        return decorator
+
+    @staticmethod
+    def get_session_class(vendor: str) -> type:
+        return SessionFactoryRegistry._get(vendor)[0]
+
+    @staticmethod
+    def create_session(device_name: str, device: Device):
+        return SessionFactoryRegistry._get(device.vendor)[1](device_name, device)
+
+    @staticmethod
+    def _get(vendor: str):
+        entry = SessionFactoryRegistry._factories.get(vendor.lower())
+        if entry is None:
+            raise ValueError(f"Unsupported vendor '{vendor}'")
+        return entry
+
+
+class LazySessions(Mapping):
+    """
+    Sessions of the devices by device name, each session is created on its first access.
+    Checking membership and iterating the device names don't create sessions.
+    """
+
+    def __init__(self, devices: dict[str, Device], on_create=None):
+        """
+        :param on_create: called with the device name and the session after a session is created
+        """
+        self._devices = devices
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.on_create = on_create
+
+    def __getitem__(self, device_name):
+        session = self._sessions.get(device_name)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(device_name)
+                if session is None:
+                    session = SessionFactoryRegistry.create_session(
+                        device_name, self._devices[device_name]
+                    )
+                    self._sessions[device_name] = session
+                    if self.on_create:
+                        self.on_create(device_name, session)
+        return session
+
+    def __contains__(self, device_name):
+        return device_name in self._devices
+
+    def __iter__(self):
+        return iter(self._devices)
+
+    def __len__(self):
+        return len(self._devices)
+
+    def created(self) -> dict:
+        """:returns: the sessions created so far, by device name"""
+        return dict(self._sessions)
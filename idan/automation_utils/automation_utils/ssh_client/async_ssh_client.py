@@ -0,0 +1,100 @@
+"""
+Async SSH Client
+~~~~~~~~~~~~~~~~
+
+Description:
+    |An asyncio adapter over SSHClient. The blocking paramiko operations run in a shared thread pool,
+    |so a single event loop can drive many device sessions concurrently:
+    |
+    |    outputs = await asyncio.gather(
+    |        *(AsyncSSHClient(ssh).execute_shell_command("show system") for ssh in clients)
+    |    )
+    |
+    |Operations on the same session are serialized by the session lock (SSHClient.lock), which the sync
+    |SSHClient commands hold too, so they never interleave on the shell, while operations on different
+    |sessions run in parallel. An operation run with AsyncSSHClient.run holds the lock for all its commands.
+
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orbital.common as common
+
+from . import consts
+from .ssh_client import SSHClient
+
+logger = common.get_logger(__file__)
+
+
+class AsyncSSHClient(object):
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, ssh_client: SSHClient):
+        self.ssh = ssh_client
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=consts.ASYNC_MAX_WORKERS,
+                    thread_name_prefix="async-ssh",
+                )
+            return cls._executor
+
+    @classmethod
+    def set_max_workers(cls, max_workers: int) -> None:
+        """
+        Replace the shared thread pool, it limits the number of blocking ssh operations running concurrently.
+        Operations that are already running are completed by the previous pool.
+        """
+        logger.debug(f"Setting async ssh thread pool size to {max_workers}")
+        with cls._executor_lock:
+            previous_executor = cls._executor
+            cls._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="async-ssh"
+            )
+        if previous_executor:
+            previous_executor.shutdown(wait=False)
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a blocking function that uses this session in the thread pool, holding the session lock,
+        so the commands of the function are not interleaved with the commands of other threads
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.get_executor(),
+            functools.partial(self._run_locked, func, *args, **kwargs),
+        )
+
+    def _run_locked(self, func, *args, **kwargs):
+        with self.ssh.lock:
+            return func(*args, **kwargs)
+
+    async def connect_wait_for_prompt(self, prompt_retries):
+        return await self.run(self.ssh.connect_wait_for_prompt, prompt_retries)
+
+    async def execute_shell_command(self, command, **kwargs):
+        """
+        see SSHClient.execute_shell_command
+        :raises: ExecutionTimeout, SessionClosed
+        """
+        return await self.run(self.ssh.execute_shell_command, command, **kwargs)
+
+    async def execute_command(self, command, **kwargs):
+        """
+        see SSHClient.execute_command
+        :raises: ExecutionTimeout, ExecutionFailed
+        """
+        return await self.run(self.ssh.execute_command, command, **kwargs)
+
+    async def close(self, close_transport=True):
+        return await self.run(self.ssh.close, close_transport)
+
+    def __repr__(self):
+        return "Async SSH Client"
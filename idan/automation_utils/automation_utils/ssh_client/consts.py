@@ -28,10 +28,38 @@ remove_regex = r"\r([ ]+)?"
 ANSI_ESCAPE = re.compile(ansi_regex, flags=re.IGNORECASE)
 REMOVE_CHARS = re.compile(remove_regex, flags=re.IGNORECASE)
 
+# same as above, for cleaning the raw output before it is decoded
+ANSI_ESCAPE_BYTES = re.compile(ansi_regex.encode(), flags=re.IGNORECASE)
+REMOVE_CHARS_BYTES = re.compile(remove_regex.encode(), flags=re.IGNORECASE)
+
 DEFAULT_DEVICE_PROMPT_REGEX = r"(.*)[$#>] ?$"
 
 MAX_BUFFER = 65535
 
+# quiet period (seconds) to wait for more data before trying to match the expected output
+OUTPUT_SETTLE_INTERVAL = 0.0025
+
+# number of output bytes checked for the prompt, instead of scanning the whole output
+PROMPT_TAIL_SIZE = 4096
+
+# the raw output is cleaned and decoded in blocks of (about) this many bytes, to bound the intermediate copies
+DECODE_BLOCK_SIZE = 1024 * 1024
+
+# number of chars kept from the start of a streamed output, for logging and validating it
+STREAMED_OUTPUT_HEAD_SIZE = 4096
+
+# upper bound (seconds) of a single blocking wait on a channel, so timeouts and closed channels are noticed
+CHANNEL_WAIT_INTERVAL = 0.5
+
+# number of threads running blocking ssh operations for AsyncSSHClient, shared by all the sessions
+ASYNC_MAX_WORKERS = 256
+
+# maximum number of commands written ahead of the device prompt in a single batch, bounded by the device input buffer
+PIPELINE_BATCH_SIZE = 16
+
+# maximum number of exec channels open at the same time on one transport, sshd allows 10 sessions by default
+EXEC_MAX_CHANNELS = 8
+
 NO_OUTPUT_EXCEPTION_MSG = "Expected output from command, received none."
 
 
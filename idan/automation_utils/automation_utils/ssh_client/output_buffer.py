@@ -0,0 +1,168 @@
+import typing
+
+from . import consts
+
+
+def strip_ansi_escape_codes(string_buffer):
+    """
+    Remove any ANSI (VT100) ESC codes from the output
+    http://en.wikipedia.org/wiki/ANSI_escape_code
+    """
+    output = consts.ANSI_ESCAPE.sub("", string_buffer)
+    output = consts.REMOVE_CHARS.sub("", output)
+
+    return output
+
+
+def strip_raw_ansi_escape_codes(raw_buffer) -> bytes:
+    """
+    Same as strip_ansi_escape_codes, for a bytes-like buffer.
+    Escape codes are ascii, so they can be removed before decoding without touching multi-byte chars.
+    """
+    output = consts.ANSI_ESCAPE_BYTES.sub(b"", raw_buffer)
+    output = consts.REMOVE_CHARS_BYTES.sub(b"", output)
+
+    return output
+
+
+class OutputBuffer:
+    """
+    Accumulates the raw bytes read from a shell channel.
+    The output is cleaned and decoded only when it's requested with getvalue(), so multi-byte chars
+    split between reads are not lost and the output is not copied on every read.
+    The prompt is detected by cleaning only the last bytes of the output, instead of the whole output.
+    """
+
+    def __init__(self, tail_size=consts.PROMPT_TAIL_SIZE, encoding="utf-8"):
+        self.tail_size = tail_size
+        self.encoding = encoding
+        self._raw = bytearray()
+        self._value = None
+        self._value_size = None
+
+    def __len__(self):
+        """:return: the number of bytes received"""
+        return len(self._raw)
+
+    def feed(self, data: bytes) -> None:
+        self._raw += data
+
+    @property
+    def last_line(self) -> str:
+        # a char cut by the beginning of the tail is ignored, it can't be part of the last line
+        with memoryview(self._raw) as raw:
+            tail = strip_raw_ansi_escape_codes(raw[-self.tail_size :])
+        lines = tail.decode(self.encoding, "ignore").splitlines()
+        return lines[-1] if lines else ""
+
+    def getvalue(self) -> str:
+        if self._value_size != len(self._raw):
+            self._value = "".join(self._decode_blocks())
+            self._value_size = len(self._raw)
+        return self._value
+
+    def _decode_blocks(self):
+        """
+        Cleans and decodes the raw output in blocks which end with a new line.
+        Escape codes and multi-byte chars never contain a new line, so none of them is cut between blocks.
+        """
+        with memoryview(self._raw) as raw:
+            start = 0
+            while start < len(raw):
+                end = self._raw.find(b"\n", start + consts.DECODE_BLOCK_SIZE) + 1
+                if not end:
+                    end = len(raw)
+                yield strip_raw_ansi_escape_codes(raw[start:end]).decode(
+                    self.encoding, "ignore"
+                )
+                start = end
+
+
+class StreamingOutputBuffer(OutputBuffer):
+    """
+    An OutputBuffer handing the complete lines of the output after the command echo to a consumer while they
+    are received, and dropping them, so only the line being received is kept instead of the whole output.
+    The first head_size chars of the output are kept, for logging it.
+    The whole output is checked for the failure messages while it is streamed, the lines of the first failure
+    found are kept in `failure`.
+    An exception raised by the consumer is kept in `consumer_error`, and the consumer is not fed anymore, so the
+    output is still read until the prompt before the exception is raised.
+    """
+
+    def __init__(
+        self,
+        consumer: typing.Callable[[str], None],
+        echo="",
+        head_size=consts.STREAMED_OUTPUT_HEAD_SIZE,
+        failures=(),
+        **kwargs,
+    ):
+        """
+        param: consumer: called with chunks of complete lines of the cleaned and decoded output
+        param: echo: the command echo, the output starts on the line after it, or at once when empty
+        param: failures: messages which indicate an error in the output
+        """
+        super().__init__(**kwargs)
+        self.consumer = consumer
+        self.echo = echo
+        self.head_size = head_size
+        self.head = ""
+        self.started = not echo
+        self.failures = tuple(failure for failure in failures if failure)
+        self.failure = None
+        self.consumer_error = None
+        # the end of the streamed output, so a failure message split between chunks is found
+        self._tail = ""
+        self._tail_size = max(map(len, self.failures), default=1) - 1
+        self._received = 0
+
+    def __len__(self):
+        return self._received
+
+    def feed(self, data: bytes) -> None:
+        self._raw += data
+        self._received += len(data)
+        end = self._raw.rfind(b"\n") + 1
+        if not end:
+            return
+        # escape codes and multi-byte chars never contain a new line, the complete lines are cleaned on their own
+        with memoryview(self._raw) as raw:
+            text = strip_raw_ansi_escape_codes(raw[:end]).decode(self.encoding, "ignore")
+        del self._raw[:end]
+        if not self.started:
+            echo_start = text.find(self.echo)
+            if echo_start == -1:
+                return
+            self.started = True
+            text = text[echo_start + len(self.echo) :]
+            if text.startswith("\n"):
+                text = text[1:]
+        if len(self.head) < self.head_size:
+            self.head += text[: self.head_size - len(self.head)]
+        if self.failures and self.failure is None:
+            self._find_failure(text)
+        if text and self.consumer_error is None:
+            try:
+                self.consumer(text)
+            except Exception as e:
+                self.consumer_error = e
+
+    def _find_failure(self, text: str) -> None:
+        window = self._tail + text
+        for failure in self.failures:
+            index = window.find(failure)
+            if index != -1:
+                start = window.rfind("\n", 0, index) + 1
+                end = window.find("\n", index + len(failure))
+                self.failure = window[start : end if end != -1 else len(window)]
+                return
+        self._tail = window[-self._tail_size :] if self._tail_size else ""
+
+    @property
+    def last_line(self) -> str:
+        # the prompt can only follow the command echo
+        return super().last_line if self.started else ""
+
+    def getvalue(self) -> str:
+        """:returns: the line being received"""
+        return strip_raw_ansi_escape_codes(self._raw).decode(self.encoding, "ignore")
@@ -8,8 +8,11 @@ Description:
 
 """
 
+import functools
 import re
+import select
 import socket
+import threading
 from time import sleep, monotonic
 from datetime import datetime, timedelta
 
@@ -23,6 +26,11 @@ from automation_utils.common.general.validations import return_as_list
 import orbital.common as common
 
 from . import consts
+from .output_buffer import (
+    OutputBuffer,
+    StreamingOutputBuffer,
+    strip_ansi_escape_codes,
+)
 
 logger = common.get_logger(__file__)
 
@@ -37,8 +45,21 @@ paramiko.Transport._preferred_ciphers = (
 )
 
 
+def _locked(method):
+    """Runs the method holding the session lock, see SSHClient.lock"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class SSHClient(object):
     PROMPT_REGEX = r".*?{cmd}\n?(.*)(\s.*[$#>] ?)$"
+    # the line being received by a StreamingOutputBuffer, its previous lines were already streamed
+    STREAMED_PROMPT_REGEX = r"()(.*[$#>] ?)$"
     ADDITIONAL_CMD_FAILURES = ["Connection timed out", "Connection refused"]
 
     @inspections_decorators.discard_unknown_args
@@ -60,6 +81,7 @@ class SSHClient(object):
         prompt_retries=3,
         prompt_match=consts.DEFAULT_DEVICE_PROMPT_REGEX,
         session_conf={},
+        keepalive_interval=0,
         **kwargs,
     ):
         # TODO: add comments, regex and read_until_match validation
@@ -78,12 +100,18 @@ class SSHClient(object):
         self.height = height
         self.cmd_failures = cmd_failures
         self.prompt_retries = prompt_retries
+        # seconds between transport keepalive packets, 0 disables them. applied on every (re)connect
+        self.keepalive_interval = keepalive_interval
 
         # the prompt we expect during open session
         self.prompt_match = prompt_match
 
         self._session = None
         self.shell = None
+        # serializes the use of the session between threads: it is held by the commands and the (re)connects,
+        # so the commands of the sync and the async (see AsyncSSHClient) APIs never interleave on the shell.
+        # hold it to run several commands in a row without another thread's commands in between
+        self.lock = threading.RLock()
 
         if (
             self.username is None
@@ -110,6 +138,7 @@ class SSHClient(object):
         logger.debug(f"Set prompt of ssh session be {prompt}")
         self._prompt = prompt
 
+    @_locked
     def connect_wait_for_prompt(self, prompt_retries):
         last_exception = None
         for i in range(prompt_retries):
@@ -183,6 +212,10 @@ class SSHClient(object):
                 )
             # https://github.com/paramiko/paramiko/issues/175
             self._session._transport.window_size = 2147483647
+            if self.keepalive_interval:
+                self._session.get_transport().set_keepalive(
+                    self.keepalive_interval
+                )
         except paramiko.ssh_exception.BadHostKeyException:
             message = "host key could not be verified"
             logger.error(self.log_prefix + message)
@@ -321,6 +354,7 @@ class SSHClient(object):
 
         return self.session.get_transport().sock.getsockname()
 
+    @_locked
     def execute_command(
         self, command, timeout=0, wait_for_answer=True, **kwargs
     ):
@@ -359,8 +393,9 @@ class SSHClient(object):
             channel.close()
             return
 
-        # read what you got
-        data = []
+        # read what you got, the output is decoded once it's complete,
+        # so multi-byte chars split between reads are not lost
+        data = bytearray()
 
         # for command to exit
         raise_receive_timeout = False
@@ -368,10 +403,7 @@ class SSHClient(object):
         while True:
             while channel.recv_ready():
                 try:
-                    data_buffer = channel.recv(consts.MAX_BUFFER).decode(
-                        "utf-8", "ignore"
-                    )
-                    data.append(data_buffer)
+                    data += channel.recv(consts.MAX_BUFFER)
                 except socket.timeout as e:
                     logger.warning(
                         self.log_prefix
@@ -394,10 +426,15 @@ class SSHClient(object):
                 )
                 break
 
-            sleep(0.0075)
+            wait_time = min(timeout - time_diff, consts.CHANNEL_WAIT_INTERVAL)
+            if channel.eof_received:
+                # all the output was received, only the exit status is missing
+                channel.status_event.wait(wait_time)
+            else:
+                self._wait_for_data(channel, wait_time)
 
         channel.close()
-        output = "".join(data)
+        output = data.decode("utf-8", "ignore")
 
         if raise_receive_timeout:
             message = f"cannot get full output of '{command}'.output buffer has: '{output}'"
@@ -406,6 +443,110 @@ class SSHClient(object):
 
         return output
 
+    @_locked
+    def execute_commands(
+        self, commands, timeout=0, max_channels=consts.EXEC_MAX_CHANNELS
+    ):
+        """
+        Execute several commands at the router OS concurrently, each on its own exec channel of the session transport,
+        so they are collected in parallel without another SSH handshake per command.
+        Up to max_channels channels are open at a time, the next command starts as soon as a channel is done.
+        A command which times out, or exits with a non-zero status, fails all the commands, the remaining channels
+        are closed.
+        :param timeout: timeout of each command
+        :returns: list of the outputs of the commands, in the order of the commands
+        :raises: ExecutionTimeout, ExecutionFailed
+        """
+        timeout = timeout if timeout else self.command_timeout
+        commands = list(commands)
+        if not self.is_connected():
+            message = f"could not execute {commands}, session is not open. reconnecting"
+            logger.error(self.log_prefix + message)
+            self.reconnect()
+        transport = self.session.get_transport()
+
+        outputs = [None] * len(commands)
+        # channel -> (command index, start time, output)
+        running = {}
+        pending = iter(range(len(commands)))
+        try:
+            while True:
+                while len(running) < max_channels:
+                    index = next(pending, None)
+                    if index is None:
+                        break
+                    channel = self._open_exec_channel(
+                        transport, commands[index], timeout
+                    )
+                    running[channel] = (index, monotonic(), bytearray())
+                if not running:
+                    break
+
+                finished = False
+                for channel, (index, start_time, data) in list(running.items()):
+                    # checked before reading, as the data is always received before the exit status
+                    done = channel.exit_status_ready()
+                    while channel.recv_ready():
+                        data += channel.recv(consts.MAX_BUFFER)
+                    if done:
+                        channel.close()
+                        del running[channel]
+                        output = data.decode("utf-8", "ignore")
+                        if channel.exit_status:
+                            message = f"'{commands[index]}' exited with status {channel.exit_status}: '{output}'"
+                            logger.warning(self.log_prefix + message)
+                            raise exceptions.ExecutionFailed(message)
+                        outputs[index] = output
+                        finished = True
+                    elif monotonic() - start_time > timeout:
+                        output = data.decode("utf-8", "ignore")
+                        message = f"cannot get full output of '{commands[index]}'.output buffer has: '{output}'"
+                        logger.warning(self.log_prefix + message)
+                        raise exceptions.ExecutionTimeout(message, output)
+
+                if not finished:
+                    # nothing completed, sleep until one of the channels receives more data
+                    self._wait_for_channels(list(running))
+        finally:
+            for channel in running:
+                channel.close()
+        return outputs
+
+    def _open_exec_channel(self, transport, command, timeout):
+        channel = transport.open_session()
+        channel.set_combine_stderr(True)
+        channel.settimeout(timeout)
+        logger.debug(f"executing '{command}'")
+        try:
+            channel.exec_command(command)
+        except (paramiko.ssh_exception.SSHException, socket.timeout):
+            message = f"could not execute '{command}'"
+            logger.warning(self.log_prefix + message)
+            channel.close()
+            raise exceptions.ExecutionFailed(message)
+        return channel
+
+    @staticmethod
+    def _wait_for_channels(channels):
+        """
+        Blocks until one of the channels has data to read, or CHANNEL_WAIT_INTERVAL passes.
+        A channel at eof stays readable until it's closed, and its exit status follows shortly,
+        so only OUTPUT_SETTLE_INTERVAL is waited while there is one.
+        """
+        receiving = [channel for channel in channels if not channel.eof_received]
+        if len(receiving) < len(channels):
+            timeout = consts.OUTPUT_SETTLE_INTERVAL
+        else:
+            timeout = consts.CHANNEL_WAIT_INTERVAL
+        if not receiving:
+            sleep(timeout)
+            return
+        try:
+            select.select(receiving, [], [], timeout)
+        except (OSError, ValueError):
+            # one of the channels was closed
+            sleep(consts.OUTPUT_SETTLE_INTERVAL)
+
     def scp_put(self, src, dst=".", recursive=False):
         """
         Performs scp put
@@ -503,6 +644,7 @@ class SSHClient(object):
             logger.error(self.log_prefix + message)
             raise exceptions.UnexpectedOutput(message)
 
+    @_locked
     def execute_shell_command(
         self,
         command,
@@ -520,6 +662,7 @@ class SSHClient(object):
         enter_char="\n",
         additional_cmd_failures=None,
         validate_output=True,
+        output_stream=None,
         **kwargs,
     ):
         """
@@ -527,6 +670,12 @@ class SSHClient(object):
         :param shows_output: True - expecting command to return output, otherwise - will raise exceptions.UnexpectedOutput
         :param additional_cmd_failures: messages which indicate on error in output
         :param validate_output: if False, skip all output validations
+        :param output_stream: a StreamingDecipher (or any object with a feed(str) method) fed with the output while
+                              it is received, instead of holding the whole output. The returned output is then only
+                              its first consts.STREAMED_OUTPUT_HEAD_SIZE chars, which are logged. The whole output
+                              is checked for the failures while it is streamed, CommandFailed is raised with the
+                              failed lines once the prompt is received.
+                              Supported with the prompt match only, not with match or match_reg
 
         if doesn't have a prompt match - will raise exceptions.ExecutionTimeout
         :raises: ExecutionTimeout, SessionClosed
@@ -539,6 +688,11 @@ class SSHClient(object):
         else:
             additional_cmd_failures = return_as_list(additional_cmd_failures)
 
+        if output_stream is not None and (match or match_reg):
+            raise ValueError(
+                "an output stream is supported with the prompt match only"
+            )
+
         timeout = timeout if timeout else self.command_timeout
         cmd = command if command_echo else ""
         if match_reg or match:
@@ -552,6 +706,15 @@ class SSHClient(object):
             )
         else:
             match = match_reg
+        output = None
+        if output_stream is not None:
+            failures = ()
+            if validate_output and shows_output is not False:
+                failures = tuple(self.cmd_failures) + tuple(additional_cmd_failures)
+            output = StreamingOutputBuffer(
+                output_stream.feed, echo=cmd, failures=failures
+            )
+            match = self.STREAMED_PROMPT_REGEX
 
         if reconnect and not self.is_connected():
             message = f"could not execute '{command}', session is not open. reconnecting and retrying execution"
@@ -599,8 +762,11 @@ class SSHClient(object):
                         time_stop,
                         match=match,
                         endswith=endswith,
+                        output=output,
                         **kwargs,
                     )
+                    if output is not None:
+                        output_lines = output.head.rstrip()
             else:
                 message = f"executed: {command}. not pending for response."
                 logger.debug(self.log_prefix + message)
@@ -614,7 +780,9 @@ class SSHClient(object):
 
         except OSError:
             logger.error(self.log_prefix + "SSH client exception occurs")
-            if reconnect and _first_attempt and self.command_retry:
+            # a streamed output can't be fed twice
+            retry = output is None or not output.started
+            if reconnect and _first_attempt and self.command_retry and retry:
                 logger.debug(
                     self.log_prefix + "session timed out, reconnecting."
                 )
@@ -637,6 +805,15 @@ class SSHClient(object):
 
         if wait_for_answer:
             try:
+                # the failures are raised after the prompt, so the rest of the output is not read by the next command
+                if output is not None and output.failure is not None:
+                    message = f"Command '{command}'.\nfailed with error: '{output.failure}'"
+                    logger.error(self.log_prefix + message)
+                    raise exceptions.CommandFailed(output.failure)
+                if output is not None and output.consumer_error is not None:
+                    message = f"Command '{command}'.\nfailed to stream its output: {output.consumer_error!r}"
+                    logger.error(self.log_prefix + message)
+                    raise output.consumer_error
                 if match:
                     output_lines = self.output_validation(
                         output_lines,
@@ -659,58 +836,256 @@ class SSHClient(object):
                     )
             return output_lines
 
+    @_locked
+    def execute_shell_commands(
+        self,
+        commands,
+        timeout=0,
+        shows_output=False,
+        additional_cmd_failures=None,
+        validate_output=True,
+        endswith=("# ", "$ ", "> ", "#"),
+        enter_char="\n",
+        reconnect=True,
+        batch_size=consts.PIPELINE_BATCH_SIZE,
+    ):
+        """
+        Execute several commands via shell (router cli), without waiting for the prompt between them.
+        The commands are written in batches of batch_size commands. The device reads the commands typed ahead
+        one after the other, so the output of a batch is '<cmd1>\n<output1>\n<prompt><cmd2>\n<output2>...<prompt>',
+        and it is split back to the output of each command by the prompt and echo of the next command.
+        Intended for commands that don't change the prompt or ask for input, such as show commands.
+        :param timeout: timeout of each command, a batch times out after timeout * number of its commands
+        :param shows_output: same as in execute_shell_command, applied to the output of each command
+        :returns: list of the outputs of the commands, in the order of the commands
+        :raises: ExecutionTimeout, SessionClosed, CommandFailed, UnexpectedOutput
+        """
+        commands = list(commands)
+        outputs = []
+        for i in range(0, len(commands), batch_size):
+            batch = commands[i : i + batch_size]
+            batch_outputs = self._execute_shell_commands_batch(
+                batch,
+                (timeout if timeout else self.command_timeout) * len(batch),
+                endswith,
+                enter_char,
+                reconnect,
+            )
+            for command, output in zip(batch, batch_outputs):
+                outputs.append(
+                    self.output_validation(
+                        output,
+                        command,
+                        shows_output,
+                        additional_cmd_failures,
+                        validate_output,
+                    )
+                )
+        return outputs
+
+    def _execute_shell_commands_batch(
+        self, commands, timeout, endswith, enter_char, reconnect
+    ):
+        if reconnect and not self.is_connected():
+            logger.debug(
+                self.log_prefix
+                + "could not execute commands, session is not open. reconnecting"
+            )
+            self.reconnect()
+        if reconnect and self.shell is None:
+            self.open_session()
+            self._wait_for_prompt()
+
+        channel = self.shell
+        if not channel:
+            raise exceptions.SessionClosed(
+                f"Session is closed, channel was not instantiated"
+            )
+        channel.settimeout(timeout)
+        channel.set_combine_stderr(True)
+
+        # Clear the buffer before executing any commands
+        while channel.recv_ready():
+            channel.recv(consts.MAX_BUFFER)
+        logger.debug(
+            self.log_prefix + f"executing {len(commands)} commands: {commands}"
+        )
+        start_time = datetime.now()
+        try:
+            channel.sendall(
+                "".join(command + enter_char for command in commands)
+            )
+            outputs = self._read_until_match(
+                channel,
+                monotonic() + timeout,
+                match=functools.partial(
+                    self._split_pipelined_output, commands=commands
+                ),
+                endswith=endswith,
+            )
+        except socket.timeout as e:
+            message = f"Timeout reached - failed to execute commands {commands}"
+            logger.warning(self.log_prefix + message)
+            raise exceptions.ExecutionTimeout(message, e)
+        except OSError:
+            message = f"could not execute {commands}, session is not open"
+            logger.error(self.log_prefix + message)
+            raise exceptions.SessionClosed(message)
+
+        logger.debug(
+            self.log_prefix
+            + f"response to {commands}:\n{outputs}\n"
+            + "commands completed after {:.4f} seconds".format(
+                timedelta.total_seconds(datetime.now() - start_time)
+            )
+        )
+        return outputs
+
+    @staticmethod
+    def _split_pipelined_output(output, commands):
+        """
+        Splits the output of pipelined commands at the echo of each command, searched in order after the previous
+        one. The prompt is the last line of the output, the prompt printed after the last command, so an echo is
+        only a line of that prompt followed by the whole command: a line of the outputs which looks like a prompt,
+        or ends with the text of a command, is not taken for an echo.
+        :returns: the outputs of the commands, None while the output of the last command is incomplete
+        """
+        prompt_start = output.rfind("\n") + 1
+        position = output.find(commands[0])
+        if not prompt_start or position < 0:
+            return None
+        prompt = output[prompt_start:]
+        position += len(commands[0])
+        outputs = []
+        for command in commands[1:]:
+            echo = f"\n{prompt}{command}"
+            boundary = output.find(echo, position)
+            # the command must end the echo line
+            while boundary >= 0 and not output.startswith("\n", boundary + len(echo)):
+                boundary = output.find(echo, boundary + 1)
+            if boundary < 0:
+                return None
+            outputs.append(output[position:boundary])
+            position = boundary + len(echo)
+        if position >= prompt_start:
+            return None
+        outputs.append(output[position : prompt_start - 1])
+        # drop the new line ending each echo
+        return [cmd_output.removeprefix("\n").rstrip() for cmd_output in outputs]
+
     def _read_until_match(
-        self, channel, time_stop, match="", endswith=None, **kwargs
+        self,
+        channel,
+        time_stop,
+        match="",
+        endswith=None,
+        output=None,
+        **kwargs,
     ):
-        output = ""
+        """:param output: the OutputBuffer accumulating the output, a new one by default"""
+        output = OutputBuffer() if output is None else output
         last_output_len = len(output)
+        # the output length at the last match attempt, matching is retried only when new output arrives
+        matched_output_len = None
         # save the 'last_line' value in case 'endswith' is set, so that the buffer is read 1 more time before setting
         # the _match value. this is done to prevent chars in the middle of the output to be detected as and end.
         endswith_last_line = None  # TODO: add to drivenetsSSH if no issues found with this change
+        # True when a possible prompt was seen and the buffer should be read once more before matching it
+        awaiting_last_line = False
         while True:
             # True if data is buffered and ready to be read from this channel.
             # otherwise it means you may need to wait before more data arrives.
             while channel.recv_ready():
-                # collect data from the ssh channel
-                buffer = channel.recv(consts.MAX_BUFFER).decode(
-                    "utf-8", "ignore"
-                )  # 65936
-
-                output += buffer
+                # collect data from the ssh channel.
+                # because of vt100, the output buffer removes expected escape chars before matching the output.
+                # (meta-characters that visualize output, such as '\x1b[92m+]')
+                output.feed(channel.recv(consts.MAX_BUFFER))  # 65936
 
                 if monotonic() > time_stop:
                     # Gets here if timeout has exceeded
                     break
-            if last_output_len == len(output):
-                # because of vt100 need to remove expected escape chars.
-                # clean output from meta-characters that visualize output. (such as '\x1b[92m+]')
-                output = self.strip_ansi_escape_codes(output)
-
+            if last_output_len == len(output) and (
+                awaiting_last_line or matched_output_len != len(output)
+            ):
+                matched_output_len = len(output)
                 matches_list = match if isinstance(match, list) else [match]
-                last_line = output.splitlines()
+                # only the tail of the output is checked for the prompt,
+                # the whole output is matched once, after the prompt is received
+                last_line = (len(output), output.last_line)
+                awaiting_last_line = False
                 for item in matches_list:
-                    _match = None
-                    if endswith and last_line:
-                        if last_line[-1].endswith(endswith):
+                    cmd_output = None
+                    if endswith and len(output):
+                        if last_line[1].endswith(endswith):
                             if last_line == endswith_last_line:
-                                _match = re.match(item, output, re.DOTALL)
+                                cmd_output = self._match_output(
+                                    item, output.getvalue()
+                                )
                             else:
                                 endswith_last_line = last_line
+                                awaiting_last_line = True
                     else:
                         # On long output, matching could take a lot of time
-                        _match = re.match(item, output, re.DOTALL)
-                    if _match:
-                        cmd_output = _match.group(1).rstrip()
+                        cmd_output = self._match_output(item, output.getvalue())
+                    if cmd_output is not None:
                         return cmd_output
 
             # placed here to make sure that there is no more buffer to read, before trying to match the regex pattern.
+            received_data = last_output_len != len(output)
             last_output_len = len(output)
 
-            sleep(0.0025)
-            if monotonic() > time_stop:
-                message = f"command timeout exceeded and execution did not complete. Partial output:\n{output}"
+            time_left = time_stop - monotonic()
+            if time_left <= 0:
+                partial_output = output.getvalue()
+                message = f"command timeout exceeded and execution did not complete. Partial output:\n{partial_output}"
                 logger.error(self.log_prefix + message)
-                raise exceptions.ExecutionTimeout(message, output)
+                raise exceptions.ExecutionTimeout(message, partial_output)
+
+            if received_data or awaiting_last_line:
+                # give the device a short quiet period before trying to match the output
+                self._wait_for_data(
+                    channel, min(time_left, consts.OUTPUT_SETTLE_INTERVAL)
+                )
+            else:
+                # nothing matched and nothing new arrived, sleep until the device sends more data
+                self._wait_for_data(
+                    channel, min(time_left, consts.CHANNEL_WAIT_INTERVAL)
+                )
+
+    @staticmethod
+    def _match_output(match, output):
+        """
+        :param match: a regex whose group 1 is the command output,
+                      or a callable returning the command output, None while the output is incomplete
+        :returns: the command output, None when the output doesn't match
+        """
+        if callable(match):
+            return match(output)
+        _match = re.match(match, output, re.DOTALL)
+        return _match.group(1).rstrip() if _match else None
+
+    @staticmethod
+    def _wait_for_data(channel, timeout):
+        """
+        Block until the channel has data to read, or until timeout (in seconds) has passed.
+        paramiko exposes a pipe through channel.fileno() which becomes readable as soon as data
+        arrives, so waiting does not consume CPU while the device is silent.
+        :return: True if data is ready to be read from the channel
+        """
+        if channel.recv_ready():
+            return True
+        if timeout <= 0:
+            return False
+        try:
+            readable, _, _ = select.select([channel], [], [], timeout)
+        except (OSError, ValueError):
+            # the channel was closed, there is nothing to wait for
+            sleep(min(timeout, consts.OUTPUT_SETTLE_INTERVAL))
+            return channel.recv_ready()
+        if readable and not channel.recv_ready():
+            # the pipe stays readable once the channel is closed, don't spin on it
+            sleep(min(timeout, consts.OUTPUT_SETTLE_INTERVAL))
+        return channel.recv_ready()
 
     def send_char(
         self,
@@ -778,11 +1153,9 @@ class SSHClient(object):
         Remove any ANSI (VT100) ESC codes from the output
         http://en.wikipedia.org/wiki/ANSI_escape_code
         """
-        output = consts.ANSI_ESCAPE.sub("", string_buffer)
-        output = consts.REMOVE_CHARS.sub("", output)
-
-        return output
+        return strip_ansi_escape_codes(string_buffer)
 
+    @_locked
     def reconnect(self):
         # close session
         self.close()
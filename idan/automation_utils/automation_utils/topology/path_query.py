@@ -0,0 +1,190 @@
+"""
+Compiled path queries over the topology data (nested dicts and lists loaded from the topology JSON).
+
+A path is a "/" separated list of keys. The lists met on the way are traversed element by element, so
+"network/sites/devices/ports" returns the ports of all the devices of all the sites. A key can be followed
+by predicates selecting the elements of its value by their fields:
+
+    network/sites/devices[name=tcr01]/ports
+    network/topology-l2l3[a=tcr01][type=p2p]
+
+A predicate value is compared with the field value as it is spelled in JSON, so [enabled=true] matches a
+true field and [mtu=9000] a 9000 one.
+
+The paths are parsed once and cached, see compile_path().
+"""
+
+import functools
+import json
+import re
+
+from automation_utils.common.exceptions import TopologyException
+from automation_utils.common.general.python_helpers import flat_list
+
+PATH_CACHE_SIZE = 1024
+
+_STEP_REGEX = re.compile(r"^(?P<key>[^\[\]]+)(?P<predicates>(\[[^\[\]=]+=[^\[\]]*\])*)$")
+_PREDICATE_REGEX = re.compile(r"\[([^\[\]=]+)=([^\[\]]*)\]")
+_MISSING = object()
+
+
+class _Step:
+    __slots__ = ("key", "predicates", "prefix")
+
+    def __init__(self, key: str, predicates: tuple, prefix: str):
+        self.key = key
+        # (field, value) pairs the selected elements must match, compared with the JSON spelling of the fields
+        self.predicates = predicates
+        # the path up to this step, for the error messages
+        self.prefix = prefix
+
+    def matches(self, element) -> bool:
+        if not isinstance(element, dict):
+            return False
+        for field, value in self.predicates:
+            found = element.get(field, _MISSING)
+            if found != value and (
+                found is _MISSING or type(found) is str or _json_spelling(found) != value
+            ):
+                return False
+        return True
+
+    def select(self, element, raise_exc_on_failure):
+        """
+        :returns: the value of the key in the element, or the elements of a list value matching the predicates.
+                  _MISSING when the element has no such key or its value doesn't match the predicates
+        """
+        if not isinstance(element, dict) or self.key not in element:
+            if raise_exc_on_failure:
+                raise TopologyException(
+                    f"get_expected_topology failed: could not find path {self.prefix} in topology data"
+                )
+            return _MISSING
+        value = element[self.key]
+        if not self.predicates:
+            return value
+        if isinstance(value, list):
+            matches = self.matches
+            return [item for item in value if matches(item)]
+        return value if self.matches(value) else _MISSING
+
+
+def _json_spelling(value) -> str:
+    """:returns: the scalar as it is written in JSON, e.g. true rather than True, other values as str()"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _iter_elements(nodes):
+    """Yields the nodes, the elements of the (nested) list nodes one by one"""
+    for node in nodes:
+        if isinstance(node, list):
+            yield from _iter_elements(node)
+        else:
+            yield node
+
+
+def _iter_step(step: _Step, nodes, raise_exc_on_failure):
+    """Yields the values the step leads to from the nodes, as the nodes are yielded by the previous step"""
+    for element in _iter_elements(nodes):
+        value = step.select(element, raise_exc_on_failure)
+        if value is not _MISSING:
+            yield value
+
+
+class PathQuery:
+    """A parsed path, evaluated against topology data with get() or iter()"""
+
+    __slots__ = ("path", "steps")
+
+    def __init__(self, path: str):
+        self.path = path
+        steps = []
+        prefix = ""
+        for segment in path.strip("/").split("/"):
+            if not segment:
+                continue
+            match = _STEP_REGEX.match(segment)
+            if match is None:
+                raise TopologyException(f"invalid topology path {path}: '{segment}'")
+            steps.append(
+                _Step(
+                    match.group("key"),
+                    tuple(_PREDICATE_REGEX.findall(match.group("predicates"))),
+                    prefix,
+                )
+            )
+            prefix += match.group("key") + "/"
+        self.steps = tuple(steps)
+
+    def _evaluate(self, root, raise_exc_on_failure) -> tuple[list, bool]:
+        """
+        Evaluates the path one step at a time, over all the nodes the previous steps led to, for get().
+        :returns: (values, traversed_list), the values the path leads to in order, and whether a list was
+                  traversed on the way to them
+        """
+        nodes = [root]
+        traversed_list = False
+        for step in self.steps:
+            key = step.key
+            next_nodes = []
+            elements = flat_list(nodes)
+            if elements is not nodes:
+                traversed_list = True
+            # _Step.select inlined, the eager evaluation is the hot path of get()
+            for element in elements:
+                if not isinstance(element, dict) or key not in element:
+                    if raise_exc_on_failure:
+                        raise TopologyException(
+                            f"get_expected_topology failed: could not find path {step.prefix} in topology data"
+                        )
+                    continue
+                value = element[key]
+                if not step.predicates:
+                    next_nodes.append(value)
+                elif isinstance(value, list):
+                    matches = step.matches
+                    next_nodes.append([item for item in value if matches(item)])
+                elif step.matches(value):
+                    next_nodes.append(value)
+            nodes = next_nodes
+        return nodes, traversed_list
+
+    def iter(self, root, raise_exc_on_failure=False):
+        """
+        Yields the elements the path leads to, the elements of a list value are yielded one by one.
+        The path is evaluated lazily, by a generator per step chained to the generator of the previous step,
+        so stopping the iteration early skips the rest of the data. With raise_exc_on_failure, the elements
+        found before a missing path are yielded before the exception is raised.
+        """
+        values = iter((root,))
+        for step in self.steps:
+            values = _iter_step(step, values, raise_exc_on_failure)
+        for value in values:
+            if isinstance(value, list):
+                yield from value
+            elif value is not None:
+                yield value
+
+    def get(self, root, raise_exc_on_failure=True):
+        """
+        :returns: the value the path leads to. When lists are traversed on the way, a list of the values
+                  (lists values are concatenated), or None when there are no values.
+        """
+        values, traversed_list = self._evaluate(root, raise_exc_on_failure)
+        if not traversed_list:
+            return values[0] if values else None
+        result = []
+        for value in values:
+            if isinstance(value, list):
+                result.extend(value)
+            elif value is not None:
+                result.append(value)
+        return result or None
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str) -> PathQuery:
+    """:returns: the parsed path query, cached so repeated queries are parsed once"""
+    return PathQuery(path)
@@ -0,0 +1,58 @@
+"""
+Longest prefix match of addresses against the subnets of the topology, e.g. to find the topology-l2l3 link
+owning a route next-hop.
+
+The prefixes are kept in one hash table per prefix length, keyed by their network bits, and a lookup probes
+the lengths in use from the longest down. Topologies use a handful of prefix lengths (/31, /30, /127...), so
+a lookup is a few dict probes instead of a bit by bit walk of up to 128 trie levels.
+"""
+
+import typing
+
+from .topology_data import IpAddress
+
+
+def as_ip_address(address: str | IpAddress) -> IpAddress:
+    """:returns: the address as an IpAddress, a host prefix when the string has no prefix length"""
+    if isinstance(address, IpAddress):
+        return address
+    if "/" not in address:
+        address = f"{address}/{128 if ':' in address else 32}"
+    return IpAddress(address=address)
+
+
+class PrefixIndex:
+    def __init__(self):
+        # ip version -> prefix length -> network bits -> value
+        self._tables: dict[int, dict[int, dict[int, typing.Any]]] = {4: {}, 6: {}}
+        # ip version -> the prefix lengths of its tables, the longest first
+        self._lengths: dict[int, list[int]] = {4: [], 6: []}
+        self._size = 0
+
+    def add(self, prefix: str | IpAddress, value) -> None:
+        """Indexes the value under the prefix, the first value added for a prefix is kept"""
+        prefix = as_ip_address(prefix)
+        version, length = prefix.version, prefix.cidr_mask
+        tables = self._tables[version]
+        table = tables.get(length)
+        if table is None:
+            table = tables[length] = {}
+            self._lengths[version] = sorted(tables, reverse=True)
+        network = prefix.packed >> (prefix.bits - length)
+        if network not in table:
+            table[network] = value
+            self._size += 1
+
+    def lookup(self, address: str | IpAddress):
+        """:returns: the value of the longest prefix containing the address, or None"""
+        address = as_ip_address(address)
+        version, packed, bits = address.version, address.packed, address.bits
+        tables = self._tables[version]
+        for length in self._lengths[version]:
+            value = tables[length].get(packed >> (bits - length))
+            if value is not None:
+                return value
+        return None
+
+    def __len__(self):
+        return self._size
@@ -0,0 +1,75 @@
+"""
+Binary snapshots of loaded topologies: the parsed inventory and the TopologyManager indexes, pickled next to
+the topology file and keyed by the sha256 of its content, so an unchanged topology file is not parsed again.
+
+A snapshot file holds two pickles, a header (the snapshot version and the topology file digest) and the state,
+so a stale snapshot is rejected without unpickling the state.
+Snapshots are unpickled, only enable them for topology directories you trust.
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+
+from automation_utils.common.general.python_helpers import gc_paused
+import orbital.common as common
+
+logger = common.get_logger(__file__)
+
+# bump when the format of the inventory data or of the TopologyManager indexes changes
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def snapshot_path(topology_file: str) -> str:
+    return topology_file + SNAPSHOT_SUFFIX
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_snapshot(topology_file: str, topology_digest: str) -> dict | None:
+    """
+    :returns: the state saved by write_snapshot, or None when there is no snapshot of that topology file
+              content, of this snapshot version
+    """
+    path = snapshot_path(topology_file)
+    try:
+        with open(path, "rb") as reader:
+            header = pickle.load(reader)
+            if header != (SNAPSHOT_VERSION, topology_digest):
+                logger.debug(f"topology snapshot {path} is stale")
+                return None
+            with gc_paused():
+                return pickle.load(reader)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"ignoring unreadable topology snapshot {path}: {e}")
+        return None
+
+
+def write_snapshot(topology_file: str, topology_digest: str, state: dict) -> None:
+    """Saves the state next to the topology file, a failure to write it is logged and ignored"""
+    path = snapshot_path(topology_file)
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=directory, prefix=".topology-", delete=False
+        ) as writer:
+            temp_path = writer.name
+            pickle.dump(
+                (SNAPSHOT_VERSION, topology_digest),
+                writer,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            pickle.dump(state, writer, protocol=pickle.HIGHEST_PROTOCOL)
+        # atomic, concurrent sessions read either the previous snapshot or this one
+        os.replace(temp_path, path)
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"could not write topology snapshot {path}: {e}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
@@ -1,23 +1,135 @@
 import json
+import socket
 import typing
-import dataclasses
+import ipaddress
+
+from automation_utils.common.general.python_helpers import gc_paused
+
+# a faster JSON parser when one is installed, the large topology files spend most of their load time parsing
+try:
+    import orjson as fast_json
+except ImportError:
+    try:
+        import ujson as fast_json
+    except ImportError:
+        fast_json = None
+
+
+_ADDRESS_FAMILIES = {4: socket.AF_INET, 6: socket.AF_INET6}
 
 
-@dataclasses.dataclass
 class IpAddress:
-    address: str
-    subnet: str = dataclasses.field(init=False)
-    cidr_mask: int = dataclasses.field(init=False)
+    """
+    An interface address in CIDR notation, e.g. "10.0.0.1/31", immutable.
+    Holds the address as written and its prefix length. The packed integer address, which the equality,
+    hashing and containment checks use, and the ipaddress.ip_interface are computed on first use and cached,
+    so loading a topology does not pay for the addresses no one checks.
+    """
+
+    __slots__ = ("address", "cidr_mask", "_packed", "_interface")
+
+    def __init__(self, address: str):
+        _, separator, cidr_mask = address.partition("/")
+        if not separator:
+            raise ValueError(f"missing prefix length in ip address {address}")
+        _set_address(self, address)
+        _set_cidr_mask(self, int(cidr_mask))
+        # _packed and _interface are left unset until their first use
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getstate__(self):
+        return self.address
+
+    def __setstate__(self, address):
+        self.__init__(address)
+
+    @property
+    def subnet(self) -> str:
+        """the address without the prefix length"""
+        return self.address.partition("/")[0]
+
+    @property
+    def version(self) -> int:
+        return 6 if ":" in self.address else 4
+
+    @property
+    def bits(self) -> int:
+        """the length of the addresses of the ip version, 32 or 128"""
+        return 128 if ":" in self.address else 32
+
+    @property
+    def packed(self) -> int:
+        """the address as an integer, raises ValueError when the address is invalid"""
+        try:
+            return self._packed
+        except AttributeError:
+            version = self.version
+            try:
+                packed = int.from_bytes(
+                    socket.inet_pton(_ADDRESS_FAMILIES[version], self.subnet), "big"
+                )
+            except OSError as e:
+                raise ValueError(f"invalid ip address {self.address}") from e
+            if not 0 <= self.cidr_mask <= self.bits:
+                raise ValueError(f"invalid prefix length in ip address {self.address}")
+            _set_packed(self, packed)
+            return packed
+
+    @property
+    def interface(self) -> ipaddress.IPv4Interface | ipaddress.IPv6Interface:
+        try:
+            return self._interface
+        except AttributeError:
+            interface = ipaddress.ip_interface(self.address)
+            _set_interface(self, interface)
+            return interface
+
+    @property
+    def network(self) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+        return self.interface.network
+
+    def __contains__(self, other) -> bool:
+        """whether the address (an IpAddress or a string, with or without a prefix length) is in this network"""
+        if not isinstance(other, IpAddress):
+            other = IpAddress(other if "/" in other else f"{other}/0")
+        if other.version != self.version:
+            return False
+        host_bits = self.bits - self.cidr_mask
+        return (other.packed ^ self.packed) >> host_bits == 0
+
+    def __eq__(self, other):
+        if not isinstance(other, IpAddress):
+            return NotImplemented
+        if self.address == other.address:
+            return True
+        return (
+            self.cidr_mask == other.cidr_mask
+            and self.version == other.version
+            and self.packed == other.packed
+        )
+
+    def __hash__(self):
+        return hash((self.version, self.packed, self.cidr_mask))
 
-    def __post_init__(self):
-        subnet, cidr_mask = self.address.split("/")
-        self.cidr_mask = int(cidr_mask)
-        self.subnet = subnet
+    def __repr__(self):
+        return f"IpAddress(address={self.address!r})"
+
+    def __str__(self):
+        return self.address
 
     def encode(self) -> str:
         return self.address
 
 
+# the slots are set through their descriptors, IpAddress.__setattr__ refuses assignments
+_set_address = IpAddress.address.__set__
+_set_cidr_mask = IpAddress.cidr_mask.__set__
+_set_packed = IpAddress._packed.__set__
+_set_interface = IpAddress._interface.__set__
+
+
 class TopolongyJsonEncoder(json.JSONEncoder):
     def default(selo, o):
         if isinstance(o, IpAddress):
@@ -132,22 +244,85 @@ Inventory = typing.TypedDict(
 )
 
 
+_TYPED_DICT_KEYS: dict[type, frozenset[str]] = {}
+
+
+def typed_dict_keys(t: typing.TypedDict) -> frozenset[str]:
+    keys = _TYPED_DICT_KEYS.get(t)
+    if keys is None:
+        keys = _TYPED_DICT_KEYS[t] = frozenset(t.__annotations__.keys())
+    return keys
+
+
+TOPOLOGY_L2L3_KEYS = typed_dict_keys(TopologyL2L3)
+LAG_KEYS = typed_dict_keys(Lag)
+TOPOLOGY_L2L3_IP_ADDRESS_KEYS = ("ipv4_subnet", "ipv6_subnet")
+LAG_IP_ADDRESS_KEYS = ("ipv4_address", "ipv6_address")
+
+
 def is_instance_of(
     instance: dict[str, typing.Any], t: typing.TypedDict
 ) -> bool:
-    required_keys = set(t.__annotations__.keys())
-    instance_keys = set(instance.keys())
-    return required_keys == instance_keys
+    return instance.keys() == typed_dict_keys(t)
 
 
 def deserialization_hook(d: dict) -> dict:
-    if is_instance_of(d, TopologyL2L3):
-        ip_address_keys = ["ipv4_subnet", "ipv6_subnet"]
-        for ip_address_key in ip_address_keys:
-            d[ip_address_key] = IpAddress(address=d[ip_address_key])
-    elif is_instance_of(d, Lag):
-        ip_address_keys = ["ipv4_address", "ipv6_address"]
-        for ip_address_key in ip_address_keys:
-            d[ip_address_key] = IpAddress(address=d[ip_address_key])
-
+    keys = d.keys()
+    if keys == TOPOLOGY_L2L3_KEYS:
+        ip_address_keys = TOPOLOGY_L2L3_IP_ADDRESS_KEYS
+    elif keys == LAG_KEYS:
+        ip_address_keys = LAG_IP_ADDRESS_KEYS
+    else:
+        return d
+    for ip_address_key in ip_address_keys:
+        d[ip_address_key] = IpAddress(address=d[ip_address_key])
     return d
+
+
+def _convert_ip_addresses(
+    elements: list[dict], keys: frozenset[str], ip_address_keys: tuple
+) -> None:
+    for element in elements:
+        # the same condition as deserialization_hook, the dicts of other key sets are left as they are
+        if isinstance(element, dict) and element.keys() == keys:
+            for ip_address_key in ip_address_keys:
+                element[ip_address_key] = IpAddress(address=element[ip_address_key])
+
+
+def convert_ip_addresses(inventory: Inventory) -> Inventory:
+    """
+    Converts the addresses of the topology-l2l3 links and of the devices lags to IpAddress, in place.
+    The post-pass equivalent of deserialization_hook, it visits only these paths instead of every dict.
+    """
+    network = inventory.get("network")
+    if not isinstance(network, dict):
+        return inventory
+    _convert_ip_addresses(
+        network.get("topology-l2l3") or [],
+        TOPOLOGY_L2L3_KEYS,
+        TOPOLOGY_L2L3_IP_ADDRESS_KEYS,
+    )
+    for site in network.get("sites") or []:
+        for device in site.get("devices") or []:
+            _convert_ip_addresses(
+                device.get("lags") or [], LAG_KEYS, LAG_IP_ADDRESS_KEYS
+            )
+    return inventory
+
+
+def loads_inventory(data: bytes, use_fast_json=True) -> Inventory:
+    """
+    Parses the content of a topology file, with orjson or ujson when installed and use_fast_json is set,
+    with the json module otherwise.
+    """
+    with gc_paused():
+        if use_fast_json and fast_json is not None:
+            inventory = fast_json.loads(data)
+        else:
+            inventory = json.loads(data)
+        return convert_ip_addresses(inventory)
+
+
+def load_inventory(reader: typing.BinaryIO, use_fast_json=True) -> Inventory:
+    """Parses a topology file opened in binary mode, see loads_inventory"""
+    return loads_inventory(reader.read(), use_fast_json=use_fast_json)
@@ -0,0 +1,146 @@
+import dataclasses
+import itertools
+
+from . import topology_data
+from .path_query import compile_path
+
+_DEVICES_PATH = "network/sites/devices"
+_LINKS_PATH = "network/topology-l2l3"
+
+
+@dataclasses.dataclass
+class TopologyDiff:
+    """
+    The changes between two versions of a topology, the devices by name and the topology-l2l3 links by key.
+    """
+    added_devices: list[str] = dataclasses.field(default_factory=list)
+    removed_devices: list[str] = dataclasses.field(default_factory=list)
+    changed_devices: list[str] = dataclasses.field(default_factory=list)
+    added_links: list[topology_data.TopologyL2L3] = dataclasses.field(default_factory=list)
+    removed_links: list[topology_data.TopologyL2L3] = dataclasses.field(default_factory=list)
+    # (previous, current) versions of the links
+    changed_links: list[tuple[topology_data.TopologyL2L3, topology_data.TopologyL2L3]] = (
+        dataclasses.field(default_factory=list)
+    )
+
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.added_devices
+            or self.removed_devices
+            or self.changed_devices
+            or self.added_links
+            or self.removed_links
+            or self.changed_links
+        )
+
+    @property
+    def affected_devices(self) -> list[str]:
+        """
+        The devices to validate again: the added and changed devices, and the ends of the added, removed and
+        changed links, which are still in the topology
+        """
+        removed = set(self.removed_devices)
+        links = itertools.chain(
+            self.added_links, self.removed_links, *self.changed_links
+        )
+        link_ends = (name for link in links for name in (link["a"], link["z"]))
+        return sorted(
+            {
+                name
+                for name in itertools.chain(
+                    self.added_devices, self.changed_devices, link_ends
+                )
+                if name not in removed
+            }
+        )
+
+    def __str__(self):
+        if not self.changed:
+            return "Topology unchanged"
+        return (
+            f"Topology changed: devices +{len(self.added_devices)} -{len(self.removed_devices)} "
+            f"~{len(self.changed_devices)}, links +{len(self.added_links)} -{len(self.removed_links)} "
+            f"~{len(self.changed_links)}, affected devices: {', '.join(self.affected_devices)}"
+        )
+
+
+def _link_key(link: topology_data.TopologyL2L3):
+    return link.get("key") or (
+        link.get("a"),
+        link.get("a_interface"),
+        link.get("z"),
+        link.get("z_interface"),
+    )
+
+
+def _group(elements, key) -> dict:
+    groups = {}
+    for element in elements:
+        groups.setdefault(key(element), []).append(element)
+    return groups
+
+
+def diff_inventories(
+    previous: topology_data.Inventory, current: topology_data.Inventory
+) -> TopologyDiff:
+    """
+    :returns: the TopologyDiff from the previous to the current inventory.
+    The unchanged devices and links of the current inventory are replaced by the objects of the previous one,
+    so what was built from the previous inventory (e.g. the TopologyManager indexes) stays valid for them.
+    """
+    diff = TopologyDiff()
+    unchanged = {}
+
+    previous_devices = _group(
+        compile_path(_DEVICES_PATH).iter(previous), lambda device: device["name"]
+    )
+    current_devices = _group(
+        compile_path(_DEVICES_PATH).iter(current), lambda device: device["name"]
+    )
+    for name, devices in current_devices.items():
+        previous_group = previous_devices.get(name)
+        if previous_group is None:
+            diff.added_devices.append(name)
+        elif previous_group != devices:
+            diff.changed_devices.append(name)
+        else:
+            unchanged.update(zip(map(id, devices), previous_group))
+    diff.removed_devices = [
+        name for name in previous_devices if name not in current_devices
+    ]
+
+    previous_links = _group(compile_path(_LINKS_PATH).iter(previous), _link_key)
+    current_links = _group(compile_path(_LINKS_PATH).iter(current), _link_key)
+    for key, links in current_links.items():
+        previous_group = previous_links.get(key, [])
+        if previous_group == links:
+            unchanged.update(zip(map(id, links), previous_group))
+        elif len(previous_group) == len(links) == 1:
+            diff.changed_links.append((previous_group[0], links[0]))
+        else:
+            diff.removed_links.extend(
+                link for link in previous_group if link not in links
+            )
+            diff.added_links.extend(
+                link for link in links if link not in previous_group
+            )
+    for key, links in previous_links.items():
+        if key not in current_links:
+            diff.removed_links.extend(links)
+
+    _replace_unchanged(current, unchanged)
+    return diff
+
+
+def _replace_unchanged(inventory: topology_data.Inventory, unchanged: dict) -> None:
+    if not unchanged:
+        return
+    network = inventory.get("network") or {}
+    for site in network.get("sites") or []:
+        devices = site.get("devices")
+        if devices:
+            devices[:] = [unchanged.get(id(device), device) for device in devices]
+    links = network.get("topology-l2l3")
+    if links:
+        links[:] = [unchanged.get(id(link), link) for link in links]
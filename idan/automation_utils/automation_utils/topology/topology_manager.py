@@ -1,17 +1,23 @@
-import json
 import typing
 import itertools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 import configargparse
 from automation_utils.common.exceptions import (
     FileExceptions,
     TopologyException,
+    TopologyValidationFailed,
 )
+from automation_utils.device_manager import DeviceManager
 from automation_utils.inventory_manager import InventoryManager
-from automation_utils.common.general.python_helpers import Singleton
+from automation_utils.common.general.python_helpers import Singleton, gc_paused
 import orbital.common as common
 
-from . import topology_data
+from . import snapshot, topology_data
+from .path_query import compile_path
+from .prefix_index import PrefixIndex, as_ip_address
+from .topology_diff import TopologyDiff, diff_inventories
 
 logger = common.get_logger(__file__)
 
@@ -39,20 +45,247 @@ class TopologyManager(metaclass=Singleton):
 
     def __init__(self):
         self.inventory_data: topology_data.Inventory = None
+        # the last loaded topology file, reloaded by reload(), and the sha256 of its content
+        self.topology_file: str = None
+        self._topology_digest: str = None
         self.inventory_manager: InventoryManager = InventoryManager()
+        # (device, interface) -> (peer device, peer interface), built from the topology-l2l3 links
+        self._peer_index: dict[tuple[str, str], tuple[str, str]] = None
+        # device name -> the devices of that name (of all the sites)
+        self._device_index: dict[str, list[topology_data.Device]] = {}
+        # (device name, interface-id) -> lag, port or loopback (by its id)
+        self._interface_index: dict[tuple[str, str], dict] = {}
+        # the inventory data the indexes were built from, they are rebuilt when the data is replaced
+        self._indexed_data = None
+        # built on the first address lookup: the topology-l2l3 links by their subnets, and
+        # (ip version, address) -> (device name, lag or loopback) by the interfaces addresses
+        self._link_prefix_index: PrefixIndex = None
+        self._interface_address_index: dict[tuple[int, int], tuple[str, dict]] = None
 
-    def load(self, topology_file: str) -> topology_data.Inventory:
+    def load(
+        self, topology_file: str, use_fast_json=True, use_snapshot=False
+    ) -> topology_data.Inventory:
+        """
+        param: use_fast_json: parse with orjson or ujson when installed, see topology_data.loads_inventory
+        param: use_snapshot: reuse the snapshot of the parsed topology and its indexes saved next to the
+               topology file when the file content did not change, and save one otherwise, see
+               topology/snapshot.py
+        """
+        data = self._read_topology_file(topology_file)
+        topology_digest = snapshot.digest(data)
+        self.topology_file = topology_file
+        self._topology_digest = topology_digest
+        if use_snapshot:
+            state = snapshot.read_snapshot(topology_file, topology_digest)
+            if state is not None:
+                self._restore_snapshot_state(state)
+                return
+        self.inventory_data = topology_data.loads_inventory(
+            data, use_fast_json=use_fast_json
+        )
+        self._build_indexes()
+        if use_snapshot:
+            snapshot.write_snapshot(
+                topology_file, topology_digest, self._snapshot_state()
+            )
+
+    def reload(
+        self, topology_file: str = None, use_fast_json=True
+    ) -> TopologyDiff:
+        """
+        Loads the topology file again, the last loaded one by default, and updates the indexes of the
+        changed devices and links only.
+        :returns: the TopologyDiff of the previous and the reloaded topology, its affected_devices can be
+                  validated again with validate_topology(devices=diff.affected_devices)
+        """
+        topology_file = topology_file or self.topology_file
+        if topology_file is None:
+            raise TopologyException("reload failed: no topology file was loaded")
+        data = self._read_topology_file(topology_file)
+        topology_digest = snapshot.digest(data)
+        if self.inventory_data is not None and topology_digest == self._topology_digest:
+            self.topology_file = topology_file
+            return TopologyDiff()
+        inventory = topology_data.loads_inventory(data, use_fast_json=use_fast_json)
+        self.topology_file = topology_file
+        self._topology_digest = topology_digest
+        if self.inventory_data is None:
+            self.inventory_data = inventory
+            self._build_indexes()
+            return diff_inventories({}, inventory)
+
+        self._ensure_indexes()
+        with gc_paused():
+            diff = diff_inventories(self.inventory_data, inventory)
+        self.inventory_data = inventory
+        self._update_indexes(diff)
+        logger.info(str(diff))
+        return diff
+
+    def _read_topology_file(self, topology_file: str) -> bytes:
         try:
-            with open(topology_file) as reader:
-                self.inventory_data = json.load(
-                    reader, object_hook=topology_data.deserialization_hook
-                )
+            with open(topology_file, "rb") as reader:
+                return reader.read()
         except FileExceptions as e:
             self.inventory_data = None
             raise TopologyException(
                 f"Error reading topology configuration file {topology_file}"
             ) from e
-    
+
+    def _update_indexes(self, diff: TopologyDiff) -> None:
+        """
+        Updates the indexes of the previous inventory to the current one, the unchanged devices and links
+        of which are the objects of the previous inventory (see diff_inventories)
+        """
+        names = set(
+            diff.added_devices + diff.removed_devices + diff.changed_devices
+        )
+        if names:
+            current_devices = {}
+            for device in self.query("network/sites/devices"):
+                if device["name"] in names:
+                    current_devices.setdefault(device["name"], []).append(device)
+            for name in names:
+                for device in self._device_index.pop(name, []):
+                    for key, _ in self._device_interfaces(device):
+                        self._interface_index.pop(key, None)
+                for device in current_devices.get(name, []):
+                    self._device_index.setdefault(name, []).append(device)
+                    for key, interface in self._device_interfaces(device):
+                        self._interface_index.setdefault(key, interface)
+
+        if diff.added_links or diff.removed_links or diff.changed_links:
+            links = self._get_element_based_on_path(
+                "network/topology-l2l3", raise_exc_on_failure=False
+            )
+            if self._peer_index is None or links is None:
+                self._build_peer_index()
+            else:
+                changed_links = itertools.chain(
+                    diff.added_links, diff.removed_links, *diff.changed_links
+                )
+                keys = {
+                    key for link in changed_links for key, _ in self._link_peers(link)
+                }
+                for key in keys:
+                    self._peer_index.pop(key, None)
+                # the keys are resolved again over all the links, the first link of an interface wins
+                for link in links:
+                    for key, peer in self._link_peers(link):
+                        if key in keys:
+                            self._peer_index.setdefault(key, peer)
+
+        self._indexed_data = self.inventory_data
+        self._link_prefix_index = None
+        self._interface_address_index = None
+
+    def _snapshot_state(self) -> dict:
+        # pickled together, the indexes keep referencing the devices and interfaces of the inventory data
+        return {
+            "inventory_data": self.inventory_data,
+            "device_index": self._device_index,
+            "interface_index": self._interface_index,
+            "peer_index": self._peer_index,
+        }
+
+    def _restore_snapshot_state(self, state: dict) -> None:
+        self.inventory_data = state["inventory_data"]
+        self._device_index = state["device_index"]
+        self._interface_index = state["interface_index"]
+        self._peer_index = state["peer_index"]
+        self._indexed_data = self.inventory_data
+        self._link_prefix_index = None
+        self._interface_address_index = None
+
+    def _build_indexes(self) -> None:
+        self._build_device_index()
+        self._build_peer_index()
+        self._indexed_data = self.inventory_data
+        self._link_prefix_index = None
+        self._interface_address_index = None
+
+    def _ensure_indexes(self) -> None:
+        if self._indexed_data is not self.inventory_data:
+            self._build_indexes()
+
+    def _build_device_index(self) -> None:
+        device_index = {}
+        interface_index = {}
+        device: topology_data.Device
+        for device in self.query("network/sites/devices"):
+            device_index.setdefault(device["name"], []).append(device)
+            for key, interface in self._device_interfaces(device):
+                interface_index.setdefault(key, interface)
+        self._device_index = device_index
+        self._interface_index = interface_index
+
+    @staticmethod
+    def _device_interfaces(device: topology_data.Device):
+        """Yields the (device name, interface-id or loopback id) keys and the interfaces of the device"""
+        for interface in itertools.chain(
+            device.get("lags", []), device.get("ports", [])
+        ):
+            yield (device["name"], interface["interface-id"]), interface
+        for loopback in device.get("loopbacks", []):
+            yield (device["name"], loopback["id"]), loopback
+
+    def _build_peer_index(self) -> None:
+        links: list[topology_data.TopologyL2L3] = (
+            self._get_element_based_on_path(
+                "network/topology-l2l3", raise_exc_on_failure=False
+            )
+        )
+        if links is None:
+            # no index, so the lookups report the missing links
+            self._peer_index = None
+            return
+        peer_index = {}
+        for link in links:
+            # the first link of an interface wins, the a side before the z side
+            for key, peer in self._link_peers(link):
+                peer_index.setdefault(key, peer)
+        self._peer_index = peer_index
+
+    @staticmethod
+    def _link_peers(link: topology_data.TopologyL2L3):
+        """Yields the (device, interface) ends of the link with their peers, the a side first"""
+        yield (link["a"], link["a_interface"]), (link["z"], link["z_interface"])
+        yield (link["z"], link["z_interface"]), (link["a"], link["a_interface"])
+
+    def _ensure_address_indexes(self) -> None:
+        self._ensure_indexes()
+        if self._link_prefix_index is not None:
+            return
+        link_prefix_index = PrefixIndex()
+        link: topology_data.TopologyL2L3
+        for link in self.query("network/topology-l2l3"):
+            for subnet_key in topology_data.TOPOLOGY_L2L3_IP_ADDRESS_KEYS:
+                if link.get(subnet_key):
+                    link_prefix_index.add(link[subnet_key], link)
+        interface_address_index = {}
+        for device_name, devices in self._device_index.items():
+            for device in devices:
+                addresses = [
+                    (lag, lag.get(address_key))
+                    for lag in device.get("lags", [])
+                    for address_key in topology_data.LAG_IP_ADDRESS_KEYS
+                ] + [
+                    (loopback, loopback.get("ip_address"))
+                    for loopback in device.get("loopbacks", [])
+                ]
+                for interface, address in addresses:
+                    if not address:
+                        continue
+                    try:
+                        address = as_ip_address(address)
+                        key = (address.version, address.packed)
+                    except ValueError:
+                        logger.warning(f"ignoring invalid address {address} of {device_name}")
+                        continue
+                    interface_address_index.setdefault(key, (device_name, interface))
+        self._link_prefix_index = link_prefix_index
+        self._interface_address_index = interface_address_index
+
     def get_interfaces(self, device_name: str) -> InterfacesByDevice:
         """
         Returns a Tuple of
@@ -62,39 +295,38 @@ class TopologyManager(metaclass=Singleton):
         matching a device by device_name
         param: device_name: string representing the device name
         """
-
-        def get_device_data(
-            device_data: str, iterable: typing.Iterable[topology_data.Device]
-        ):
-            return list(
-                itertools.chain.from_iterable(
-                    device[device_data] for device in iterable
-                )
-            )
-
-        devices: list[topology_data.Device] = [
-            device
-            for device in (
-                self._get_element_based_on_path(
-                    "network/sites/devices", raise_exc_on_failure=False
-                )
-                or list()
-            )
-            if device["name"] == device_name
-        ]
-
-        lags: list[topology_data.Lag] = get_device_data("lags", devices)
-        ports: list[topology_data.Port] = get_device_data("ports", devices)
+        self._ensure_indexes()
+        devices = self._device_index.get(device_name, [])
+        lags: list[topology_data.Lag] = [lag for device in devices for lag in device["lags"]]
+        ports: list[topology_data.Port] = [port for device in devices for port in device["ports"]]
         # ports = [port for port in ports if port["bundle-member"] is False]
-        loopbacks: list[topology_data.Loopback] = get_device_data(
-            "loopbacks", devices
-        )
+        loopbacks: list[topology_data.Loopback] = [
+            loopback for device in devices for loopback in device["loopbacks"]
+        ]
         return (
             lags,
             ports,
             loopbacks,
         )
 
+    def get_device(self, device_name: str) -> topology_data.Device:
+        """
+        Returns the device of the name from network/sites/devices, or None
+        param: device_name: string representing the device name
+        """
+        self._ensure_indexes()
+        devices = self._device_index.get(device_name)
+        return devices[0] if devices else None
+
+    def get_interface(self, device_name: str, interface_id: str) -> dict:
+        """
+        Returns the lag, port or loopback of the device by its interface id (the id of a loopback), or None
+        param: device_name: string representing the device name
+        param: interface_id: the interface-id of the lag or port, e.g. "bundle-1"
+        """
+        self._ensure_indexes()
+        return self._interface_index.get((device_name, interface_id))
+
     def get_peer_interface(
         self, device_name: str, interface_name: str
     ) -> tuple[str, str]:
@@ -103,44 +335,36 @@ class TopologyManager(metaclass=Singleton):
         If it finds one and one end of the p2p link equals :py:data: `interface_name`, this function return the interface name of the other end of the link
         :returns: a tuple of (other_device, other_interface); if present, the string represents the peer device name andinterface name
         """
-        expected_topology: list[topology_data.TopologyL2L3] = (
+        self._ensure_indexes()
+        if self._peer_index is None:
+            # raises when the topology has no links
             self.get_expected_topology()
-        )
-        for topology in expected_topology:
-            other_device, other_interface = self._get_other_interface(
-                device_name, interface_name, topology, our_side="a"
-            )
-            if other_interface is not None:
-                return other_device, other_interface
-            other_device, other_interface = self._get_other_interface(
-                device_name, interface_name, topology, our_side="z"
-            )
-            if other_interface is not None:
-                return other_device, other_interface
+            self._peer_index = {}
+        return self._peer_index.get((device_name, interface_name), (None, None))
 
-        return None, None
+    def get_link_by_address(
+        self, address: str | topology_data.IpAddress
+    ) -> topology_data.TopologyL2L3:
+        """
+        Returns the topology-l2l3 link of the longest ipv4_subnet/ipv6_subnet containing the address, or None,
+        e.g. the link a route next-hop is reached through
+        param: address: an address, with or without a prefix length, e.g. "100.0.0.1"
+        """
+        self._ensure_address_indexes()
+        return self._link_prefix_index.lookup(address)
 
-    def _get_other_interface(
-        self,
-        device_name: str,
-        interface_name: str,
-        topology: topology_data.TopologyL2L3,
-        our_side: str,
-    ) -> tuple[str, str]:
-        our_device: str = topology["a"]
-        our_interface_name: str = topology["a_interface"]
-        other_device: str = topology["z"]
-        other_interface: str = topology["z_interface"]
-        if our_side == "z":
-            our_device: str = topology["z"]
-            our_interface_name: str = topology["z_interface"]
-            other_device: str = topology["a"]
-            other_interface: str = topology["a_interface"]
-        if device_name != our_device:
-            return None, None
-        if interface_name != our_interface_name:
-            return None, None
-        return other_device, other_interface
+    def get_interface_by_address(
+        self, address: str | topology_data.IpAddress
+    ) -> tuple[str, dict]:
+        """
+        Returns (device name, lag or loopback) of the interface having the address, or (None, None)
+        param: address: an address, with or without a prefix length, e.g. "100.0.0.1"
+        """
+        self._ensure_address_indexes()
+        address = as_ip_address(address)
+        return self._interface_address_index.get(
+            (address.version, address.packed), (None, None)
+        )
 
     def _get_device_by_name(
         self, device_name: str, all_devices: list[topology_data.Device]
@@ -156,6 +380,14 @@ class TopologyManager(metaclass=Singleton):
         paths: str = "network/topology-l2l3"
         return self._get_element_based_on_path(paths)
 
+    def query(self, path: str, raise_exc_on_failure=False):
+        """
+        Yields the elements of the topology data the path leads to, see topology/path_query.py
+        param: path: a string representing the path in the JSON file to the data of interest, can select
+               list elements by their fields, e.g. "network/sites/devices[name=tcr01]/ports"
+        """
+        return compile_path(path).iter(self.inventory_data, raise_exc_on_failure)
+
     def _get_element_based_on_path(
         self, paths: str, raise_exc_on_failure=True, prefix="", root_=None
     ):
@@ -165,51 +397,40 @@ class TopologyManager(metaclass=Singleton):
         parameter: raise_exc_on_failure boolean indicating wether exception should be raised if the path does not exist
                    when raise_exc_on_failure is False this function returns None
 
-        The following parameters are used only for the scope of invoking this function recursively and should not be explicitly set by
-         - prefix: a prefix of paths that is used for logging errors when that prefix is not found
-         - root_: root node which will be traversed
-        """
-
-        def split(path):
-            return [e for e in path.split("/") if e]
-
-        root: dict = root_ or self.inventory_data
-        paths = paths.strip("/")
-        for path in split(paths):
-            if isinstance(root, list):
-                remaining_path: str = paths.removeprefix(prefix.strip("/"))
-                lst = list()
-                for root_item in root:
-                    inner_element = self._get_element_based_on_path(
-                        paths=remaining_path,
-                        raise_exc_on_failure=raise_exc_on_failure,
-                        prefix=prefix,
-                        root_=root_item,
-                    )
-                    if inner_element is None:
-                        continue
-                    if isinstance(inner_element, list):
-                        lst.extend(inner_element)
-                    else:
-                        lst.append(inner_element)
-                if not lst:
-                    return
-                return lst
-
-            if path not in root.keys():
-                if raise_exc_on_failure is False:
-                    return
-                raise TopologyException(
-                    f"get_expected_topology failed: could not find path {prefix} in topology data"
-                )
-            prefix += path + "/"
-            root = root[path]
-        return root
+        The lists on the path are traversed, and the values found under their elements are returned as one list.
+        The paths are compiled once, see topology/path_query.py.
+        The following parameters are kept for backward compatibility and should not be explicitly set by
+         - prefix: unused
+         - root_: root node which will be traversed, the topology data by default
+        """
+        return compile_path(paths).get(
+            root_ or self.inventory_data, raise_exc_on_failure
+        )
 
-    def validate_topology(self, validation_types=None):
+    def validate_topology(
+        self,
+        validation_types=None,
+        max_workers=1,
+        raise_on_failure=True,
+        cache_commands=True,
+        devices=None,
+    ):
+        """
+        Runs the topology validators on the devices in the inventory, all of them by default.
+        Devices are validated in parallel, by up to max_workers threads. The validations of a device run
+        one after the other, in the order of validation_types, and a failure doesn't stop the next ones.
+        param: validation_types: list of TopologyValidationType to run, all of them by default
+        param: max_workers: maximum number of devices validated concurrently
+        param: raise_on_failure: whether to raise TopologyValidationFailed when any validation fails
+        param: cache_commands: whether the validators of a device share the outputs of the show commands
+               they send, so each distinct command is sent to a device once during the validation
+        param: devices: names of the devices to validate, e.g. the affected_devices of the TopologyDiff
+               returned by reload(), the devices missing from the inventory are skipped
+        :returns: a TopologyValidationReport of all the failures
+        """
         # the import is done here to avoid circular imports
-        from automation_utils.topology.topology_validators.topology_validator import TopologyValidatorRegistry
         from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
+        from automation_utils.topology.topology_validators.topology_validation_report import TopologyValidationReport
 
         if not validation_types:
             validation_types = [
@@ -220,11 +441,61 @@ class TopologyManager(metaclass=Singleton):
                 TopologyValidationType.ISIS_NEIGHBORS,
                 TopologyValidationType.BGP_NEIGHBORS,
             ]
-        
+
         all_devices = self.inventory_manager.devices
-        for device in all_devices:
+        if devices is not None:
+            all_devices = {
+                device: all_devices[device] for device in devices if device in all_devices
+            }
+        report = TopologyValidationReport(devices=list(all_devices))
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(all_devices) or 1)),
+            thread_name_prefix="topology-validation",
+        ) as executor:
+            device_failures = executor.map(
+                lambda device: self._validate_device(
+                    device,
+                    all_devices[device].vendor,
+                    validation_types,
+                    cache_commands,
+                ),
+                all_devices,
+            )
+            for failures in device_failures:
+                report.failures.extend(failures)
+
+        logger.debug(str(report))
+        if raise_on_failure and not report.passed:
+            raise TopologyValidationFailed(report)
+        return report
+
+    def _validate_device(
+        self, device, vendor, validation_types, cache_commands=True
+    ):
+        from automation_utils.topology.topology_validators.topology_validator import TopologyValidatorRegistry
+        from automation_utils.topology.topology_validators.topology_validation_report import TopologyValidationFailure
+
+        failures = []
+        cli_session = DeviceManager().cli_sessions.get(device)
+        with (
+            cli_session.cached_commands()
+            if cache_commands and cli_session
+            else contextlib.nullcontext()
+        ):
             for validation_type in validation_types:
-                TopologyValidatorRegistry.get_validator(validation_type,
-                                                        all_devices[device].vendor).validate(
-                    device
-                )
+                try:
+                    TopologyValidatorRegistry.get_validator(validation_type,
+                                                            vendor).validate(
+                        device
+                    )
+                except Exception as e:
+                    logger.error(f"{device}: {validation_type.value} validation failed: {e}")
+                    failures.append(
+                        TopologyValidationFailure(
+                            device=device,
+                            validation_type=validation_type,
+                            message=str(e) or type(e).__name__,
+                            exception=e,
+                        )
+                    )
+        return failures
@@ -1,3 +1,5 @@
+import ipaddress
+
 from automation_utils.common import exceptions
 import orbital.common as common
 from automation_utils.data_objects.bgp_summary import BgpSummary
@@ -5,7 +7,7 @@ from automation_utils.data_objects.config_protocols_bgp import ConfigProtocolsBg
 from automation_utils.helpers.deciphers.drivenets.bgp_summary import (
     BgpSummaryIpv4Decipher as DnosBgpIpv4Decipher,
 )
-from automation_utils.helpers.deciphers.drivenets.show_config_protocols_bgp import ShowConfigProtocolsBgpDecipher
+from automation_utils.helpers.deciphers.drivenets.config_tree import ConfigTreeDecipher
 from automation_utils.ssh_client import consts
 from automation_utils.topology.topology_validators.topology_validator import TopologyValidatorBase, TopologyValidatorRegistry
 from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
@@ -37,11 +39,20 @@ class BgpNeighborsValidator(TopologyValidatorBase):
         assert bgp_summary.as_number, f"{device}: Device asn: {bgp_summary.as_number} is invalid"
         assert bgp_summary.bgp_router_identifier, f"{device}: Device bgp router identifier: {bgp_summary.bgp_router_identifier} is invalid"
 
-        config_protocols_bgp: ConfigProtocolsBgp = self.device_manager.cli_sessions[device].send_command(
-            command=f"show config protocols bgp {bgp_summary.as_number} | inc neighbor",
-            decipher=ShowConfigProtocolsBgpDecipher
+        # the full config is fetched and parsed once per device and shared by the config based validators
+        config = self.device_manager.cli_sessions[device].send_command(
+            command="show config",
+            decipher=ConfigTreeDecipher
+        )
+        # the neighbors configured directly under bgp and under its neighbor-groups. Only IPv4 neighbors,
+        # as the ipv4 bgp summary is validated
+        config_protocols_bgp = ConfigProtocolsBgp(
+            neighbors_ip_addresses=[
+                neighbor
+                for neighbor in config.values("protocols", f"bgp {bgp_summary.as_number}", "**", "neighbor *")
+                if self._is_ipv4_address(neighbor)
+            ]
         )
-        # config_protocols_bgp is a list of the neighbors_ip_addresses
 
         for neighbor in config_protocols_bgp.neighbors_ip_addresses:
             assert neighbor in bgp_summary.neighbors, f"{device} - Interface: {neighbor} not found  in configured BGP interfaces"
@@ -52,3 +63,10 @@ class BgpNeighborsValidator(TopologyValidatorBase):
                 assert bgp_summary.neighbors[neighbor].state_pfx_accepted >= 0, f"{device} - Neighbor: {neighbor} - BGP neighbor state_pfx_accepted is less then 0"
             logger.debug(f"{device} - Neighbor: {neighbor} - BGP neighbors check passed")
         logger.debug(f"{device}: BGP neighbors check passed")
+
+    @staticmethod
+    def _is_ipv4_address(address: str) -> bool:
+        try:
+            return ipaddress.ip_address(address).version == 4
+        except ValueError:
+            return False
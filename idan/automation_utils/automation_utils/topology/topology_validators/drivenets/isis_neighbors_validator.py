@@ -1,5 +1,6 @@
 import orbital.common as common
-from automation_utils.helpers.deciphers.drivenets.isis_neighbors import IsisConfigDecipher, IsisNeighborsDecipher
+from automation_utils.helpers.deciphers.drivenets.config_tree import ConfigTreeDecipher
+from automation_utils.helpers.deciphers.drivenets.isis_neighbors import IsisNeighborsDecipher
 from automation_utils.topology.topology_validators.topology_validator import TopologyValidatorBase, TopologyValidatorRegistry
 from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
 from automation_utils.common.vendors import Vendors
@@ -13,11 +14,12 @@ class IsisNeighborsValidator(TopologyValidatorBase):
                  device: str, 
                  **kwargs):
         logger.debug(f"\n\nValidating ISIS neighbors for {device}")
-        isis_interfaces = self.device_manager.cli_sessions[device].send_command(
-            command="show config protocols isis", 
-            decipher=IsisConfigDecipher
+        config = self.device_manager.cli_sessions[device].send_command(
+            command="show config",
+            decipher=ConfigTreeDecipher
         )
-        # isis_interfaces is a dictionary of the configured Isis bundle interfaces.
+        # isis_interfaces is a set of the configured Isis bundle interfaces.
+        isis_interfaces = set(config.values("protocols", "isis", "**", "interface bundle-*"))
 
 
         """
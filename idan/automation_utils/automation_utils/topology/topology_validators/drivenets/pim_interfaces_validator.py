@@ -1,5 +1,6 @@
 import orbital.common as common
-from automation_utils.helpers.deciphers.drivenets.pim_protocol import PimConfigDecipher, PimNeighborsDecipher
+from automation_utils.helpers.deciphers.drivenets.config_tree import ConfigTreeDecipher
+from automation_utils.helpers.deciphers.drivenets.pim_protocol import PimNeighborsDecipher
 from automation_utils.topology.topology_validators.topology_validator import TopologyValidatorBase, TopologyValidatorRegistry
 from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
 from automation_utils.common.vendors import Vendors
@@ -13,18 +14,20 @@ class PimInterfacesValidator(TopologyValidatorBase):
                  device: str, 
                  **kwargs):
         logger.debug(f"\n\nValidating PIM interfaces for {device}")
-        pim_interfaces = self.device_manager.cli_sessions[device].send_command(
-            command="show config protocols pim", 
-            decipher=PimConfigDecipher
+        config = self.device_manager.cli_sessions[device].send_command(
+            command="show config",
+            decipher=ConfigTreeDecipher
         )
+        pim_interfaces = config.values("protocols", "pim", "**", "interface *")
         pim_neighbors = self.device_manager.cli_sessions[device].send_command(
             command="show pim neighbors", 
             decipher=PimNeighborsDecipher
         )
         lags, _, _ = self.topology_manager.get_interfaces(device)
+        lag_ids = {l["interface-id"] for l in lags}
         for lag in pim_interfaces:
             assert lag in pim_neighbors, f"{device} - Interface: {lag} not found in pim neighbors"
-            assert next((l for l in lags if l["interface-id"] == lag), None), f"{device} - Interface: {lag} not found in topology"
+            assert lag in lag_ids, f"{device} - Interface: {lag} not found in topology"
             assert pim_neighbors[lag].uptime, f"{device} - Interface: {lag} uptime is empty"
             logger.debug(f"{device} - Interface: {lag} PIM interface check passed")
         logger.debug(f"{device}: PIM neighbors check passed")
\ No newline at end of file
@@ -0,0 +1,41 @@
+import dataclasses
+
+from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
+
+
+@dataclasses.dataclass
+class TopologyValidationFailure:
+    device: str
+    validation_type: TopologyValidationType
+    message: str
+    exception: BaseException = dataclasses.field(repr=False, compare=False)
+
+    def __str__(self):
+        return f"{self.device} [{self.validation_type.value}]: {self.message}"
+
+
+@dataclasses.dataclass
+class TopologyValidationReport:
+    """
+    The result of validating the topology on a set of devices.
+    Every failed validation is recorded, the validation doesn't stop on the first failure.
+    """
+    devices: list[str] = dataclasses.field(default_factory=list)
+    failures: list[TopologyValidationFailure] = dataclasses.field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    @property
+    def failed_devices(self) -> list[str]:
+        return list(dict.fromkeys(failure.device for failure in self.failures))
+
+    def __str__(self):
+        if self.passed:
+            return f"Topology validation passed on {len(self.devices)} devices"
+        lines = [
+            f"Topology validation failed on {len(self.failed_devices)} out of {len(self.devices)} devices:"
+        ]
+        lines.extend(f" - {failure}" for failure in self.failures)
+        return "\n".join(lines)
@@ -0,0 +1,88 @@
+"""
+Benchmark of the memory of the deciphered data objects: the bytes per object and the construction time of the
+slotted dataclasses of automation_utils.data_objects vs. classes of the same fields with a per-instance __dict__,
+as the data objects were before. The field values are shared by all the objects, so only the objects are measured.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_data_objects
+"""
+
+import argparse
+import dataclasses
+import tracemalloc
+from time import perf_counter
+
+from automation_utils.data_objects.bgp_summary import BgpNeighbor
+from automation_utils.data_objects.interface_counters import InterfaceCounters
+from automation_utils.data_objects.interface_status import InterfaceStatus
+from automation_utils.data_objects.ip_route import IpRoute, NextHop
+from automation_utils.data_objects.isis_neighbors import IsisNeighbor
+from automation_utils.data_objects.lldp_neighbors import LldpNeighbor
+from automation_utils.data_objects.pim_data import PimData
+from automation_utils.data_objects.ping_data import PingResponse
+
+# the arguments of an object of every class
+OBJECTS = {
+    BgpNeighbor: ("96.109.183.47", "2d14h25m", 190),
+    InterfaceCounters: ("ge100-0/0/1", 10.06, 20.05),
+    InterfaceStatus: ("ge100-0/0/1", "enabled", "up"),
+    IsisNeighbor: ("tcr01.site10.cran1", "bundle-178", "Up", "2d2h56m11s"),
+    LldpNeighbor: ("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/1", 120),
+    PimData: ("2001:558:4c0:511::190", "bundle-340", "00:00:00"),
+    NextHop: ("96.217.1.205", "bundle-352", True, False, False),
+    IpRoute: ("1.1.1.0/24", "bgp", []),
+    PingResponse: ("1.1.1.1", "0.122", 0, 0, 0, 0, 0, 0, "64", "1", "64"),
+}
+
+
+def with_dict(cls: type) -> type:
+    """a class of the fields of the dataclass, whose objects have a __dict__"""
+    return dataclasses.make_dataclass(
+        cls.__name__, [(field.name, field.type) for field in dataclasses.fields(cls)]
+    )
+
+
+def bytes_per_object(cls: type, args: tuple, count: int) -> float:
+    objects = [None] * count
+    tracemalloc.start()
+    for i in range(count):
+        objects[i] = cls(*args)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / count
+
+
+def construction_time(cls: type, args: tuple, count: int, repeat: int) -> float:
+    """the best seconds per object"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(count):
+            cls(*args)
+        best = min(best, perf_counter() - start)
+    return best / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'':<20}{'bytes per object':^26}{'construction':^22}")
+    print(f"{'class':<20}{'__dict__':>10}{'slots':>8}{'saved':>8}{'__dict__':>12}{'slots':>10}")
+    for cls, arguments in OBJECTS.items():
+        legacy = with_dict(cls)
+        assert dataclasses.astuple(legacy(*arguments)) == dataclasses.astuple(cls(*arguments))
+        legacy_bytes = bytes_per_object(legacy, arguments, args.objects)
+        slotted_bytes = bytes_per_object(cls, arguments, args.objects)
+        legacy_time = construction_time(legacy, arguments, args.objects, args.repeat)
+        slotted_time = construction_time(cls, arguments, args.objects, args.repeat)
+        print(
+            f"{cls.__name__:<20}{legacy_bytes:>8.0f} B{slotted_bytes:>6.0f} B"
+            f"{1 - slotted_bytes / legacy_bytes:>8.0%}{legacy_time * 1e9:>9.0f} ns{slotted_time * 1e9:>7.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark of the per-line parse cost of the regex based deciphers on synthetic outputs: the patterns compiled, or
+looked up in the re cache, on every call and line before vs. the patterns compiled once at import in
+automation_utils.helpers.deciphers.patterns.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_decipher_patterns
+"""
+
+import argparse
+import re
+from time import perf_counter
+
+from automation_utils.data_objects.bgp_summary import BgpNeighbor, BgpSummary
+from automation_utils.data_objects.config_protocols_bgp import ConfigProtocolsBgp
+from automation_utils.helpers.deciphers.drivenets.bgp_summary import (
+    BgpSummaryIpv4Decipher,
+)
+from automation_utils.helpers.deciphers.drivenets.ping import DnosPingDecipher
+from automation_utils.helpers.deciphers.drivenets.show_config_protocols_bgp import (
+    ShowConfigProtocolsBgpDecipher,
+)
+
+from .cli_output_generator import ping, show_bgp_summary, show_config_protocols_bgp
+
+
+def legacy_bgp_summary(cli_response: str) -> BgpSummary:
+    as_number = None
+    bgp_router_identifier = None
+    neighbors = {}
+    lines = [line.strip() for line in cli_response.splitlines() if line.strip()]
+    for line in lines:
+        if "BGP router identifier" in line:
+            match = re.search(r"BGP router identifier (\S+), local AS number (\d+)", line)
+            if match:
+                bgp_router_identifier = match.group(1)
+                as_number = int(match.group(2))
+            break
+    for line in lines:
+        if re.match(r"^\d+\.\d+\.\d+\.\d+", line):
+            fields = line.split()
+            neighbors[fields[0]] = BgpNeighbor(
+                neighbor=fields[0],
+                up_down_time=fields[8],
+                state_pfx_accepted=legacy_state_pfx_accepted(fields[9]),
+            )
+    return BgpSummary(as_number, bgp_router_identifier, neighbors)
+
+
+def legacy_state_pfx_accepted(field: str) -> int | str:
+    if re.match(r"^([\s\d]+)$", field):
+        return int(field)
+    return field
+
+
+def legacy_config_protocols_bgp(cli_response: str) -> ConfigProtocolsBgp:
+    neighbors_ip_addresses = []
+    neighbor_pattern = r"neighbor\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
+    for match in re.finditer(neighbor_pattern, cli_response):
+        neighbors_ip_addresses.append(match.group(1))
+    return ConfigProtocolsBgp(neighbors_ip_addresses=neighbors_ip_addresses)
+
+
+def legacy_ping(cli_response: str) -> dict:
+    """the responses of DnosPingDecipher, parsed with its patterns compiled on every call"""
+    header = re.compile(
+        r"(/s+)?PING (?P<NAME>\S+)(\s+)?\((?P<IPD>\S+)\) (from (?P<IPS>\S+) (.*)?:)?"
+    )
+    pattern = re.compile(
+        "(?P<bytes>.*) bytes from (?P<source>.*): icmp_seq=(?P<sequence>.*) ttl=(?P<ttl>.*) time=(?P<time>.*) ms"
+    )
+    pattern1 = re.compile(
+        "(?P<bytes>.*) bytes from (?P<source>.*): icmp_seq=(?P<sequence>.*) ttl=(?P<ttl>.*)"
+    )
+    lines = cli_response.splitlines()
+    destination = header.match(lines[0]).groupdict()["IPD"]
+    responses = {}
+    for line in lines[1:]:
+        parsed_line = pattern.match(line) or pattern1.match(line)
+        if parsed_line:
+            responses[len(responses)] = DnosPingDecipher._arrange_response_line(parsed_line.groupdict())
+
+    pattern = re.compile("(?P<sent>.*) packets transmitted, (?P<received>.*) received.*")
+    pattern1 = re.compile(
+        "rtt min/avg/max/mdev = (?P<min_time>.*)/(?P<avg_time>.*)/(?P<max_time>.*)/(?P<std_dev>.*) ms"
+    )
+    summary = {"source": destination}
+    for line in lines:
+        parsed_line = pattern.match(line) or pattern1.match(line)
+        if parsed_line:
+            summary.update(parsed_line.groupdict())
+    responses[len(responses)] = DnosPingDecipher._arrange_response_line(summary, True)
+    return responses
+
+
+def new_ping(cli_response: str) -> dict:
+    return DnosPingDecipher.decipher(cli_response).responses
+
+
+def best_of(function, text: str, repeat: int) -> tuple:
+    result = function(text)
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        function(text)
+        best = min(best, perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    benchmarks = (
+        ("bgp summary", show_bgp_summary, legacy_bgp_summary, BgpSummaryIpv4Decipher.decipher),
+        (
+            "config bgp",
+            show_config_protocols_bgp,
+            legacy_config_protocols_bgp,
+            ShowConfigProtocolsBgpDecipher.decipher,
+        ),
+        ("ping", ping, legacy_ping, new_ping),
+    )
+    print(f"{'decipher':<14}{'legacy':>14}{'precompiled':>14}{'speedup':>10}")
+    for name, generate, legacy, new in benchmarks:
+        text = generate(args.lines)
+        lines = text.count("\n") + 1
+        legacy_result, legacy_time = best_of(legacy, text, args.repeat)
+        new_result, new_time = best_of(new, text, args.repeat)
+        assert legacy_result == new_result, name
+        print(
+            f"{name:<14}{legacy_time / lines * 1e9:>8.0f} ns/ln{new_time / lines * 1e9:>8.0f} ns/ln"
+            f"{legacy_time / new_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Benchmark of every decipher on large synthetic outputs (see cli_output_generator), reporting its throughput in
+lines/s and MB/s and its peak memory. The number of entries deciphered is checked against the generated one, so a
+decipher (or a generator) broken by a format change fails the benchmark instead of timing an empty result.
+
+The results can be saved as a baseline, and compared to it on a later run, which exits with status 1 when a
+decipher got slower, or its peak memory larger, than the baseline by more than the tolerance, e.g. in CI:
+    python -m tests.automation_utils_test.benchmarks.bench_deciphers --save baseline.json    # on the main branch
+    python -m tests.automation_utils_test.benchmarks.bench_deciphers --compare baseline.json
+
+IpRouteDecipher deciphers a single routing entry, its route dump measures the per-line cost of its line parser.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_deciphers
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+import typing
+from time import perf_counter
+
+from automation_utils.helpers.deciphers.arista import (
+    bgp_summary as arista_bgp_summary,
+    interface_counters as arista_interface_counters,
+    isis_neighbors as arista_isis_neighbors,
+    lldp_neighbors as arista_lldp_neighbors,
+)
+from automation_utils.helpers.deciphers.common.ip_route import IpRouteDecipher
+from automation_utils.helpers.deciphers.drivenets.bgp_summary import (
+    BgpSummaryIpv4Decipher,
+)
+from automation_utils.helpers.deciphers.drivenets.config_tree import ConfigTreeDecipher
+from automation_utils.helpers.deciphers.drivenets.interface_counters import (
+    InterfaceCountersDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.interface_status import (
+    InterfacesStatusDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.isis_neighbors import (
+    IsisConfigDecipher,
+    IsisNeighborsDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.lldp_neighbors import (
+    LldpNeighborsDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.pim_protocol import (
+    PimConfigDecipher,
+    PimNeighborsDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.ping import DnosPingDecipher
+from automation_utils.helpers.deciphers.drivenets.show_config_protocols_bgp import (
+    ShowConfigProtocolsBgpDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.system_status import (
+    SystemStatusDecipher,
+)
+
+from . import cli_output_generator as generator
+
+
+class Case(typing.NamedTuple):
+    name: str
+    decipher: typing.Callable[[str], typing.Any]
+    generate: typing.Callable[[int], str]
+    entries: int
+    # the number of entries of the deciphered result, None when it is not checked
+    count: typing.Callable[[typing.Any], int] | None
+
+
+CASES = (
+    Case("dnos interfaces", InterfacesStatusDecipher.decipher, generator.show_interfaces, 10000, len),
+    Case(
+        "dnos interfaces counters",
+        InterfaceCountersDecipher.decipher,
+        generator.show_interfaces_counters,
+        10000,
+        len,
+    ),
+    Case("dnos lldp neighbors", LldpNeighborsDecipher.decipher, generator.show_lldp_neighbors, 10000, len),
+    Case("dnos pim neighbors", PimNeighborsDecipher.decipher, generator.show_pim_neighbors, 10000, len),
+    # the cards are keyed by their type
+    Case("dnos system", SystemStatusDecipher.decipher, generator.show_system, 1000, None),
+    Case(
+        "dnos bgp summary",
+        BgpSummaryIpv4Decipher.decipher,
+        generator.show_bgp_summary,
+        5000,
+        lambda result: len(result.neighbors),
+    ),
+    Case(
+        "dnos config bgp",
+        ShowConfigProtocolsBgpDecipher.decipher,
+        generator.show_config_protocols_bgp,
+        5000,
+        lambda result: len(result.neighbors_ip_addresses),
+    ),
+    Case(
+        "dnos isis neighbors",
+        IsisNeighborsDecipher.decipher,
+        generator.show_isis_neighbors,
+        5000,
+        lambda result: len(result.neighbors),
+    ),
+    Case(
+        "dnos config tree",
+        ConfigTreeDecipher.decipher,
+        generator.show_config,
+        10000,
+        lambda result: len(result.find("interfaces", "*")),
+    ),
+    Case("dnos isis config", IsisConfigDecipher.decipher, generator.show_config, 10000, len),
+    # the interfaces of isis and pim
+    Case(
+        "dnos pim config",
+        PimConfigDecipher.decipher,
+        generator.show_config,
+        10000,
+        lambda result: len(result) // 2,
+    ),
+    Case(
+        "dnos ping",
+        DnosPingDecipher.decipher,
+        generator.ping,
+        1000000,
+        # the replies and the summary
+        lambda result: len(result.responses) - 1,
+    ),
+    Case(
+        "route dump",
+        IpRouteDecipher.decipher,
+        generator.show_route,
+        500000,
+        # 5 next hops per route
+        lambda result: len(result.next_hops) // 5,
+    ),
+    Case(
+        "arista bgp summary",
+        arista_bgp_summary.BgpSummaryDecipher.decipher,
+        generator.arista_bgp_summary,
+        5000,
+        lambda result: len(result.neighbors),
+    ),
+    Case(
+        "arista interface counters",
+        arista_interface_counters.InterfaceCountersDecipher.decipher,
+        generator.arista_interface_counters,
+        10000,
+        len,
+    ),
+    Case(
+        "arista isis neighbors",
+        arista_isis_neighbors.IsisNeighborsDecipher.decipher,
+        generator.arista_isis_neighbors,
+        5000,
+        lambda result: len(result.neighbors),
+    ),
+    Case(
+        "arista lldp neighbors",
+        arista_lldp_neighbors.LldpNeighborsDecipher.decipher,
+        generator.arista_lldp_neighbors,
+        10000,
+        len,
+    ),
+)
+
+
+def measure(case: Case, scale: float, repeat: int) -> dict:
+    """
+    :returns: the lines/s and MB/s of the best of the repeated runs, and the peak memory of a traced run,
+    the output itself excluded
+    :raises AssertionError: when the number of deciphered entries is not the generated one
+    """
+    entries = max(1, int(case.entries * scale))
+    cli_response = case.generate(entries)
+    lines = cli_response.count("\n") + 1
+    megabytes = len(cli_response) / 1024 / 1024
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        result = case.decipher(cli_response)
+        best = min(best, perf_counter() - start)
+    if case.count is not None:
+        count = case.count(result)
+        assert count == entries, f"{case.name}: deciphered {count} of {entries} entries"
+    del result
+
+    tracemalloc.start()
+    result = case.decipher(cli_response)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "entries": entries,
+        "lines": lines,
+        "megabytes": megabytes,
+        "lines_per_second": lines / best,
+        "megabytes_per_second": megabytes / best,
+        "peak_megabytes": peak / 1024 / 1024,
+    }
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """:returns: the deciphers slower, or with a larger peak memory, than the baseline by more than the tolerance"""
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or base["entries"] != result["entries"]:
+            continue
+        if result["lines_per_second"] < base["lines_per_second"] * (1 - tolerance):
+            found.append(
+                f"{name}: {result['lines_per_second']:,.0f} lines/s, baseline {base['lines_per_second']:,.0f}"
+            )
+        if result["peak_megabytes"] > base["peak_megabytes"] * (1 + tolerance):
+            found.append(
+                f"{name}: peak {result['peak_megabytes']:.1f} MB, baseline {base['peak_megabytes']:.1f} MB"
+            )
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies the number of entries of every output")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="", help="benchmark the deciphers whose name contains this text")
+    parser.add_argument("--save", help="save the results as a json baseline")
+    parser.add_argument("--compare", help="compare the results to a json baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print(f"{'decipher':<28}{'entries':>9}{'lines':>10}{'MB':>8}{'lines/s':>13}{'MB/s':>8}{'peak MB':>9}")
+    results = {}
+    for case in CASES:
+        if args.only not in case.name:
+            continue
+        result = results[case.name] = measure(case, args.scale, args.repeat)
+        print(
+            f"{case.name:<28}{result['entries']:>9}{result['lines']:>10}{result['megabytes']:>8.1f}"
+            f"{result['lines_per_second']:>13,.0f}{result['megabytes_per_second']:>8.1f}"
+            f"{result['peak_megabytes']:>9.1f}"
+        )
+
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            found = regressions(results, json.load(baseline_file), args.tolerance)
+        for regression in found:
+            print(f"regression: {regression}")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of exec channel commands: the time to collect a set of show commands on one transport,
+running them one after the other with SSHClient.execute_command vs. concurrently on multiplexed
+channels with SSHClient.execute_commands, for different command latencies.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_exec_channels
+"""
+
+import argparse
+from time import monotonic
+
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from ..fakes import FakeExecDevice
+
+
+def _responder(command):
+    return "\r\n".join(f"{command} line {i}" for i in range(200))
+
+
+def sequential(client, commands):
+    return [client.execute_command(command) for command in commands]
+
+
+def multiplexed(client, commands):
+    return client.execute_commands(commands)
+
+
+def run(collector, latency, commands):
+    """seconds to collect the commands and their outputs"""
+    client = SSHClient(hostname="bench", username="bench", password="bench")
+    client._session = FakeExecDevice(responder=_responder, latency=latency)
+    start = monotonic()
+    outputs = collector(client, commands)
+    return monotonic() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=12)
+    parser.add_argument(
+        "--latencies-ms", type=float, nargs="+", default=[1, 20, 80]
+    )
+    args = parser.parse_args()
+    commands = [f"show interfaces bundle-{i}" for i in range(args.commands)]
+
+    print(f"{'latency':>8}{'sequential':>14}{'multiplexed':>14}{'speedup':>10}")
+    for latency_ms in args.latencies_ms:
+        sequential_time, sequential_outputs = run(
+            sequential, latency_ms / 1000, commands
+        )
+        multiplexed_time, multiplexed_outputs = run(
+            multiplexed, latency_ms / 1000, commands
+        )
+        assert multiplexed_outputs == sequential_outputs
+        print(
+            f"{latency_ms:>6g}ms{sequential_time * 1000:>11.1f} ms{multiplexed_time * 1000:>11.1f} ms"
+            f"{sequential_time / multiplexed_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
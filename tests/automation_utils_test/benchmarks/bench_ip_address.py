@@ -0,0 +1,101 @@
+"""
+Benchmark of topology_data.IpAddress: the construction time and memory of a topology's worth of addresses,
+and the time of subnet containment checks, with the legacy dataclass (which consumers had to parse again
+with the ipaddress module for every check) vs. the slotted IpAddress, which packs the addresses once, on
+their first check.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_ip_address
+"""
+
+import gc
+import argparse
+import dataclasses
+import ipaddress
+import tracemalloc
+from time import perf_counter
+
+from automation_utils.topology.topology_data import IpAddress
+
+
+@dataclasses.dataclass
+class LegacyIpAddress:
+    """the IpAddress dataclass before the slotted IpAddress"""
+
+    address: str
+    subnet: str = dataclasses.field(init=False)
+    cidr_mask: int = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        subnet, cidr_mask = self.address.split("/")
+        self.cidr_mask = int(cidr_mask)
+        self.subnet = subnet
+
+
+def legacy_contains(subnet, address):
+    return ipaddress.ip_address(address.subnet) in ipaddress.ip_network(
+        subnet.address, strict=False
+    )
+
+
+def addresses(count):
+    """as many ipv4 and ipv6 addresses, like the topology-l2l3 links subnets"""
+    for index in range(count // 2):
+        yield f"100.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}/31"
+        yield f"2001:db8:1::{index >> 16:x}:{index & 0xffff:x}/127"
+
+
+def build(cls, texts):
+    """
+    the seconds and the bytes it takes to build the addresses, measured apart (tracemalloc is slow),
+    each with the previous addresses freed
+    """
+    gc.collect()
+    start = perf_counter()
+    objects = [cls(address=text) for text in texts]
+    elapsed = perf_counter() - start
+    del objects
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(address=text) for text in texts]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--addresses", type=int, default=200000)
+    parser.add_argument("--checks", type=int, default=20000)
+    args = parser.parse_args()
+    texts = list(addresses(args.addresses))
+
+    legacy_time, legacy_size = build(LegacyIpAddress, texts)
+    slotted_time, slotted_size = build(IpAddress, texts)
+    legacy = [LegacyIpAddress(address=text) for text in texts[: args.checks + 2]]
+    slotted = [IpAddress(address=text) for text in texts[: args.checks + 2]]
+
+    subnets = [(legacy[i], legacy[i + 2]) for i in range(0, args.checks, 2)]
+    start = perf_counter()
+    legacy_results = [legacy_contains(subnet, address) for subnet, address in subnets]
+    legacy_check_time = perf_counter() - start
+    subnets = [(slotted[i], slotted[i + 2]) for i in range(0, args.checks, 2)]
+    start = perf_counter()
+    slotted_results = [address in subnet for subnet, address in subnets]
+    slotted_check_time = perf_counter() - start
+    assert slotted_results == legacy_results
+
+    print(f"{args.addresses} addresses, {len(subnets)} containment checks")
+    print(f"{'':<18}{'build':>12}{'per object':>14}{'per check':>14}")
+    for name, elapsed, size, check_time in (
+        ("legacy dataclass", legacy_time, legacy_size, legacy_check_time),
+        ("slotted", slotted_time, slotted_size, slotted_check_time),
+    ):
+        print(
+            f"{name:<18}{elapsed * 1000:>9.1f} ms{size / args.addresses:>8.0f} bytes"
+            f"{check_time / len(subnets) * 1e6:>11.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of pipelined show commands: the time to run a set of show commands on one session,
+sending them one by one (waiting for the prompt after each command) vs. pipelined with
+SSHClient.execute_shell_commands, over links with different round-trip latencies.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_pipelined_commands
+"""
+
+import argparse
+from time import monotonic
+
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from ..fakes import FakeDevice
+
+PROMPT = "dnos# "
+
+
+def _responder(command):
+    return "\r\n".join(f"{command} line {i}" for i in range(20))
+
+
+def _client(device):
+    client = SSHClient(hostname="bench", username="bench", password="bench")
+    client.shell = device.channel
+    return client
+
+
+def sequential(client, commands):
+    return [
+        client.execute_shell_command(
+            command, shows_output=True, reconnect=False
+        )
+        for command in commands
+    ]
+
+
+def pipelined(client, commands):
+    return client.execute_shell_commands(
+        commands, shows_output=True, reconnect=False
+    )
+
+
+def run(sender, latency, commands):
+    """seconds to run the commands and their outputs"""
+    device = FakeDevice(responder=_responder, prompt=PROMPT, latency=latency)
+    client = _client(device)
+    start = monotonic()
+    outputs = sender(client, commands)
+    elapsed = monotonic() - start
+    device.close()
+    return elapsed, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=12)
+    parser.add_argument(
+        "--latencies-ms", type=float, nargs="+", default=[1, 20, 80]
+    )
+    args = parser.parse_args()
+    commands = [f"show interfaces bundle-{i}" for i in range(args.commands)]
+
+    print(f"{'RTT':>8}{'sequential':>14}{'pipelined':>14}{'speedup':>10}")
+    for latency_ms in args.latencies_ms:
+        sequential_time, sequential_outputs = run(
+            sequential, latency_ms / 1000, commands
+        )
+        pipelined_time, pipelined_outputs = run(
+            pipelined, latency_ms / 1000, commands
+        )
+        assert pipelined_outputs == sequential_outputs
+        print(
+            f"{latency_ms:>6g}ms{sequential_time * 1000:>11.1f} ms{pipelined_time * 1000:>11.1f} ms"
+            f"{sequential_time / pipelined_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
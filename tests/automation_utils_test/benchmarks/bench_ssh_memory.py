@@ -0,0 +1,75 @@
+"""
+Memory profile of accumulating a large shell output, as read by SSHClient in MAX_BUFFER sized chunks.
+Compares decoding every chunk and concatenating strings (the legacy read path) with OutputBuffer,
+which accumulates raw bytes and decodes them once.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_ssh_memory
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from automation_utils.ssh_client import consts
+from automation_utils.ssh_client.output_buffer import (
+    OutputBuffer,
+    strip_ansi_escape_codes,
+)
+
+# a multi-byte char in every line, so some of them are split between chunks
+LINE = "| ge100-0/0/1  | enabled | up | \x1b[92m✓\x1b[0m | 10.0.0.1/31 | 9192 |\r\n"
+
+
+def synthetic_output(megabytes):
+    line = LINE.encode()
+    return line * int(megabytes * 1024 * 1024 / len(line)) + b"dnos# "
+
+
+def chunks(raw_output):
+    for i in range(0, len(raw_output), consts.MAX_BUFFER):
+        yield raw_output[i : i + consts.MAX_BUFFER]
+
+
+def legacy_read(raw_output):
+    output = ""
+    for chunk in chunks(raw_output):
+        output += chunk.decode("utf-8", "ignore")
+    return strip_ansi_escape_codes(output)
+
+
+def buffered_read(raw_output):
+    output = OutputBuffer()
+    for chunk in chunks(raw_output):
+        output.feed(chunk)
+    return output.getvalue()
+
+
+def profile(read, raw_output):
+    tracemalloc.start()
+    start = perf_counter()
+    output = read(raw_output)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output-mb", type=float, default=100)
+    args = parser.parse_args()
+
+    raw_output = synthetic_output(args.output_mb)
+    expected = strip_ansi_escape_codes(raw_output.decode())
+    print(f"{'reader':<16}{'time':>10}{'peak memory':>16}{'lost chars':>12}")
+    for name, read in (("legacy", legacy_read), ("output buffer", buffered_read)):
+        output, elapsed, peak = profile(read, raw_output)
+        print(
+            f"{name:<16}{elapsed:>9.2f}s{peak / 1024 / 1024:>13.1f} MB"
+            f"{len(expected) - len(output):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark of the SSHClient shell read loop: CPU used by idle sessions, per-command latency and
+the time to read a large output that trickles in with quiet gaps between the chunks.
+Compares the current SSHClient._read_until_match with the legacy sleep-polling loop.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_ssh_read
+"""
+
+import re
+import time
+import argparse
+import threading
+from time import sleep, monotonic
+
+from automation_utils.common import exceptions
+from automation_utils.ssh_client import consts
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from ..fakes import FakeDevice
+
+PROMPT = "dnos# "
+ENDSWITH = ("# ", "$ ", "> ", "#")
+
+
+def legacy_read_until_match(channel, time_stop, match, endswith=None):
+    """the sleep-polling loop SSHClient used before the reads became event driven"""
+    output = ""
+    last_output_len = len(output)
+    endswith_last_line = None
+    while True:
+        while channel.recv_ready():
+            output += channel.recv(consts.MAX_BUFFER).decode("utf-8", "ignore")
+        if last_output_len == len(output):
+            output = SSHClient.strip_ansi_escape_codes(output)
+            last_line = output.splitlines()
+            _match = None
+            if endswith and last_line:
+                if last_line[-1].endswith(endswith):
+                    if last_line == endswith_last_line:
+                        _match = re.match(match, output, re.DOTALL)
+                    else:
+                        endswith_last_line = last_line
+            else:
+                _match = re.match(match, output, re.DOTALL)
+            if _match:
+                return _match.group(1).rstrip()
+        last_output_len = len(output)
+        sleep(0.0025)
+        if monotonic() > time_stop:
+            raise exceptions.ExecutionTimeout("timeout", output)
+
+
+def _client():
+    return SSHClient(hostname="bench", username="bench", password="bench")
+
+
+def _readers():
+    client = _client()
+    return {
+        "legacy polling": legacy_read_until_match,
+        "event driven": lambda channel, time_stop, match, endswith: client._read_until_match(
+            channel, time_stop, match=match, endswith=endswith
+        ),
+    }
+
+
+def idle_cpu(reader, sessions, seconds):
+    """CPU seconds consumed per idle session per wall-clock second"""
+    devices = [FakeDevice(prompt=PROMPT) for _ in range(sessions)]
+    match = SSHClient.PROMPT_REGEX.format(cmd=re.escape("show system"))
+
+    def wait_silently(device):
+        try:
+            reader(device.channel, monotonic() + seconds, match, ENDSWITH)
+        except exceptions.ExecutionTimeout:
+            pass
+
+    threads = [
+        threading.Thread(target=wait_silently, args=(device,))
+        for device in devices
+    ]
+    cpu_start = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu = time.process_time() - cpu_start
+    for device in devices:
+        device.close()
+    return cpu / sessions / seconds
+
+
+def command_latency(reader, commands):
+    """average seconds from sending a command until its output is returned"""
+    device = FakeDevice(responder=lambda command: "output line\r\n" * 10, prompt=PROMPT)
+    total = 0.0
+    for i in range(commands):
+        command = f"show system {i}"
+        match = SSHClient.PROMPT_REGEX.format(cmd=re.escape(command))
+        start = monotonic()
+        device.channel.sendall(f"{command}\n")
+        reader(device.channel, start + 10, match, ENDSWITH)
+        total += monotonic() - start
+    device.close()
+    return total / commands
+
+
+def large_output(reader, megabytes):
+    """seconds to read an output of the given size, arriving in 16KB chunks 5 ms apart"""
+    line = "10.0.0.0/24  via 192.168.0.1, bundle-1  isis  115/20\r\n"
+    lines = int(megabytes * 1024 * 1024 / len(line))
+    device = FakeDevice(
+        responder=lambda command: line * lines,
+        prompt=PROMPT,
+        chunk_size=16384,
+        chunk_delay=0.005,
+    )
+    command = "show route"
+    match = SSHClient.PROMPT_REGEX.format(cmd=re.escape(command))
+    start = monotonic()
+    device.channel.sendall(f"{command}\n")
+    reader(device.channel, start + 3600, match, ENDSWITH)
+    elapsed = monotonic() - start
+    device.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--idle-seconds", type=float, default=3)
+    parser.add_argument("--commands", type=int, default=500)
+    parser.add_argument("--output-mb", type=float, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'reader':<16}{'idle CPU/session':>20}{'command latency':>20}"
+        f"{f'{args.output_mb:g}MB output':>20}"
+    )
+    for name, reader in _readers().items():
+        cpu = idle_cpu(reader, args.sessions, args.idle_seconds)
+        latency = command_latency(reader, args.commands)
+        read_time = large_output(reader, args.output_mb)
+        print(
+            f"{name:<16}{cpu * 100:>19.3f}%{latency * 1000:>17.3f} ms"
+            f"{read_time:>18.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of deciphering a large show command output while it is received: SSHClient.execute_shell_command
+reading the whole output before deciphering it vs. streaming the output to the decipher with output_stream,
+as CliSession.send_command does for the deciphers supporting it. Reports the time and the peak memory.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_streaming_decipher
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter, sleep
+
+from automation_utils.helpers.deciphers.drivenets.interface_counters import (
+    InterfaceCountersDecipher,
+)
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .cli_output_generator import show_interfaces_counters
+from ..fakes import FakeDevice
+
+PROMPT = "dnos# "
+COMMAND = "show interfaces counters | no-more"
+
+
+class ReplayDevice(FakeDevice):
+    """
+    Replays a reply encoded in advance, so its memory is not part of the measured peak.
+    A chunk is sent once the previous one was read, as a transport window would, instead of buffering the
+    whole reply in the channel.
+    """
+
+    def __init__(self, reply: bytes, **kwargs):
+        self.reply = reply
+        super().__init__(**kwargs)
+
+    def _reply(self, command):
+        with memoryview(self.reply) as reply:
+            for i in range(0, len(reply), self.chunk_size):
+                while self.channel.recv_ready():
+                    sleep(0.0001)
+                self.channel.feed(reply[i : i + self.chunk_size])
+
+
+def whole_output(client):
+    output = client.execute_shell_command(COMMAND, shows_output=True, reconnect=False)
+    return InterfaceCountersDecipher.decipher(output)
+
+
+def streamed_output(client):
+    stream = InterfaceCountersDecipher.streaming()
+    client.execute_shell_command(
+        COMMAND, shows_output=True, reconnect=False, output_stream=stream
+    )
+    return stream.finish()
+
+
+def profile(read, reply):
+    device = ReplayDevice(reply, prompt=PROMPT, chunk_size=16384)
+    client = SSHClient(hostname="bench", username="bench", password="bench")
+    client.shell = device.channel
+    tracemalloc.start()
+    start = perf_counter()
+    result = read(client)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    device.close()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--interfaces", type=int, default=100000)
+    args = parser.parse_args()
+
+    output = show_interfaces_counters(args.interfaces).replace("\n", "\r\n")
+    reply = f"{COMMAND}\r\n{output}\r\n{PROMPT}".encode()
+    print(f"{len(reply) / 1024 / 1024:.1f} MB output of {args.interfaces} interfaces")
+    print(f"{'reader':<16}{'time':>10}{'peak memory':>16}")
+    results = []
+    for name, read in (("whole output", whole_output), ("streamed", streamed_output)):
+        result, elapsed, peak = profile(read, reply)
+        results.append(result)
+        print(f"{name:<16}{elapsed:>9.2f}s{peak / 1024 / 1024:>13.1f} MB")
+    assert results[0] == results[1] and len(results[0]) == args.interfaces
+
+
+if __name__ == "__main__":
+    main()
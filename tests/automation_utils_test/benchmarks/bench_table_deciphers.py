@@ -0,0 +1,93 @@
+"""
+Benchmark of the DNOS table deciphers on synthetic outputs: the hand-written parsing they did before (every
+line stripped, split and all its fields stripped) vs. the declarative tables of
+automation_utils.helpers.deciphers.common.table.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_table_deciphers
+"""
+
+import argparse
+from time import perf_counter
+
+from automation_utils.data_objects.interface_counters import InterfaceCounters
+from automation_utils.data_objects.interface_status import InterfaceStatus
+from automation_utils.helpers.deciphers.drivenets.interface_counters import (
+    InterfaceCountersDecipher,
+)
+from automation_utils.helpers.deciphers.drivenets.interface_status import (
+    InterfacesStatusDecipher,
+)
+
+from .cli_output_generator import show_interfaces, show_interfaces_counters
+
+
+def legacy_interfaces_status(cli_response: str) -> dict:
+    interfaces = {}
+    for line in cli_response.strip().split("\n")[2:]:
+        if not line.strip():
+            continue
+        fields = [field.strip() for field in line.split("|")]
+        fields = [f for f in fields if f]
+        if len(fields) >= 3:
+            interfaces[fields[0]] = InterfaceStatus(
+                interface=fields[0], admin_status=fields[1], operational_status=fields[2]
+            )
+    return interfaces
+
+
+def legacy_interface_counters(cli_response: str) -> dict:
+    counters_dict = {}
+    lines = [line.strip() for line in cli_response.splitlines() if line.strip()]
+    for line in lines[2:]:
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) < 9:
+            continue
+        counters_dict[fields[1]] = InterfaceCounters(
+            interface_name=fields[1], rx_mbps=float(fields[3]), tx_mbps=float(fields[4])
+        )
+    return counters_dict
+
+
+def timed(function, cli_response: str, repeat: int):
+    """the best seconds per call, and the result"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function(cli_response)
+        best = min(best, perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--interfaces", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'decipher':<28}{'legacy':>12}{'table':>12}{'speedup':>10}")
+    for name, cli_response, legacy, decipher in (
+        (
+            "show interfaces",
+            show_interfaces(args.interfaces),
+            legacy_interfaces_status,
+            InterfacesStatusDecipher.decipher,
+        ),
+        (
+            "show interfaces counters",
+            show_interfaces_counters(args.interfaces),
+            legacy_interface_counters,
+            InterfaceCountersDecipher.decipher,
+        ),
+    ):
+        legacy_time, legacy_result = timed(legacy, cli_response, args.repeat)
+        table_time, result = timed(decipher, cli_response, args.repeat)
+        assert result == legacy_result and len(result) == args.interfaces
+        print(
+            f"{name:<28}{legacy_time * 1000:>9.1f} ms{table_time * 1000:>9.1f} ms"
+            f"{legacy_time / table_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
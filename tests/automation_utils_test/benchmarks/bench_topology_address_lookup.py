@@ -0,0 +1,77 @@
+"""
+Benchmark of TopologyManager address lookups on a synthetic topology: finding the topology-l2l3 link owning
+a next-hop address by a scan of all the links (parsing their subnets with the ipaddress module, as done by
+hand before) vs. TopologyManager.get_link_by_address and its prefix index.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_address_lookup
+"""
+
+import random
+import argparse
+import ipaddress
+from time import perf_counter
+
+from automation_utils.topology import topology_data
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .topology_generator import synthetic_topology
+
+
+def legacy_get_link_by_address(manager, address):
+    """the longest subnet containing the address, by a scan of all the links"""
+    address = ipaddress.ip_address(address)
+    best, best_length = None, -1
+    for link in manager.get_expected_topology():
+        for subnet_key in ("ipv4_subnet", "ipv6_subnet"):
+            network = ipaddress.ip_network(link[subnet_key].address, strict=False)
+            if address in network and network.prefixlen > best_length:
+                best, best_length = link, network.prefixlen
+    return best
+
+
+def timed(function, addresses):
+    """seconds per lookup, and the found links"""
+    start = perf_counter()
+    links = [function(address) for address in addresses]
+    return (perf_counter() - start) / len(addresses), links
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    manager = TopologyManager()
+    manager.inventory_data = topology_data.convert_ip_addresses(
+        synthetic_topology(links=args.links)
+    )
+    randomizer = random.Random(0)
+    addresses = []
+    for _ in range(args.lookups):
+        link = randomizer.choice(manager.get_expected_topology())
+        subnet = link[randomizer.choice(("ipv4_subnet", "ipv6_subnet"))]
+        addresses.append(str(subnet.network.network_address + randomizer.randint(0, 1)))
+    addresses.append("192.0.2.1")
+
+    start = perf_counter()
+    manager.get_link_by_address(addresses[0])
+    build_time = perf_counter() - start
+    legacy_time, legacy_links = timed(
+        lambda address: legacy_get_link_by_address(manager, address), addresses
+    )
+    indexed_time, indexed_links = timed(manager.get_link_by_address, addresses)
+    assert [id(link) for link in indexed_links] == [id(link) for link in legacy_links]
+
+    print(f"{args.links} links, index built on the first lookup in {build_time * 1000:.1f} ms")
+    print(f"{'lookup':<28}{'per lookup':>14}")
+    for name, per_lookup in (
+        ("scan of the links", legacy_time),
+        ("get_link_by_address", indexed_time),
+    ):
+        print(f"{name:<28}{per_lookup * 1e6:>11.2f} us")
+
+
+if __name__ == "__main__":
+    main()
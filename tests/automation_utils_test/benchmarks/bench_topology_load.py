@@ -0,0 +1,101 @@
+"""
+Benchmark of the topology load: the time to parse a synthetic topology file with json.load and the
+topology_data.deserialization_hook on every dict (the legacy load), vs. topology_data.load_inventory with
+the json module and with orjson/ujson (when installed), both converting the addresses in a post-pass.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_load
+"""
+
+import os
+import json
+import argparse
+import tempfile
+from time import perf_counter
+
+from automation_utils.topology import topology_data
+
+from .topology_generator import write_topology
+
+
+def legacy_is_instance_of(instance, t):
+    """the key set comparison deserialization_hook did before the precomputed key sets"""
+    return set(t.__annotations__.keys()) == set(instance.keys())
+
+
+def legacy_deserialization_hook(d):
+    if legacy_is_instance_of(d, topology_data.TopologyL2L3):
+        for ip_address_key in ["ipv4_subnet", "ipv6_subnet"]:
+            d[ip_address_key] = topology_data.IpAddress(address=d[ip_address_key])
+    elif legacy_is_instance_of(d, topology_data.Lag):
+        for ip_address_key in ["ipv4_address", "ipv6_address"]:
+            d[ip_address_key] = topology_data.IpAddress(address=d[ip_address_key])
+    return d
+
+
+def legacy_load(path):
+    with open(path) as reader:
+        return json.load(reader, object_hook=legacy_deserialization_hook)
+
+
+def hook_load(path):
+    with open(path) as reader:
+        return json.load(reader, object_hook=topology_data.deserialization_hook)
+
+
+def load(path, use_fast_json):
+    with open(path, "rb") as reader:
+        return topology_data.load_inventory(reader, use_fast_json=use_fast_json)
+
+
+def timed(function, repeat):
+    """the best time of repeat runs, and the result"""
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_topology(
+            os.path.join(directory, "topology.json"), links=args.links
+        )
+        size = os.path.getsize(path)
+        loaders = [
+            ("json.load, legacy hook", lambda: legacy_load(path)),
+            ("json.load, hook", lambda: hook_load(path)),
+            ("json, post-pass", lambda: load(path, use_fast_json=False)),
+        ]
+        if topology_data.fast_json is not None:
+            loaders.append(
+                (
+                    f"{topology_data.fast_json.__name__}, post-pass",
+                    lambda: load(path, use_fast_json=True),
+                )
+            )
+
+        print(f"{args.links} links, {size / 1e6:.1f} MB")
+        print(f"{'loader':<26}{'time':>12}{'MB/s':>10}{'speedup':>10}")
+        baseline, expected = None, None
+        for name, loader in loaders:
+            elapsed, inventory = timed(loader, args.repeat)
+            if expected is None:
+                baseline, expected = elapsed, inventory
+            assert inventory == expected, name
+            print(
+                f"{name:<26}{elapsed * 1000:>9.1f} ms{size / 1e6 / elapsed:>10.1f}"
+                f"{baseline / elapsed:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of TopologyManager lookups on a synthetic topology, legacy scans vs. the indexes built by
+TopologyManager.load:
+ - get_peer_interface of every port of every device (what the LLDP validator does)
+ - get_interfaces of every device (what the interfaces, LLDP and PIM validators do)
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_lookup
+"""
+
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .topology_generator import write_topology
+
+
+def legacy_get_peer_interface(manager, device_name, interface_name):
+    """the lookup TopologyManager did before the peer index: a scan of all the links, per lookup"""
+    for link in manager.get_expected_topology():
+        if link["a"] == device_name and link["a_interface"] == interface_name:
+            return link["z"], link["z_interface"]
+        if link["z"] == device_name and link["z_interface"] == interface_name:
+            return link["a"], link["a_interface"]
+    return None, None
+
+
+def legacy_get_interfaces(manager, device_name):
+    """the lookup TopologyManager did before the device index: a walk of the whole devices tree, per lookup"""
+    devices = [
+        device
+        for device in manager._get_element_based_on_path(
+            "network/sites/devices", raise_exc_on_failure=False
+        )
+        or list()
+        if device["name"] == device_name
+    ]
+    return (
+        [lag for device in devices for lag in device["lags"]],
+        [port for device in devices for port in device["ports"]],
+        [loopback for device in devices for loopback in device["loopbacks"]],
+    )
+
+
+def interfaces_of_all(manager, get_interfaces, max_lookups):
+    """seconds per lookup and the interfaces of the first max_lookups devices"""
+    names = list(manager._device_index)[:max_lookups]
+    start = perf_counter()
+    interfaces = [get_interfaces(name) for name in names]
+    return (perf_counter() - start) / len(names), interfaces
+
+
+def lookup_all(manager, get_peer, max_lookups):
+    """seconds per lookup and the peers of the first max_lookups ports"""
+    ports = [
+        (device["name"], port["interface-id"])
+        for device in manager._get_element_based_on_path("network/sites/devices")
+        for port in device["ports"]
+    ][:max_lookups]
+    start = perf_counter()
+    peers = [get_peer(device, interface) for device, interface in ports]
+    return (perf_counter() - start) / len(ports), peers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=10000)
+    parser.add_argument(
+        "--legacy-lookups",
+        type=int,
+        default=500,
+        help="the legacy lookups are slow, only this many are timed",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_topology(
+            os.path.join(directory, "topology.json"), links=args.links
+        )
+        manager = TopologyManager()
+        start = perf_counter()
+        manager.load(path)
+        load_time = perf_counter() - start
+
+    legacy_time, legacy_peers = lookup_all(
+        manager,
+        lambda device, interface: legacy_get_peer_interface(manager, device, interface),
+        args.legacy_lookups,
+    )
+    indexed_time, indexed_peers = lookup_all(
+        manager, manager.get_peer_interface, 2 * args.links
+    )
+    assert indexed_peers[: len(legacy_peers)] == legacy_peers
+
+    device_count = len(manager._device_index)
+    legacy_interfaces_time, legacy_interfaces = interfaces_of_all(
+        manager,
+        lambda name: legacy_get_interfaces(manager, name),
+        args.legacy_lookups,
+    )
+    indexed_interfaces_time, indexed_interfaces = interfaces_of_all(
+        manager, manager.get_interfaces, device_count
+    )
+    assert indexed_interfaces[: len(legacy_interfaces)] == legacy_interfaces
+
+    print(
+        f"{args.links} links, {device_count} devices, load (including the indexes) {load_time * 1000:.1f} ms"
+    )
+    print(f"{'lookup':<28}{'per lookup':>14}{'all':>14}")
+    for name, per_lookup, count in (
+        ("get_peer_interface legacy", legacy_time, 2 * args.links),
+        ("get_peer_interface", indexed_time, 2 * args.links),
+        ("get_interfaces legacy", legacy_interfaces_time, device_count),
+        ("get_interfaces", indexed_interfaces_time, device_count),
+    ):
+        print(f"{name:<28}{per_lookup * 1e6:>11.2f} us{per_lookup * count:>12.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark of topology path queries: the time of repeated TopologyManager._get_element_based_on_path
+queries on a synthetic topology, with the legacy recursive traversal vs. the compiled path queries.
+The paths crossing nested lists are only timed compiled, the legacy traversal did not resolve them.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_path_query
+"""
+
+import argparse
+from time import perf_counter
+
+from automation_utils.common.exceptions import TopologyException
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .topology_generator import synthetic_topology
+
+# paths crossing at most one list, the legacy traversal handles them
+PATHS = (
+    "network/topology-l2l3",
+    "network/sites/devices",
+    "network/sites/name",
+    "network/asn",
+    "network/sites/devices/missing",
+)
+
+# paths crossing nested lists, the legacy traversal lost the values under the second list (None, or a
+# TopologyException when raising), they are checked against the expected values instead
+NESTED_PATHS = {
+    "network/sites/devices/ports": lambda data: [
+        port
+        for site in data["network"]["sites"]
+        for device in site["devices"]
+        for port in device["ports"]
+    ],
+    "network/sites/devices/lags/ipv4_address": lambda data: [
+        lag["ipv4_address"]
+        for site in data["network"]["sites"]
+        for device in site["devices"]
+        for lag in device["lags"]
+    ],
+}
+
+
+def legacy_get_element_based_on_path(
+    inventory_data, paths, raise_exc_on_failure=True, prefix="", root_=None
+):
+    """the recursive traversal TopologyManager used before the compiled path queries"""
+
+    def split(path):
+        return [e for e in path.split("/") if e]
+
+    root = root_ or inventory_data
+    paths = paths.strip("/")
+    for path in split(paths):
+        if isinstance(root, list):
+            remaining_path = paths.removeprefix(prefix.strip("/"))
+            lst = list()
+            for root_item in root:
+                inner_element = legacy_get_element_based_on_path(
+                    inventory_data,
+                    paths=remaining_path,
+                    raise_exc_on_failure=raise_exc_on_failure,
+                    prefix=prefix,
+                    root_=root_item,
+                )
+                if inner_element is None:
+                    continue
+                if isinstance(inner_element, list):
+                    lst.extend(inner_element)
+                else:
+                    lst.append(inner_element)
+            if not lst:
+                return
+            return lst
+
+        if path not in root.keys():
+            if raise_exc_on_failure is False:
+                return
+            raise TopologyException(
+                f"get_expected_topology failed: could not find path {prefix} in topology data"
+            )
+        prefix += path + "/"
+        root = root[path]
+    return root
+
+
+def _result(get, path, raise_exc_on_failure):
+    try:
+        return get(path, raise_exc_on_failure)
+    except TopologyException:
+        return TopologyException
+
+
+def timed(function, repeat):
+    start = perf_counter()
+    for _ in range(repeat):
+        function()
+    return (perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    manager = TopologyManager()
+    manager.inventory_data = synthetic_topology(links=args.links)
+
+    def legacy(path, raise_exc_on_failure=True):
+        return legacy_get_element_based_on_path(
+            manager.inventory_data, path, raise_exc_on_failure
+        )
+
+    print(f"{'path':<45}{'legacy':>12}{'compiled':>12}{'speedup':>10}")
+    for path in PATHS:
+        for raise_exc_on_failure in (True, False):
+            assert _result(
+                manager._get_element_based_on_path, path, raise_exc_on_failure
+            ) == _result(legacy, path, raise_exc_on_failure), path
+        legacy_time = timed(lambda: legacy(path, False), args.repeat)
+        compiled_time = timed(
+            lambda: manager._get_element_based_on_path(path, False), args.repeat
+        )
+        print(
+            f"{path:<45}{legacy_time * 1e6:>9.1f} us{compiled_time * 1e6:>9.1f} us"
+            f"{legacy_time / compiled_time:>9.1f}x"
+        )
+
+    for path, expected in NESTED_PATHS.items():
+        assert manager._get_element_based_on_path(path) == expected(
+            manager.inventory_data
+        ), path
+        compiled_time = timed(
+            lambda: manager._get_element_based_on_path(path, False), args.repeat
+        )
+        print(f"{path:<45}{'-':>12}{compiled_time * 1e6:>9.1f} us{'-':>10}")
+
+    name = manager.inventory_data["network"]["sites"][-1]["devices"][-1]["name"]
+    assert list(manager.query(f"network/sites/devices[name={name}]/ports")) == [
+        port
+        for device in legacy("network/sites/devices")
+        if device["name"] == name
+        for port in device["ports"]
+    ]
+
+
+if __name__ == "__main__":
+    main()
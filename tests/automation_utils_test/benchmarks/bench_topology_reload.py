@@ -0,0 +1,72 @@
+"""
+Benchmark of TopologyManager.reload: the time to take a small change of a synthetic topology file (a link
+moved to other ports) into account with a full load vs. a reload, which diffs the topologies and updates the
+indexes of the changed devices and links only, and the number of devices to validate again.
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_reload
+"""
+
+import os
+import json
+import argparse
+import tempfile
+from time import perf_counter
+
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .topology_generator import synthetic_topology
+
+
+def indexes(manager):
+    return manager._device_index, manager._interface_index, manager._peer_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=50000)
+    args = parser.parse_args()
+
+    topology = synthetic_topology(links=args.links)
+    changed = json.loads(json.dumps(topology))
+    link = changed["network"]["topology-l2l3"][0]
+    device = changed["network"]["sites"][0]["devices"][0]
+    device["ports"].append(dict(device["ports"][0], **{"interface-id": "ge100-0/0/999"}))
+    link["a_interface"] = "ge100-0/0/999"
+
+    manager = TopologyManager()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "topology.json")
+        with open(path, "w") as writer:
+            json.dump(topology, writer)
+        manager.load(path)
+        with open(path, "w") as writer:
+            json.dump(changed, writer)
+
+        start = perf_counter()
+        diff = manager.reload()
+        reload_time = perf_counter() - start
+        reloaded = indexes(manager)
+        start = perf_counter()
+        unchanged_diff = manager.reload()
+        unchanged_time = perf_counter() - start
+        assert not unchanged_diff.changed
+        start = perf_counter()
+        manager.load(path)
+        load_time = perf_counter() - start
+        assert reloaded == indexes(manager)
+
+    device_count = len(manager._device_index)
+    print(f"{args.links} links, {device_count} devices")
+    print(diff)
+    print(f"{'':<24}{'time':>12}{'devices to validate':>22}")
+    for name, elapsed, devices in (
+        ("full load", load_time, device_count),
+        ("reload", reload_time, len(diff.affected_devices)),
+        ("reload, file unchanged", unchanged_time, 0),
+    ):
+        print(f"{name:<24}{elapsed * 1000:>9.1f} ms{devices:>22}")
+
+
+if __name__ == "__main__":
+    main()
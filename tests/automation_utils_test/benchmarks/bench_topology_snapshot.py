@@ -0,0 +1,64 @@
+"""
+Benchmark of the topology snapshots: the time of TopologyManager.load of a synthetic topology file, parsing
+it and building the indexes (cold), saving a snapshot on the way (first load), and from the snapshot (warm).
+
+run from the repository root, with idan/automation_utils on the PYTHONPATH:
+    python -m tests.automation_utils_test.benchmarks.bench_topology_snapshot
+"""
+
+import gc
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+from automation_utils.topology import snapshot
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .topology_generator import write_topology
+
+
+def timed_load(manager, path, use_snapshot):
+    # the previous topology is freed before the timing, as in a new pytest session
+    manager.__init__()
+    gc.collect()
+    start = perf_counter()
+    manager.load(path, use_snapshot=use_snapshot)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=50000)
+    args = parser.parse_args()
+
+    manager = TopologyManager()
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_topology(
+            os.path.join(directory, "topology.json"), links=args.links
+        )
+        cold = timed_load(manager, path, use_snapshot=False)
+        expected = manager.inventory_data, manager._peer_index, manager._device_index
+        first = timed_load(manager, path, use_snapshot=True)
+        warm = timed_load(manager, path, use_snapshot=True)
+        assert (
+            manager.inventory_data,
+            manager._peer_index,
+            manager._device_index,
+        ) == expected
+        source_size = os.path.getsize(path)
+        snapshot_size = os.path.getsize(snapshot.snapshot_path(path))
+
+    print(
+        f"{args.links} links, topology {source_size / 1e6:.1f} MB, snapshot {snapshot_size / 1e6:.1f} MB"
+    )
+    for name, elapsed in (
+        ("cold load", cold),
+        ("first load (saves the snapshot)", first),
+        ("warm load (from the snapshot)", warm),
+    ):
+        print(f"{name:<34}{elapsed * 1000:>9.1f} ms{cold / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Synthetic show command outputs for the decipher benchmarks, in the formats of the DNOS CLI and of the Arista
+eAPI json outputs, with the number of entries (interfaces, neighbors, replies, routes...) as parameter.
+"""
+
+import json
+
+
+def _interface(i: int) -> str:
+    return f"ge100-{i // 1000}/{i // 100 % 10}/{i % 100}"
+
+
+def _bundle(i: int) -> str:
+    return f"bundle-{i}"
+
+
+def _ipv4(i: int, first_octet: int = 10) -> str:
+    return f"{first_octet}.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+
+
+def _table(header: list[str], rows: list[list]) -> str:
+    """a DNOS pipe table, every column padded to its widest value"""
+    widths = [
+        max([len(title)] + [len(str(row[i])) for row in rows]) for i, title in enumerate(header)
+    ]
+    lines = [
+        "| " + " | ".join(title.ljust(width) for title, width in zip(header, widths)) + " |",
+        "+" + "+".join("-" * (width + 2) for width in widths) + "+",
+    ]
+    for row in rows:
+        lines.append(
+            "| " + " | ".join(str(value).ljust(width) for value, width in zip(row, widths)) + " |"
+        )
+    return "\n".join(lines)
+
+
+def show_interfaces(interfaces: int) -> str:
+    lines = [
+        "| Interface                |  Admin   | Operational     | IPv4 Address           | IPv6 Address"
+        "                                | VLAN          | MTU  | Network-Service                             "
+        "| Bundle-Id  |",
+        "+--------------------------+----------+-----------------+------------------------+-------------"
+        "--------------------------------+---------------+------+---------------------------------------------"
+        "+------------+",
+    ]
+    for i in range(interfaces):
+        lines.append(
+            f"| ge100-{i // 1000}/{i // 100 % 10}/{i % 100:<13} | enabled  | up              "
+            f"| 10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/31{'':<10} | 2001:db8::{i:x}/127{'':<20} "
+            f"|               | 9192 | VRF (default)                               | bundle-{i % 64:<4}|"
+        )
+    return "\n".join(lines)
+
+
+def show_interfaces_counters(interfaces: int) -> str:
+    lines = [
+        "| Interface          | Operational   | RX[Mbps]            | TX[Mbps]            | RX[pkts]       "
+        "     | TX[pkts]            | RX drops[pkts]      | TX drops[pkts]      |",
+        "+--------------------+---------------+---------------------+---------------------+----------------"
+        "-----+---------------------+---------------------+---------------------+",
+    ]
+    for i in range(interfaces):
+        lines.append(
+            f"| ge100-{i // 1000}/{i // 100 % 10}/{i % 100:<7} | up            | {i % 1000 + 0.06:<19} "
+            f"| {i % 100 + 0.05:<19} | {i * 7919:<19} | {i * 104729:<19} | 0                   | 0         "
+            "          |"
+        )
+    return "\n".join(lines)
+
+
+def show_lldp_neighbors(neighbors: int) -> str:
+    return _table(
+        ["Interface", "Neighbor System Name", "Neighbor interface", "Neighbor TTL"],
+        [[_interface(i), f"tcr{i % 500:03}.site{i % 40}.cran1", _interface(i + 1), 120] for i in range(neighbors)],
+    )
+
+
+def show_pim_neighbors(neighbors: int) -> str:
+    return _table(
+        ["Neighbor Address", "Interface", "Uptime", "Expires", "DR Priority"],
+        [[_ipv4(i, 96), _bundle(i), "1d02h03m", "00:01:30", 1] for i in range(neighbors)],
+    )
+
+
+def show_system(cards: int) -> str:
+    details = [
+        "System Name: pcr01.site10.cran1, System-Id: 52c52573-0ef7-4778-9779-8870bcebdbaf",
+        "System Type: SA-36CD-S, Family: NCR",
+        "System status: running",
+        "Version: DNOS [19.2.0] build [10], Copyright 2024 DRIVENETS LTD.",
+        "",
+    ]
+    table = _table(
+        ["Type", "Id", "Admin", "Operational", "Model", "Uptime", "Description", "Serial Number"],
+        [
+            [("NCC", "NCP", "NCF")[i % 3], i, "enabled", "up", "NCP-36CD-S", "17 days, 4:17:13", f"dn-ncp-{i}",
+             f"WKY1C8VS{i:07}"]
+            for i in range(cards)
+        ],
+    )
+    return "\n".join(details) + "\n" + table
+
+
+def show_bgp_summary(neighbors: int) -> str:
+    lines = [
+        "IPv4 Unicast",
+        "---------------------",
+        "BGP router identifier 96.109.183.81, local AS number 33287",
+        "",
+        "  Neighbor        V         AS MsgRcvd    MsgSent    InQ  OutQ  AdjOut  Up/Down   State/PfxAccepted",
+    ]
+    for i in range(neighbors):
+        state = "Connect" if i % 4 == 0 else str(i % 1000)
+        lines.append(
+            f"  10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255:<5} 4      {33287 + i:<6}     1403       1424    0"
+            f"     0       0 2d14h25m  {state}"
+        )
+    lines.append("")
+    lines.append(f"Total number of established neighbors {neighbors}/{neighbors}")
+    return "\n".join(lines)
+
+
+def show_config_protocols_bgp(neighbors: int) -> str:
+    lines = ["protocols", "  bgp 33287"]
+    for i in range(neighbors):
+        if i % 16 == 0:
+            lines.append(f"    neighbor-group GROUP-{i // 16}")
+        lines.append(f"      neighbor 10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}")
+        lines.append("        admin-state enabled")
+    return "\n".join(lines)
+
+
+def show_isis_neighbors(neighbors: int) -> str:
+    lines = [
+        "Instance 33287:",
+        "  System Id                      Interface               Level  State         Last State Change    "
+        "Holdtime  SNPA            ",
+    ]
+    for i in range(neighbors):
+        lines.append(
+            f"  {f'tcr{i:05}.site{i % 40}.cran1':<30} {_bundle(i):<23} L2     Up            "
+            f"{'1w4d3h25m40s':<20} 22        point-to-point  "
+        )
+    return "\n".join(lines)
+
+
+def show_config(interfaces: int) -> str:
+    """a configuration of the interfaces, with isis and pim enabled on all of them"""
+    lines = ["# Config (version 19.2)", "interfaces"]
+    for i in range(interfaces):
+        lines += [f"  {_bundle(i)}", "    admin-state enabled", f"    ipv4-address {_ipv4(i)}/31", "  !"]
+    lines += ["!", "protocols", "  isis", "    instance 33287"]
+    for i in range(interfaces):
+        lines += [f"      interface {_bundle(i)}", "        admin-state enabled", "      !"]
+    lines += ["    !", "  !", "  pim", "    address-family ipv4"]
+    for i in range(interfaces):
+        lines += [f"      interface {_bundle(i)}", "        admin-state enabled", "      !"]
+    lines += ["    !", "  !", "!"]
+    return "\n".join(lines)
+
+
+def ping(count: int) -> str:
+    lines = ["PING 1.1.1.1 (1.1.1.1) from 2.2.2.2 : 56(84) bytes of data."]
+    for i in range(count):
+        lines.append(f"64 bytes from 1.1.1.1: icmp_seq={i + 1} ttl=64 time=0.{100 + i % 900} ms")
+    lines.append("")
+    lines.append("--- 1.1.1.1 ping statistics ---")
+    lines.append(f"{count} packets transmitted, {count} received, 0% packet loss, time {count}ms")
+    lines.append("rtt min/avg/max/mdev = 0.100/0.550/0.999/0.259 ms")
+    return "\n".join(lines)
+
+
+def show_route(routes: int) -> str:
+    """routing entries of bgp routes, each recursive through two ecmp next hops and an alternate"""
+    lines = ["VRF: default"]
+    for i in range(routes):
+        lines += [
+            f"Routing entry for {_ipv4(i, 20)}/32",
+            '  Known via "bgp", priority low, distance 200, metric 0, vrf default, best, fib',
+            "  Last update 04:23:23 ago, ack",
+            "    96.109.183.228 (recursive)",
+            f"  *   96.217.1.205, via bundle-352 label {400000 + i % 1000}",
+            f"  *   96.217.0.229, via bundle-178 label {400000 + i % 1000}",
+            "    96.109.183.226 alternate (recursive)",
+            f"  *   96.217.1.205, via bundle-352 label {500000 + i % 1000}",
+        ]
+    return "\n".join(lines)
+
+
+def arista_bgp_summary(neighbors: int) -> str:
+    peers = {
+        _ipv4(i): {
+            "description": f"IPv4 Unicast to tcr{i:05}",
+            "version": 4,
+            "msgReceived": 60272,
+            "msgSent": 2603163,
+            "inMsgQueue": 0,
+            "outMsgQueue": 0,
+            "asn": "33287",
+            "prefixAccepted": i % 1000,
+            "prefixReceived": i % 1000,
+            "upDownTime": "1732583395.43076",
+            "underMaintenance": False,
+            "peerState": "Established",
+        }
+        for i in range(neighbors)
+    }
+    return json.dumps(
+        {"vrfs": {"default": {"vrf": "default", "routerId": "96.109.183.7", "asn": "33287", "peers": peers}}},
+        indent=2,
+    )
+
+
+def arista_interface_counters(interfaces: int) -> str:
+    counters = {
+        f"Ethernet{i // 64 + 1}/{i % 64 + 1}": {
+            "description": f"PHY|100G|AGG-MEMBER|CORE|rhost:ar01.site{i % 40}.cran1",
+            "interval": 30,
+            "inBpsRate": i * 314.0354530371204,
+            "inPktsRate": 3.7114548290247295e-07,
+            "inPpsRate": 0.35693768665845294,
+            "outBpsRate": i * 429.531528367689,
+            "outPktsRate": 5.311710789735807e-07,
+            "outPpsRate": 0.635247191286823,
+            "lastUpdateTimestamp": 1733168898.2399433,
+        }
+        for i in range(interfaces)
+    }
+    return json.dumps({"interfaces": counters}, indent=2)
+
+
+def arista_isis_neighbors(neighbors: int) -> str:
+    adjacencies = {
+        f"0961.{i >> 16 & 0xffff:04x}.{i & 0xffff:04x}": {
+            "adjacencies": [
+                {
+                    "hostname": f"tcr{i:05}",
+                    "circuitId": str(i % 256),
+                    "interfaceName": f"Port-Channel{i + 1}",
+                    "state": "up",
+                    "lastHelloTime": 1733239696,
+                    "snpa": "P2P",
+                    "level": "level-2",
+                    "details": {
+                        "advertisedHoldTime": 30,
+                        "stateChanged": 1733068984,
+                        "ip4Address": _ipv4(i, 96),
+                        "areaIds": ["49.0000"],
+                    },
+                }
+            ]
+        }
+        for i in range(neighbors)
+    }
+    return json.dumps(
+        {"vrfs": {"default": {"isisInstances": {"33287": {"neighbors": adjacencies}}}}}, indent=2
+    )
+
+
+def arista_lldp_neighbors(neighbors: int) -> str:
+    return json.dumps(
+        {
+            "lldpNeighbors": [
+                {
+                    "port": f"Ethernet{i // 64 + 1}/{i % 64 + 1}",
+                    "neighborDevice": f"ar{i:05}.site{i % 40}.cran1",
+                    "neighborPort": f"HundredGigE0/0/{i % 8}/{i % 32}",
+                    "ttl": 120,
+                }
+                for i in range(neighbors)
+            ]
+        },
+        indent=2,
+    )
@@ -0,0 +1,115 @@
+"""
+Synthetic topology files for the TopologyManager benchmarks, in the topology_data.Inventory format.
+"""
+
+import json
+
+
+def _port(interface_id, link):
+    return {
+        "interface-type": "physical",
+        "interface-id": interface_id,
+        "lag-id": "",
+        "link": link,
+        "link-type": "p2p",
+        "member-speed": 100,
+        "bundle-member": False,
+        "interface": interface_id,
+    }
+
+
+def _lag(lag_id, index):
+    return {
+        "interface-type": "lag",
+        "interface-id": lag_id,
+        "members": [],
+        "link": "",
+        "link-type": "p2p",
+        "interface": lag_id,
+        "ipv4_address": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}/31",
+        "ipv6_address": f"2001:db8::{index >> 16:x}:{index & 0xffff:x}/127",
+    }
+
+
+def _link(index, a, a_interface, z, z_interface):
+    return {
+        "ipv4_subnet": f"100.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}/31",
+        "ipv6_subnet": f"2001:db8:1::{index >> 16:x}:{index & 0xffff:x}/127",
+        "type": "p2p",
+        "designed-distance": 1,
+        "bundle": False,
+        "member-ports": 1,
+        "member-speed": 100,
+        "a": a,
+        "a_interface": a_interface,
+        "z": z,
+        "z_interface": z_interface,
+        "a_site": "site-0",
+        "a_is_device": True,
+        "z_site": "site-0",
+        "z_is_device": True,
+        "key": f"link-{index}",
+    }
+
+
+def synthetic_topology(links=10000, ports_per_device=20, sites=10):
+    """
+    :returns: an inventory of `links` point to point links, between devices of `ports_per_device` ports
+              spread over `sites` sites. Every device also has a lag with an address.
+    """
+    device_count = max(2, links * 2 // ports_per_device)
+    names = [f"tcr{i:05d}" for i in range(device_count)]
+    ports = {name: [] for name in names}
+    topology_links = []
+    for index in range(links):
+        a = names[index % device_count]
+        z = names[(index + 1 + index // device_count) % device_count]
+        if z == a:
+            z = names[(index + 1) % device_count]
+        a_interface = f"ge100-0/0/{len(ports[a])}"
+        z_interface = f"ge100-0/0/{len(ports[z])}"
+        ports[a].append(_port(a_interface, f"link-{index}"))
+        ports[z].append(_port(z_interface, f"link-{index}"))
+        topology_links.append(_link(index, a, a_interface, z, z_interface))
+
+    devices = [
+        {
+            "loopbacks": [],
+            "network": "bench",
+            "platform": "NCP",
+            "name": name,
+            "site": f"site-{i % sites}",
+            "role": "tcr",
+            "ports": ports[name],
+            "lags": [_lag(f"bundle-{i}", i)],
+        }
+        for i, name in enumerate(names)
+    ]
+    return {
+        "name": "bench",
+        "type": "network",
+        "adjacent-networks": "",
+        "network": {
+            "name": "bench",
+            "planes": 1,
+            "asn": 7922,
+            "metro-area": "bench",
+            "market-id": 1,
+            "market-name": "bench",
+            "sites": [
+                {
+                    "name": f"site-{s}",
+                    "type": ["pop"],
+                    "devices": devices[s::sites],
+                }
+                for s in range(sites)
+            ],
+            "topology-l2l3": topology_links,
+        },
+    }
+
+
+def write_topology(path, **kwargs):
+    with open(path, "w") as writer:
+        json.dump(synthetic_topology(**kwargs), writer)
+    return path
@@ -0,0 +1,171 @@
+"""
+In-memory stand-ins for paramiko channels, used by the tests and the benchmarks to drive SSHClient
+without a device.
+"""
+
+import os
+import queue
+import threading
+import time
+
+
+class FakeChannel:
+    """
+    Mimics the parts of paramiko.Channel used by SSHClient.
+    Like paramiko, fileno() returns a pipe that is readable while there is buffered data to recv().
+    """
+
+    def __init__(self, on_send=None):
+        self.on_send = on_send
+        self.closed = False
+        self.eof_received = False
+        self.status_event = threading.Event()
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._read_fd, self._write_fd = os.pipe()
+        self._pipe_set = False
+        # like paramiko, the pipe stays readable once the eof was received
+        self._pipe_forever = False
+
+    def feed(self, data: bytes):
+        with self._lock:
+            # like paramiko, the data received after the channel was closed is dropped
+            if self.closed:
+                return
+            self._buffer += data
+            if not self._pipe_set:
+                os.write(self._write_fd, b"*")
+                self._pipe_set = True
+
+    def recv_ready(self):
+        with self._lock:
+            return len(self._buffer) > 0
+
+    def recv(self, nbytes):
+        with self._lock:
+            data = bytes(self._buffer[:nbytes])
+            del self._buffer[:nbytes]
+            if not self._buffer and self._pipe_set and not self._pipe_forever:
+                os.read(self._read_fd, 1)
+                self._pipe_set = False
+            return data
+
+    def feed_eof(self, exit_status=0):
+        """the device finished writing and exited, as an exec channel does at the end of its command"""
+        with self._lock:
+            if self.closed:
+                return
+            self.eof_received = True
+            self.exit_status = exit_status
+            self._pipe_forever = True
+            if not self._pipe_set:
+                os.write(self._write_fd, b"*")
+                self._pipe_set = True
+        self.status_event.set()
+
+    def exit_status_ready(self):
+        return self.status_event.is_set()
+
+    def exec_command(self, command):
+        self.on_send(command)
+
+    def fileno(self):
+        return self._read_fd
+
+    def sendall(self, data):
+        if self.on_send:
+            self.on_send(data)
+
+    def settimeout(self, timeout):
+        pass
+
+    def set_combine_stderr(self, combine):
+        pass
+
+    def close(self):
+        with self._lock:
+            if not self.closed:
+                self.closed = True
+                os.close(self._read_fd)
+                os.close(self._write_fd)
+
+
+class FakeDevice:
+    """
+    Answers the commands written to the channel with an echo, the output returned by `responder`
+    and a prompt. Every write pays `latency` seconds once, like a network round-trip, and the reply
+    is fed in chunks of `chunk_size` bytes, `chunk_delay` seconds apart.
+    """
+
+    def __init__(
+        self,
+        responder=lambda command: "",
+        prompt="dnos# ",
+        latency=0.0,
+        chunk_size=65535,
+        chunk_delay=0.0,
+    ):
+        self.responder = responder
+        self.prompt = prompt
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self._writes = queue.Queue()
+        self.channel = FakeChannel(on_send=self._writes.put)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            data = self._writes.get()
+            if data is None:
+                return
+            if self.latency:
+                time.sleep(self.latency)
+            commands = data.decode() if isinstance(data, bytes) else data
+            for command in commands.splitlines():
+                self._reply(command)
+
+    def _reply(self, command):
+        output = self.responder(command)
+        reply = f"{command}\r\n{output}\r\n{self.prompt}".encode()
+        for i in range(0, len(reply), self.chunk_size):
+            self.channel.feed(reply[i : i + self.chunk_size])
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+
+    def close(self):
+        self._writes.put(None)
+        self.channel.close()
+
+
+class FakeExecDevice:
+    """
+    Mimics a paramiko transport whose exec channels run the commands concurrently: every command
+    takes `latency` seconds, like a network round-trip, before its output returned by `responder` arrives,
+    and exits with the status returned by `exit_status`.
+    Set as the session of an SSHClient, to drive its exec channel commands.
+    """
+
+    def __init__(self, responder=lambda command: "", latency=0.0, exit_status=lambda command: 0):
+        self.responder = responder
+        self.latency = latency
+        self.exit_status = exit_status
+
+    def open_session(self):
+        channel = FakeChannel()
+        channel.on_send = lambda command: threading.Thread(
+            target=self._run, args=(channel, command), daemon=True
+        ).start()
+        return channel
+
+    def _run(self, channel, command):
+        if self.latency:
+            time.sleep(self.latency)
+        channel.feed(self.responder(command).encode())
+        channel.feed_eof(self.exit_status(command))
+
+    def is_active(self):
+        return True
+
+    def get_transport(self):
+        return self
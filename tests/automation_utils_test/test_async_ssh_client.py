@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+from automation_utils.cli.cli_session import CliSession
+from automation_utils.ssh_client.async_ssh_client import AsyncSSHClient
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .fakes import FakeDevice
+
+PROMPT = "dnos# "
+LATENCY = 0.2
+
+
+class FakeCliSession(CliSession):
+    def close_session(self):
+        pass
+
+    def execute_request_command(self, command: str):
+        pass
+
+    def edit_config(self, candidate, **kwargs) -> str:
+        pass
+
+    def confirm_commit(self, session_name=None) -> None:
+        pass
+
+    def rollback(self, index) -> None:
+        pass
+
+
+def _responder(command):
+    return f"output of {command}"
+
+
+def _cli(device) -> FakeCliSession:
+    cli = FakeCliSession("tcr01", "user", "password")
+    cli.ssh.shell = device.channel
+    cli.ssh.is_connected = lambda: True
+    return cli
+
+
+def test_run_is_concurrent_across_sessions():
+    # Arrange
+    clients = [AsyncSSHClient(SSHClient(hostname=f"tcr0{i}", username="user", password="password")) for i in range(2)]
+    # both functions must run at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    async def run_all():
+        return await asyncio.gather(*(client.run(barrier.wait) for client in clients))
+
+    # Act
+    asyncio.run(run_all())
+
+    # Assert
+    assert not barrier.broken
+
+
+def test_run_is_serialized_within_a_session():
+    # Arrange
+    client = AsyncSSHClient(SSHClient(hostname="tcr01", username="user", password="password"))
+    events = []
+
+    def operation(name):
+        events.append(f"{name} start")
+        time.sleep(0.05)
+        events.append(f"{name} end")
+
+    async def run_all():
+        await asyncio.gather(client.run(operation, "a"), client.run(operation, "b"))
+
+    # Act
+    asyncio.run(run_all())
+
+    # Assert
+    assert events in (
+        ["a start", "a end", "b start", "b end"],
+        ["b start", "b end", "a start", "a end"],
+    )
+
+
+def test_sync_commands_wait_for_async_operations():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT)
+    client = AsyncSSHClient(_cli(device).ssh)
+    events = []
+    operation_started = threading.Event()
+
+    def operation():
+        operation_started.set()
+        time.sleep(0.1)
+        events.append("async end")
+
+    def sync_command():
+        operation_started.wait(5)
+        events.append(client.ssh.execute_shell_command("show system", shows_output=True))
+
+    # Act
+    thread = threading.Thread(target=sync_command)
+    thread.start()
+    asyncio.run(client.run(operation))
+    thread.join(5)
+    device.close()
+
+    # Assert
+    assert events == ["async end", "output of show system"]
+
+
+def test_send_command_async_is_concurrent_across_sessions():
+    # Arrange
+    devices = [FakeDevice(responder=_responder, prompt=PROMPT, latency=LATENCY) for _ in range(4)]
+    sessions = [_cli(device) for device in devices]
+
+    async def send_all():
+        return await asyncio.gather(*(cli.send_command_async("show system") for cli in sessions))
+
+    # Act
+    start = time.monotonic()
+    outputs = asyncio.run(send_all())
+    elapsed = time.monotonic() - start
+    for device in devices:
+        device.close()
+
+    # Assert
+    assert outputs == ["output of show system"] * 4
+    assert elapsed < LATENCY * 3
+
+
+def test_async_commands_are_serialized_within_a_session():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT, latency=0.05)
+    cli = _cli(device)
+    commands = [f"show interfaces bundle-{i}" for i in range(4)]
+
+    async def send_all():
+        return await asyncio.gather(
+            cli.send_commands_async(commands[:2]),
+            *(cli.send_command_async(command) for command in commands[2:]),
+            cli.execute_shell_command_async("show system", shows_output=True),
+        )
+
+    # Act
+    pipelined, *outputs = asyncio.run(send_all())
+    device.close()
+
+    # Assert
+    assert pipelined == [_responder(command) for command in commands[:2]]
+    assert outputs == [_responder(command) for command in commands[2:] + ["show system"]]
@@ -8,6 +8,7 @@ from automation_utils.cli.cli_ceos import CliCeos
 from automation_utils.cli.cli_dnos import CliDnos
 from automation_utils.device_manager import DeviceManager
 from automation_utils.common.exceptions import (
+    CommandFailed,
     UnexpectedOutput,
     CommitFailedException,
 )
@@ -141,6 +142,20 @@ class TestCli:
         cli.confirm_commit()
         cli.close_session()
 
+    def test_bulk_edit_config(self):
+        cli = self._get_dnos_cli()
+        print("executing bulk config....")
+        try:
+            cli.edit_config(CLI_SNIPPET_DNOS, bulk=True)
+        except CommitFailedException as ex:
+            if "no configuration changes were made" not in str(ex):
+                raise
+
+        print("executing bulk config that should fail...")
+        with pytest.raises(CommandFailed, match="Failed candidate line"):
+            cli.edit_config(CLI_WRONG_SNIPPET, bulk=True)
+        cli.close_session()
+
     def test_ping(self):
         cli = self._get_dnos_cli()
         res = cli.send_command(
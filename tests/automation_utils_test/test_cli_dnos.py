@@ -0,0 +1,114 @@
+import pytest
+
+from automation_utils.cli.cli_dnos import CliDnos
+from automation_utils.common.exceptions import CommandFailed
+
+from .fakes import FakeDevice
+
+CANDIDATE = """interfaces
+  bundle-1
+    admin-state enabled
+    mtu 9000
+  !
+!"""
+LOAD_FAILURE = "ERROR: line 4: Invalid value '9000' for mtu"
+
+
+class DnosDevice(FakeDevice):
+    """Records the commands it receives, and fails the load commands when `load_output` is an error"""
+
+    def __init__(self, load_output=""):
+        self.commands = []
+        self.load_output = load_output
+        super().__init__(responder=self._respond, prompt="dnos(cfg)# ")
+
+    def _respond(self, command):
+        self.commands.append(command)
+        if command.startswith("load"):
+            return self.load_output
+        if command.startswith("commit"):
+            return "Commit succeeded by user at 17-Oct-2026 10:00:00 UTC"
+        return ""
+
+
+def _cli(device, **kwargs) -> tuple[CliDnos, list]:
+    cli = CliDnos("tcr01", "user", "password", **kwargs)
+    cli.ssh.shell = device.channel
+    cli.ssh.is_connected = lambda: True
+    uploads = []
+
+    def scp_put(src, dst="."):
+        with open(src) as candidate_file:
+            uploads.append((candidate_file.read(), dst))
+
+    cli.ssh.scp_put = scp_put
+    return cli, uploads
+
+
+def test_bulk_edit_config_uploads_loads_and_commits():
+    # Arrange
+    device = DnosDevice()
+    cli, uploads = _cli(device)
+
+    # Act
+    cli.edit_config(CANDIDATE, bulk=True)
+    device.close()
+
+    # Assert
+    assert uploads == [(CANDIDATE, "/config/automation_utils_candidate.cfg")]
+    assert device.commands == [
+        "configure",
+        "load merge /config/automation_utils_candidate.cfg",
+        "commit and-exit",
+    ]
+
+
+def test_bulk_edit_config_replace_loads_override_from_the_config_files_dir():
+    # Arrange
+    device = DnosDevice()
+    cli, uploads = _cli(device, config_files_dir="/home/dnroot/")
+
+    # Act
+    cli.edit_config(CANDIDATE, replace=True, bulk=True)
+    device.close()
+
+    # Assert
+    assert uploads == [(CANDIDATE, "/home/dnroot/automation_utils_candidate.cfg")]
+    assert device.commands[1] == "load override /home/dnroot/automation_utils_candidate.cfg"
+
+
+def test_bulk_edit_config_load_failure_discards_the_candidate():
+    # Arrange
+    device = DnosDevice(load_output=LOAD_FAILURE)
+    cli, _ = _cli(device)
+
+    # Act
+    with pytest.raises(CommandFailed) as failure:
+        cli.edit_config(CANDIDATE, bulk=True)
+    device.close()
+
+    # Assert
+    assert device.commands == [
+        "configure",
+        "load merge /config/automation_utils_candidate.cfg",
+        "rollback 0",
+    ]
+    assert "Failed candidate line 4: 'mtu 9000'" in str(failure.value)
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        (LOAD_FAILURE, f"{LOAD_FAILURE}\nFailed candidate line 4: 'mtu 9000'"),
+        ("Error at Line 1", "Error at Line 1\nFailed candidate line 1: 'interfaces'"),
+        # out of the candidate, or without a line number, the output is kept as is
+        ("ERROR: line 7: unexpected end of file", "ERROR: line 7: unexpected end of file"),
+        ("ERROR: invalid candidate", "ERROR: invalid candidate"),
+    ],
+)
+def test_attribute_load_failure(output, expected):
+    # Act
+    attributed = CliDnos._attribute_load_failure(CANDIDATE, output)
+
+    # Assert
+    assert attributed == expected
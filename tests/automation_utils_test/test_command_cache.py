@@ -0,0 +1,44 @@
+from automation_utils.cli import command_cache
+from automation_utils.cli.command_cache import CommandCache
+
+
+class FakeDecipher:
+    pass
+
+
+def test_command_cache_returns_output_and_deciphered_objects():
+    # Arrange
+    cache = CommandCache()
+    cache.set("show config", "config output")
+
+    # Act
+    output = cache.get("show config")
+    missing_decipher = cache.get("show config", decipher=FakeDecipher)
+    cache.set("show config", "config output", FakeDecipher, {"deciphered": True})
+    deciphered = cache.get("show config", decipher=FakeDecipher)
+
+    # Assert
+    assert output == (True, "config output")
+    assert missing_decipher == (False, None)
+    assert deciphered == (True, {"deciphered": True})
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_command_cache_expires_and_invalidates_entries(monkeypatch):
+    # Arrange
+    now = [100.0]
+    monkeypatch.setattr(command_cache, "monotonic", lambda: now[0])
+    cache = CommandCache(ttl=10)
+    cache.set("show lldp neighbors", "lldp output")
+    cache.set("show system", "system output")
+
+    # Act
+    now[0] += 11
+    expired = cache.get("show lldp neighbors")
+    cache.set("show system", "system output")
+    cache.invalidate()
+
+    # Assert
+    assert expired == (False, None)
+    assert cache.get_output("show system") is None
+    assert len(cache) == 0
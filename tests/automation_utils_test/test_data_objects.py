@@ -0,0 +1,162 @@
+import dataclasses
+import inspect
+
+import pytest
+
+from automation_utils.data_objects.bgp_summary import BgpNeighbor, BgpSummary
+from automation_utils.data_objects.config_protocols_bgp import ConfigProtocolsBgp
+from automation_utils.data_objects.interface_counters import InterfaceCounters
+from automation_utils.data_objects.interface_status import InterfaceStatus
+from automation_utils.data_objects.ip_route import IpRoute, NextHop
+from automation_utils.data_objects.isis_neighbors import IsisNeighbor, IsisNeighbors
+from automation_utils.data_objects.lldp_neighbors import LldpNeighbor
+from automation_utils.data_objects.pim_data import PimData
+from automation_utils.data_objects.ping_data import PingData, PingResponse, Status
+
+NEXT_HOP = NextHop("96.217.1.205", "bundle-352", True, False, False)
+BGP_NEIGHBOR = BgpNeighbor("96.109.183.47", "2d14h25m", 190)
+ISIS_NEIGHBOR = IsisNeighbor("tcr01.site10.cran1", "bundle-178", "Up", "2d2h56m11s")
+
+# the constructor parameters of the data objects before they were dataclasses, and the arguments of an object
+SIGNATURES = {
+    BgpNeighbor: (["neighbor", "up_down_time", "state_pfx_accepted"], ("96.109.183.47", "2d14h25m", 190)),
+    BgpSummary: (
+        ["as_number", "bgp_router_identifier", "neighbors"],
+        (7922, "96.109.183.1", {"96.109.183.47": BGP_NEIGHBOR}),
+    ),
+    ConfigProtocolsBgp: (["neighbors_ip_addresses"], (["96.109.183.47"],)),
+    InterfaceCounters: (["interface_name", "rx_mbps", "tx_mbps"], ("ge100-0/0/1", 10.06, 20.05)),
+    InterfaceStatus: (["interface", "admin_status", "operational_status"], ("ge100-0/0/1", "enabled", "up")),
+    IsisNeighbor: (
+        ["system_name", "interface_name", "state", "last_change"],
+        ("tcr01.site10.cran1", "bundle-178", "Up", "2d2h56m11s"),
+    ),
+    IsisNeighbors: (["instance_id", "neighbors"], (1, {"bundle-178": ISIS_NEIGHBOR})),
+    LldpNeighbor: (
+        ["interface", "system_name", "neighbor_interface", "ttl"],
+        ("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/1", 120),
+    ),
+    PimData: (["neighbor", "interface", "uptime"], ("2001:558:4c0:511::190", "bundle-340", "00:00:00")),
+    NextHop: (
+        ["ip_address", "interface", "is_active", "is_recursive", "is_alternate"],
+        ("96.217.1.205", "bundle-352", True, False, False),
+    ),
+    IpRoute: (["destination", "protocol", "next_hops"], ("1.1.1.0/24", "bgp", [NEXT_HOP])),
+    PingResponse: (
+        [
+            "source",
+            "time",
+            "sent",
+            "received",
+            "min_time",
+            "avg_time",
+            "max_time",
+            "std_dev",
+            "bytes",
+            "sequence",
+            "ttl",
+        ],
+        ("1.1.1.1", 0.122, 5, 5, 0.1, 0.12, 0.15, 0.02, 64, 1, 64),
+    ),
+    Status: (["name", "value"], ("success", 0)),
+}
+# the records hashed by value, the other data objects hold dicts and lists
+HASHABLE = [
+    BgpNeighbor,
+    InterfaceCounters,
+    InterfaceStatus,
+    IsisNeighbor,
+    LldpNeighbor,
+    PimData,
+    NextHop,
+    PingResponse,
+    Status,
+]
+
+
+def _other_value(value):
+    """a value of the same type, different from value"""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float, str)):
+        return value + type(value)(1)
+    return type(value)()
+
+
+@pytest.mark.parametrize("cls", SIGNATURES, ids=lambda cls: cls.__name__)
+def test_data_object_positional_construction(cls):
+    # Arrange
+    parameters, args = SIGNATURES[cls]
+
+    # Act
+    data_object = cls(*args)
+
+    # Assert
+    assert list(inspect.signature(cls).parameters) == parameters
+    assert {parameter: getattr(data_object, parameter) for parameter in parameters} == dict(zip(parameters, args))
+    assert data_object == cls(*args)
+    assert data_object != args
+    assert not hasattr(data_object, "__dict__")
+
+
+def test_data_object_defaults():
+    # Act
+    next_hop = NextHop("96.217.1.205")
+    ping_data = PingData()
+
+    # Assert
+    assert (next_hop.interface, next_hop.is_active, next_hop.is_recursive, next_hop.is_alternate) == (
+        None,
+        False,
+        False,
+        False,
+    )
+    assert (ping_data.responses, ping_data.status, ping_data.result_message) == ({}, None, None)
+    assert PingData().responses is not ping_data.responses
+
+
+@pytest.mark.parametrize("cls", HASHABLE, ids=lambda cls: cls.__name__)
+def test_data_object_hash_is_consistent_with_equality(cls):
+    # Arrange
+    _, args = SIGNATURES[cls]
+    data_object = cls(*args)
+
+    # Act
+    # an object differing from data_object by each of its compared fields
+    others = [
+        dataclasses.replace(data_object, **{field.name: _other_value(getattr(data_object, field.name))})
+        for field in dataclasses.fields(cls)
+        if field.compare
+    ]
+
+    # Assert
+    assert hash(data_object) == hash(cls(*args))
+    assert all(other != data_object for other in others)
+    assert len({data_object, cls(*args), *others}) == len(others) + 1
+
+
+def test_lldp_neighbor_ttl_is_not_compared_or_hashed():
+    # Arrange
+    neighbor = LldpNeighbor("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/1", 120)
+
+    # Act
+    later = dataclasses.replace(neighbor, ttl=90)
+
+    # Assert
+    assert [field.name for field in dataclasses.fields(LldpNeighbor) if not field.compare] == ["ttl"]
+    assert later == neighbor
+    assert hash(later) == hash(neighbor)
+    assert later.ttl == 90
+
+
+@pytest.mark.parametrize(
+    "cls", [BgpSummary, ConfigProtocolsBgp, IsisNeighbors, IpRoute, PingData], ids=lambda cls: cls.__name__
+)
+def test_data_object_containers_are_not_hashable(cls):
+    # Arrange
+    _, args = SIGNATURES.get(cls, ([], ()))
+    data_object = cls(*args)
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        hash(data_object)
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from automation_utils.common.exceptions import ExecutionFailed, ExecutionTimeout
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .fakes import FakeExecDevice
+
+COMMANDS = [f"cat /var/log/dn/interface_{i}.log" for i in range(10)]
+FAILING_COMMAND = COMMANDS[3]
+
+
+def _responder(command):
+    return f"output of {command}\n"
+
+
+class RecordingExecDevice(FakeExecDevice):
+    """Records the channels opened on it, the hanging commands never exit"""
+
+    def __init__(self, hanging=(), **kwargs):
+        super().__init__(responder=_responder, **kwargs)
+        self.hanging = set(hanging)
+        self.channels = []
+        self.max_open_channels = 0
+        self._lock = threading.Lock()
+
+    def open_session(self):
+        channel = super().open_session()
+        with self._lock:
+            self.channels.append(channel)
+            open_channels = sum(not channel.closed for channel in self.channels)
+            self.max_open_channels = max(self.max_open_channels, open_channels)
+        return channel
+
+    def _run(self, channel, command):
+        if command not in self.hanging:
+            super()._run(channel, command)
+
+
+def _client(device) -> SSHClient:
+    client = SSHClient(hostname="tcr01", username="user", password="password")
+    client._session = device
+    return client
+
+
+def test_execute_commands_returns_the_outputs_in_order():
+    # Arrange
+    # the first commands take the longest, so the channels complete in the reverse order
+    latencies = {command: 0.01 * (len(COMMANDS) - i) for i, command in enumerate(COMMANDS)}
+
+    class SlowFirstDevice(RecordingExecDevice):
+        def _run(self, channel, command):
+            time.sleep(latencies[command])
+            super()._run(channel, command)
+
+    device = SlowFirstDevice()
+
+    # Act
+    outputs = _client(device).execute_commands(COMMANDS)
+
+    # Assert
+    assert outputs == [_responder(command) for command in COMMANDS]
+
+
+def test_execute_commands_respects_the_channels_window():
+    # Arrange
+    device = RecordingExecDevice(latency=0.02)
+
+    # Act
+    outputs = _client(device).execute_commands(COMMANDS, max_channels=3)
+
+    # Assert
+    assert outputs == [_responder(command) for command in COMMANDS]
+    assert len(device.channels) == len(COMMANDS)
+    assert device.max_open_channels == 3
+    assert all(channel.closed for channel in device.channels)
+
+
+def test_execute_commands_reports_a_non_zero_exit_status():
+    # Arrange
+    device = RecordingExecDevice(
+        hanging=COMMANDS[4:], exit_status=lambda command: 1 if command == FAILING_COMMAND else 0
+    )
+
+    # Act
+    with pytest.raises(ExecutionFailed) as failure:
+        _client(device).execute_commands(COMMANDS, max_channels=5)
+
+    # Assert
+    assert FAILING_COMMAND in str(failure.value) and "status 1" in str(failure.value)
+    # the channels of the commands still running are closed, and the pending commands are not executed
+    assert len(device.channels) < len(COMMANDS)
+    assert all(channel.closed for channel in device.channels)
+
+
+def test_execute_commands_reports_a_timeout():
+    # Arrange
+    device = RecordingExecDevice(hanging=[FAILING_COMMAND])
+
+    # Act
+    with pytest.raises(ExecutionTimeout) as failure:
+        _client(device).execute_commands(COMMANDS, timeout=0.2, max_channels=5)
+
+    # Assert
+    assert FAILING_COMMAND in failure.value.message
+    assert all(channel.closed for channel in device.channels)
@@ -0,0 +1,94 @@
+from automation_utils.ssh_client import consts
+from automation_utils.ssh_client.output_buffer import (
+    OutputBuffer,
+    StreamingOutputBuffer,
+    strip_ansi_escape_codes,
+)
+
+CLI_OUTPUT = "show system\r\n\x1b[92m+\x1b[0m ncc-0 active-up ✓\r\n\x1b[Kdnos# "
+
+
+def test_output_buffer_matches_whole_output_stripping():
+    # Arrange
+    output = OutputBuffer()
+    raw_output = CLI_OUTPUT.encode()
+
+    # Act - feed the output one byte at a time, so escape sequences and multi-byte chars are split between reads
+    for i in range(len(raw_output)):
+        output.feed(raw_output[i : i + 1])
+
+    # Assert
+    assert output.getvalue() == strip_ansi_escape_codes(CLI_OUTPUT)
+    assert len(output) == len(raw_output)
+    assert output.last_line == "dnos# "
+
+
+def test_output_buffer_keeps_a_bounded_tail():
+    output = OutputBuffer(tail_size=16)
+
+    output.feed(b"line\n" * 1000)
+    output.feed(b"tcr01# ")
+
+    assert output.last_line == "tcr01# "
+    assert output.getvalue().endswith("line\ntcr01# ")
+    assert len(output) == 5 * 1000 + len("tcr01# ")
+
+
+def test_output_buffer_decodes_in_blocks(monkeypatch):
+    monkeypatch.setattr(consts, "DECODE_BLOCK_SIZE", 8)
+    output = OutputBuffer()
+
+    output.feed(CLI_OUTPUT.encode() * 10)
+
+    assert output.getvalue() == strip_ansi_escape_codes(CLI_OUTPUT * 10)
+
+
+def test_streaming_output_buffer_streams_the_lines_after_the_echo():
+    # Arrange
+    chunks = []
+    output = StreamingOutputBuffer(chunks.append, echo="show system", head_size=8)
+    raw_output = ("dnos# " + CLI_OUTPUT).encode()
+
+    # Act - feed the output one byte at a time, so escape sequences and multi-byte chars are split between reads
+    last_lines_before_echo = set()
+    for i in range(len(raw_output)):
+        output.feed(raw_output[i : i + 1])
+        if not output.started:
+            last_lines_before_echo.add(output.last_line)
+
+    # Assert
+    assert "".join(chunks) == "+ ncc-0 active-up ✓\n"
+    assert output.head == "+ ncc-0 "
+    assert output.getvalue() == output.last_line == "dnos# "
+    assert len(output) == len(raw_output)
+    # the prompt before the echo is not taken for the end of the output
+    assert last_lines_before_echo == {""}
+
+
+def test_streaming_output_buffer_finds_failures_past_the_head():
+    # Arrange
+    chunks = []
+    output = StreamingOutputBuffer(chunks.append, echo="show system", failures=["ERROR:", "% Invalid"])
+    lines = "".join(f"| ncc-{i} | active-up |\n" for i in range(1000))
+    raw_output = f"show system\n{lines}ERROR: card ncc-1000 is not responding\n{lines}dnos# ".encode()
+
+    # Act - feed the output in chunks which split the failure message
+    for i in range(0, len(raw_output), 1000):
+        output.feed(raw_output[i : i + 1000])
+
+    # Assert
+    assert raw_output.index(b"ERROR:") > consts.STREAMED_OUTPUT_HEAD_SIZE
+    assert output.failure == "ERROR: card ncc-1000 is not responding"
+    assert "".join(chunks) == f"{lines}ERROR: card ncc-1000 is not responding\n{lines}"
+
+
+def test_streaming_output_buffer_finds_failures_split_between_lines():
+    # Arrange
+    output = StreamingOutputBuffer(lambda text: None, failures=["failed\nto commit"])
+
+    # Act
+    output.feed(b"commit\nfailed\n")
+    output.feed(b"to commit\n")
+
+    # Assert
+    assert output.failure == "failed\nto commit"
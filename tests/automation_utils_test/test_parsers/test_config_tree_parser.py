@@ -0,0 +1,51 @@
+from automation_utils.helpers.deciphers.drivenets.config_tree import ConfigTreeDecipher
+
+CLI_RESPONSE = """# Config (version 19.1)
+interfaces
+  ge100-0/0/1
+    admin-state enabled
+  !
+!
+protocols
+  bgp 7922
+    neighbor 96.109.183.47
+    !
+    neighbor-group IPV4-U-ASBR-AR
+      neighbor 96.217.1.14
+      !
+    !
+  !
+  isis
+    instance 33287
+      interface bundle-217
+        admin-state enabled
+      !
+      interface bundle-340
+      !
+    !
+  !
+  pim
+    address-family ipv4
+      interface bundle-340
+        admin-state enabled
+      !
+      interface bundle-721
+        admin-state enabled
+      !
+    !
+  !
+!"""
+
+
+def test_config_tree_decipher():
+    # Act
+    config = ConfigTreeDecipher.decipher(CLI_RESPONSE)
+
+    # Assert
+    assert list(config.children) == ["interfaces", "protocols"]
+    assert config.get("interfaces", "ge100-0/0/1", "admin-state enabled") is not None
+    assert config.values("protocols", "pim", "**", "interface *") == ["bundle-340", "bundle-721"]
+    assert config.values("protocols", "isis", "**", "interface bundle-*") == ["bundle-217", "bundle-340"]
+    assert config.values("protocols", "bgp *", "**", "neighbor *") == ["96.109.183.47", "96.217.1.14"]
+    assert config.get("protocols", "bgp 7922").value == "7922"
+    assert config.find("protocols", "bgp 1") == []
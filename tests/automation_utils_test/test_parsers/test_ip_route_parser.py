@@ -85,10 +85,15 @@ Routing entry for 1.1.1.0/24
 
     # Act
     result = IpRouteDecipher.decipher(cli_response)
+    stream = IpRouteDecipher.streaming()
+    for line in cli_response.splitlines(keepends=True):
+        stream.feed(line)
+    streamed_result = stream.finish()
 
     # Assert
     try:
         assert result == expected_result
+        assert streamed_result == expected_result
     except AssertionError:
         print("\nIP Route comparison failed. Details:")
         print(f"\nExpected:\n{expected_result}")
@@ -109,3 +109,18 @@ def test_arista_lldp_neighbors_parser():
 
     # Assert
     assert result == expected_result
+
+
+def test_lldp_neighbor_equality_ignores_ttl():
+    # Arrange
+    neighbor = LldpNeighbor("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/1", 120)
+
+    # Act
+    later = LldpNeighbor("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/1", 90)
+    moved = LldpNeighbor("ge100-4/2/2", "dn11-systemR1-fe4", "ge100-4/1/2", 120)
+
+    # Assert
+    assert neighbor == later and hash(neighbor) == hash(later)
+    assert neighbor != moved
+    assert {neighbor, later, moved} == {neighbor, moved}
+    assert not hasattr(neighbor, "__dict__")
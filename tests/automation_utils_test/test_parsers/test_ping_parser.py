@@ -0,0 +1,85 @@
+from automation_utils.helpers.deciphers.drivenets.ping import DnosPingDecipher
+from automation_utils.data_objects.ping_data import PingResponse
+
+
+def _echo(sequence, time):
+    return PingResponse(
+        source="1.1.1.1",
+        time=time,
+        sent=0,
+        received=0,
+        min_time=0,
+        avg_time=0,
+        max_time=0,
+        std_dev=0,
+        bytes="64",
+        sequence=sequence,
+        ttl="64",
+    )
+
+
+def test_ping_parser():
+    # Arrange
+    # some replies and the summary may be indented
+    cli_response = """PING 1.1.1.1 (1.1.1.1) from 2.2.2.2 : 56(84) bytes of data.
+64 bytes from 1.1.1.1: icmp_seq=1 ttl=64 time=0.122 ms
+  64 bytes from 1.1.1.1: icmp_seq=2 ttl=64 time=0.110 ms
+
+--- 1.1.1.1 ping statistics ---
+ 2 packets transmitted, 2 received, 0% packet loss, time 1001ms
+rtt min/avg/max/mdev = 0.110/0.116/0.122/0.006 ms"""
+
+    # Act
+    result = DnosPingDecipher.decipher(cli_response)
+
+    # Assert
+    assert result.status.name == "OK"
+    assert result.responses == {
+        0: _echo("1", "0.122"),
+        1: _echo("2", "0.110"),
+        2: PingResponse(
+            source="1.1.1.1",
+            time=0,
+            sent="2",
+            received="2",
+            min_time="0.110",
+            avg_time="0.116",
+            max_time="0.122",
+            std_dev="0.006",
+            bytes=0,
+            sequence=0,
+            ttl=0,
+        ),
+    }
+
+
+def test_ping_parser_without_time():
+    # Arrange
+    # the time and the rtt line are missing when the size is < 16
+    cli_response = """PING 1.1.1.1 (1.1.1.1) 8(36) bytes of data.
+16 bytes from 1.1.1.1: icmp_seq=1 ttl=64
+
+--- 1.1.1.1 ping statistics ---
+1 packets transmitted, 1 received, 0% packet loss, time 0ms
+"""
+
+    # Act
+    result = DnosPingDecipher.decipher(cli_response)
+
+    # Assert
+    assert result.responses[0].time == 0
+    assert result.responses[0].bytes == "16"
+    assert result.responses[1].sent == "1"
+    assert result.responses[1].min_time == 0
+
+
+def test_ping_parser_error():
+    # Arrange
+    cli_response = "ping: unknown host"
+
+    # Act
+    result = DnosPingDecipher.decipher(cli_response)
+
+    # Assert
+    assert result.status.name == "ERROR"
+    assert result.result_message == cli_response
@@ -0,0 +1,67 @@
+import pytest
+
+from automation_utils.helpers.deciphers.common.table import (
+    Column,
+    Table,
+    TableDecipher,
+)
+
+CLI_RESPONSE = """
+Interfaces:
+
+| Interface   | Admin    | MTU  | Description |
++-------------+----------+------+-------------+
+| bundle-1    | enabled  | 9192 | core        |
+| bundle-2    |          | 9192 |             |
+| bundle-3    | enabled  | N/A  | edge        |
+"""
+
+# a row with a missing "|" is parsed row by row, the complete ones are read
+IRREGULAR_CLI_RESPONSE = CLI_RESPONSE.replace("+-------------+", "|-------------|") + "| bundle-4 | enabled |\n"
+
+
+def test_table_rows():
+    # Arrange
+    table = Table(Column("Interface"), Column("MTU", convert=int), skip_invalid_rows=True)
+    admin_table = Table(Column("Interface"), Column("Admin", required=True))
+
+    # Act
+    rows = table.rows(CLI_RESPONSE)
+    admin_rows = admin_table.rows(CLI_RESPONSE)
+    irregular_admin_rows = admin_table.rows(IRREGULAR_CLI_RESPONSE)
+
+    # Assert
+    assert rows == [("bundle-1", 9192), ("bundle-2", 9192)]
+    assert admin_rows == [("bundle-1", "enabled"), ("bundle-3", "enabled")]
+    assert irregular_admin_rows == admin_rows + [("bundle-4", "enabled")]
+    assert table.rows("no table") == []
+
+
+def test_table_errors():
+    # Arrange
+    table = Table(Column("Interface"), Column("MTU", convert=int))
+    missing_column_table = Table(Column("Interface"), Column("Speed"))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        table.rows(CLI_RESPONSE)
+    with pytest.raises(ValueError, match="Speed"):
+        missing_column_table.rows(CLI_RESPONSE)
+
+
+class MtuDecipher(TableDecipher):
+    TABLE = Table(Column("Interface"), Column("MTU", convert=int), skip_invalid_rows=True)
+
+
+@pytest.mark.parametrize("cli_response", [CLI_RESPONSE, IRREGULAR_CLI_RESPONSE])
+def test_table_decipher_streaming(cli_response):
+    # Arrange
+    stream = MtuDecipher.streaming()
+
+    # Act - stream the output in chunks splitting the lines
+    for i in range(0, len(cli_response), 7):
+        stream.feed(cli_response[i : i + 7])
+    result = stream.finish()
+
+    # Assert
+    assert result == MtuDecipher.decipher(cli_response) == {"bundle-1": 9192, "bundle-2": 9192}
@@ -0,0 +1,157 @@
+import pytest
+
+from automation_utils.common.exceptions import TopologyException
+from automation_utils.topology.path_query import compile_path
+
+TOPOLOGY_DATA = {
+    "network": {
+        "asn": 7922,
+        "sites": [
+            {
+                "name": "site-0",
+                "devices": [
+                    {
+                        "name": "tcr01",
+                        "ports": [{"interface-id": "ge100-0/0/0"}],
+                        "lags": [{"interface-id": "bundle-1", "mtu": 9000}],
+                    },
+                    {
+                        "name": "tcr02",
+                        "ports": [{"interface-id": "ge100-0/0/1"}],
+                        "lags": [],
+                    },
+                ],
+            },
+            {
+                "name": "site-1",
+                "devices": [
+                    {
+                        "name": "tcr03",
+                        "ports": [
+                            {"interface-id": "ge100-0/0/2"},
+                            {"interface-id": "ge100-0/0/3"},
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+}
+
+
+def test_path_query_get_traverses_nested_lists():
+    # Act
+    asn = compile_path("network/asn").get(TOPOLOGY_DATA)
+    sites = compile_path("/network/sites/").get(TOPOLOGY_DATA)
+    ports = compile_path("network/sites/devices/ports/interface-id").get(TOPOLOGY_DATA)
+    lags = compile_path("network/sites/devices/lags").get(
+        TOPOLOGY_DATA, raise_exc_on_failure=False
+    )
+
+    # Assert
+    assert asn == 7922
+    assert sites is TOPOLOGY_DATA["network"]["sites"]
+    assert ports == ["ge100-0/0/0", "ge100-0/0/1", "ge100-0/0/2", "ge100-0/0/3"]
+    assert lags == [{"interface-id": "bundle-1", "mtu": 9000}]
+
+
+def test_path_query_missing_path():
+    # Act
+    missing = compile_path("network/sites/devices/loopbacks").get(
+        TOPOLOGY_DATA, raise_exc_on_failure=False
+    )
+
+    # Assert
+    assert missing is None
+    with pytest.raises(TopologyException, match="network/sites/devices/"):
+        compile_path("network/sites/devices/lags").get(TOPOLOGY_DATA)
+
+
+def test_path_query_predicates_and_iter():
+    # Act
+    ports = list(
+        compile_path("network/sites/devices[name=tcr03]/ports").iter(TOPOLOGY_DATA)
+    )
+    lags = list(
+        compile_path("network/sites/devices/lags[mtu=9000]/interface-id").iter(
+            TOPOLOGY_DATA
+        )
+    )
+    no_devices = compile_path("network/sites/devices[name=tcr09]").get(TOPOLOGY_DATA)
+
+    # Assert
+    assert ports == [{"interface-id": "ge100-0/0/2"}, {"interface-id": "ge100-0/0/3"}]
+    assert lags == ["bundle-1"]
+    assert no_devices is None
+    assert compile_path("network/asn") is compile_path("network/asn")
+
+
+class UntouchableDevice(dict):
+    """A device whose fields must not be read"""
+
+    def __contains__(self, key):
+        raise AssertionError(f"{key} was read")
+
+    def __getitem__(self, key):
+        raise AssertionError(f"{key} was read")
+
+
+def test_path_query_iter_is_lazy():
+    # Arrange
+    topology_data = {
+        "network": {
+            "sites": [
+                {"devices": [{"name": "tcr01"}, {"name": "tcr02"}]},
+                {"devices": [UntouchableDevice(name="tcr03")]},
+            ]
+        }
+    }
+
+    # Act
+    names = compile_path("network/sites/devices/name").iter(topology_data)
+    first_names = [next(names), next(names)]
+    lags = compile_path("network/sites/devices/lags/interface-id").iter(
+        TOPOLOGY_DATA, raise_exc_on_failure=True
+    )
+    first_lag = next(lags)
+
+    # Assert
+    # the devices of the next site are read only when the iteration reaches them
+    assert first_names == ["tcr01", "tcr02"]
+    with pytest.raises(AssertionError, match="name was read"):
+        next(names)
+    # the elements found before a missing path are yielded first, tcr03 has no lags
+    assert first_lag == "bundle-1"
+    with pytest.raises(TopologyException, match="network/sites/devices/"):
+        next(lags)
+
+
+def test_path_query_predicates_compare_the_json_spelling():
+    # Arrange
+    topology_data = {
+        "ports": [
+            {"interface-id": "ge100-0/0/0", "enabled": True, "mtu": 9000, "description": None},
+            {"interface-id": "ge100-0/0/1", "enabled": False, "mtu": 1514.5, "description": "true"},
+        ]
+    }
+
+    def interfaces(path):
+        return [port["interface-id"] for port in compile_path(path).iter(topology_data)]
+
+    # Act
+    enabled = interfaces("ports[enabled=true]")
+    disabled = interfaces("ports[enabled=false]")
+    python_spelling = interfaces("ports[enabled=True]")
+    mtu = interfaces("ports[mtu=9000]")
+    float_mtu = interfaces("ports[mtu=1514.5]")
+    no_description = interfaces("ports[description=null]")
+    true_description = interfaces("ports[description=true][enabled=false]")
+
+    # Assert
+    assert enabled == ["ge100-0/0/0"]
+    assert disabled == ["ge100-0/0/1"]
+    assert python_spelling == []
+    assert mtu == ["ge100-0/0/0"]
+    assert float_mtu == ["ge100-0/0/1"]
+    assert no_description == ["ge100-0/0/0"]
+    assert true_description == ["ge100-0/0/1"]
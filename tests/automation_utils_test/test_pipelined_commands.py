@@ -0,0 +1,88 @@
+import pytest
+
+from automation_utils.common.exceptions import CommandFailed
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .fakes import FakeDevice
+
+PROMPT = "dnos# "
+COMMANDS = ["show system", "show interfaces", "show lldp neighbors"]
+UNKNOWN_COMMAND = "ERROR: Unknown word: 'interfacez'"
+
+
+def _responder(command):
+    if command == "show interfacez":
+        return UNKNOWN_COMMAND
+    return "\r\n".join(f"{command} line {i}" for i in range(3))
+
+
+def _client(device) -> SSHClient:
+    client = SSHClient(hostname="tcr01", username="user", password="password")
+    client.shell = device.channel
+    client.is_connected = lambda: True
+    return client
+
+
+def test_execute_shell_commands_returns_the_outputs_in_order():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT, chunk_size=7)
+    client = _client(device)
+
+    # Act
+    outputs = client.execute_shell_commands(COMMANDS, shows_output=True, batch_size=2)
+    device.close()
+
+    # Assert
+    assert outputs == [_responder(command).replace("\r", "") for command in COMMANDS]
+
+
+def test_split_pipelined_output_ignores_lookalike_prompts():
+    # Arrange
+    # the first output has lines ending with the next command, after another prompt or in the middle of a line
+    first_output = "\n".join(
+        [
+            "description tcr01# show interfaces",
+            "alias 'si' is show interfaces",
+            f"{PROMPT}show interfaces | no-more",
+        ]
+    )
+    output = f"show system\n{first_output}\n{PROMPT}show interfaces\nbundle-1 up\n{PROMPT}"
+
+    # Act
+    outputs = SSHClient._split_pipelined_output(output, ["show system", "show interfaces"])
+
+    # Assert
+    assert outputs == [first_output, "bundle-1 up"]
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "show system\nsystem up\n",
+        f"show system\nsystem up\n{PROMPT}show interfaces\nbundle-1 up",
+        f"show system\nsystem up\n{PROMPT}show interfaces\nbundle-1 up\n{PROMPT[:-1]}",
+    ],
+)
+def test_split_pipelined_output_waits_for_the_last_prompt(output):
+    # Act
+    outputs = SSHClient._split_pipelined_output(output, ["show system", "show interfaces"])
+
+    # Assert
+    assert outputs is None
+
+
+def test_execute_shell_commands_command_failure_mid_batch():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT)
+    client = _client(device)
+    commands = ["show system", "show interfacez", "show lldp neighbors"]
+
+    # Act
+    with pytest.raises(CommandFailed) as failure:
+        client.execute_shell_commands(commands, shows_output=True, additional_cmd_failures=["ERROR"])
+    outputs = client.execute_shell_commands(commands, shows_output=True, validate_output=False)
+    device.close()
+
+    # Assert
+    assert str(failure.value) == UNKNOWN_COMMAND
+    assert outputs == [_responder(command).replace("\r", "") for command in commands]
@@ -0,0 +1,33 @@
+from automation_utils.topology.prefix_index import PrefixIndex, as_ip_address
+from automation_utils.topology.topology_data import IpAddress
+
+
+def test_prefix_index_longest_prefix_match():
+    # Arrange
+    index = PrefixIndex()
+    index.add("10.0.0.0/8", "aggregate")
+    index.add(IpAddress(address="10.1.0.0/31"), "link-0")
+    index.add("10.1.0.0/31", "duplicate")
+    index.add("2001:db8:1::/127", "link-1")
+
+    # Act
+    results = [
+        index.lookup(address)
+        for address in ("10.1.0.1", "10.1.0.2", "11.0.0.1", "2001:db8:1::1", "2001:db8:2::1")
+    ]
+
+    # Assert
+    assert results == ["link-0", "aggregate", None, "link-1", None]
+    assert index.lookup(IpAddress(address="10.1.0.0/24")) == "link-0"
+    assert len(index) == 3
+
+
+def test_as_ip_address_defaults_to_host_prefixes():
+    # Act
+    ipv4 = as_ip_address("10.0.0.1")
+    ipv6 = as_ip_address("2001:db8::1")
+
+    # Assert
+    assert (ipv4.cidr_mask, ipv4.bits) == (32, 32)
+    assert (ipv6.cidr_mask, ipv6.bits) == (128, 128)
+    assert as_ip_address(ipv4) is ipv4
@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+
+from automation_utils.cli.cli_dnos import CliDnos
+from automation_utils.cli.session_pool import SessionPool
+from automation_utils.common import exceptions
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .fakes import FakeDevice
+
+PROMPT = "dnos# "
+LATENCY = 0.3
+UNREACHABLE = "tcr99"
+
+
+class FakeConnection:
+    """Mimics a paramiko client connected to a FakeDevice, until it is closed or the connection drops"""
+
+    def __init__(self):
+        self.device = FakeDevice(responder=lambda command: f"output of {command}", prompt=PROMPT, latency=LATENCY)
+        self.active = True
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return self.active
+
+    def close(self):
+        self.active = False
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """the connections opened by the sessions, instead of connecting to the devices"""
+    opened = []
+
+    def open_session(ssh):
+        if ssh.hostname == UNREACHABLE:
+            raise exceptions.ConnectionFail(f"{ssh.hostname} is unreachable")
+        ssh._session = FakeConnection()
+        ssh.shell = ssh._session.device.channel
+        # the prompt printed on login
+        ssh.shell.feed(PROMPT.encode())
+        opened.append(ssh._session)
+
+    monkeypatch.setattr(SSHClient, "open_session", open_session)
+    yield opened
+    for connection in opened:
+        connection.device.close()
+
+
+def _sessions(*names) -> dict[str, CliDnos]:
+    return {name: CliDnos(name, "user", "password") for name in names}
+
+
+def _hold_lock(ssh, released: threading.Event) -> threading.Thread:
+    """:returns: a thread holding the session lock, as a command does, until released is set"""
+    acquired = threading.Event()
+
+    def hold():
+        with ssh.lock:
+            acquired.set()
+            released.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    acquired.wait(5)
+    return thread
+
+
+def test_open_all_applies_keepalive_to_the_opened_sessions(connections):
+    # Arrange
+    sessions = _sessions("tcr01", "tcr02", "tcr03")
+    pool = SessionPool(sessions, keepalive_interval=10)
+
+    # Act
+    failures = pool.open_all(["tcr01", "tcr02"])
+
+    # Assert
+    assert failures == {}
+    assert [session.ssh.keepalive_interval for session in sessions.values()] == [10, 10, 0]
+    assert [session.ssh.is_connected() for session in sessions.values()] == [True, True, False]
+
+
+def test_check_sessions_reconnects_dead_sessions(connections):
+    # Arrange
+    sessions = _sessions("tcr01", "tcr02", "tcr03")
+    pool = SessionPool(sessions)
+    pool.open_all(["tcr01", "tcr02"])
+    sessions["tcr03"].open_session()
+    for connection in connections:
+        connection.active = False
+
+    # Act
+    pool.check_sessions()
+
+    # Assert
+    # only the sessions opened by the pool are reconnected
+    assert [session.ssh.is_connected() for session in sessions.values()] == [True, True, False]
+    assert len(connections) == 5
+    assert sessions["tcr01"].ssh.execute_shell_command("show system", shows_output=True) == "output of show system"
+    assert pool.stats().reconnects == 2
+
+
+def test_check_sessions_skips_busy_sessions(connections):
+    # Arrange
+    sessions = _sessions("tcr01")
+    pool = SessionPool(sessions)
+    pool.open_all()
+    channel = sessions["tcr01"].ssh.shell
+    on_send, sent = channel.on_send, threading.Event()
+    channel.on_send = lambda data: (on_send(data), sent.set())
+    outputs = []
+    command = threading.Thread(
+        target=lambda: outputs.append(
+            sessions["tcr01"].ssh.execute_shell_command("show system", shows_output=True)
+        ),
+    )
+    command.start()
+    # the connection drops while the command waits for its output
+    sent.wait(5)
+    connections[0].active = False
+
+    # Act
+    start = time.monotonic()
+    pool.check_sessions()
+    elapsed = time.monotonic() - start
+    command.join(5)
+
+    # Assert
+    assert elapsed < LATENCY
+    assert outputs == ["output of show system"]
+    assert len(connections) == 1
+    assert pool.stats().reconnects == 0
+
+
+def test_stats(connections):
+    # Arrange
+    sessions = _sessions("tcr01", "tcr02", "tcr03", UNREACHABLE)
+    pool = SessionPool(sessions)
+    failures = pool.open_all(["tcr01", "tcr02", UNREACHABLE])
+    released = threading.Event()
+    busy = _hold_lock(sessions["tcr02"].ssh, released)
+
+    # Act
+    stats = pool.stats()
+    released.set()
+    busy.join(5)
+
+    # Assert
+    assert list(failures) == [UNREACHABLE]
+    assert (stats.open, stats.idle, stats.closed) == (2, 1, 2)
+    assert (stats.reconnects, stats.connect_failures) == (0, 1)
+    assert stats.connect_latency["0.5"] == 2
+    assert sum(stats.connect_latency.values()) == 2
@@ -0,0 +1,35 @@
+from automation_utils.common.vendors import Vendors
+from automation_utils.device import Device
+from automation_utils.session_registry import LazySessions, SessionFactoryRegistry
+
+
+class FakeSession:
+    def __init__(self, hostname, username, password):
+        self.hostname = hostname
+
+
+def test_lazy_sessions_are_created_on_first_access(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(SessionFactoryRegistry, "_factories", {})
+    SessionFactoryRegistry.register_session_factory(Vendors.DRIVENETS)(FakeSession)
+    created = []
+    sessions = LazySessions(
+        {
+            "tcr01": Device("10.0.0.1", "user", "password", "DriveNets"),
+            "tcr02": Device("10.0.0.2", "user", "password", "drivenets"),
+        },
+        on_create=lambda name, session: created.append(name),
+    )
+
+    # Act
+    names = list(sessions)
+    is_member = "tcr01" in sessions
+    session = sessions["tcr01"]
+
+    # Assert
+    assert names == ["tcr01", "tcr02"] and is_member
+    assert session.hostname == "10.0.0.1"
+    assert sessions["tcr01"] is session
+    assert sessions.get("tcr03") is None
+    assert created == ["tcr01"]
+    assert list(sessions.created()) == ["tcr01"]
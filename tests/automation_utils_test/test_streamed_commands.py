@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from automation_utils.common.exceptions import CommandFailed
+from automation_utils.ssh_client import consts
+from automation_utils.ssh_client.ssh_client import SSHClient
+
+from .fakes import FakeDevice
+
+PROMPT = "dnos# "
+LINES = "\r\n".join(f"| ncc-{i} | active-up |" for i in range(1000))
+FAILURE = "ERROR: card ncc-1000 is not responding"
+
+
+class OutputStream:
+    def __init__(self):
+        self.chunks = []
+
+    def feed(self, text):
+        self.chunks.append(text)
+
+
+def _responder(command):
+    if command == "show system":
+        return f"{LINES}\r\n{FAILURE}\r\n{LINES}"
+    return f"output of {command}"
+
+
+def test_streamed_output_failure_past_the_head():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT, chunk_size=4096)
+    client = SSHClient(hostname="tcr01", username="user", password="password")
+    client.shell = device.channel
+    client.is_connected = lambda: True
+    stream = OutputStream()
+
+    # Act
+    with pytest.raises(CommandFailed) as failure:
+        client.execute_shell_command(
+            "show system", shows_output=True, additional_cmd_failures=["ERROR"], output_stream=stream
+        )
+    next_output = client.execute_shell_command("show interfaces", shows_output=True)
+    device.close()
+
+    # Assert
+    assert _responder("show system").index(FAILURE) > consts.STREAMED_OUTPUT_HEAD_SIZE
+    assert str(failure.value) == FAILURE
+    # the whole output was read before raising, the session is ready for the next command
+    assert "".join(stream.chunks).rstrip() == _responder("show system").replace("\r", "")
+    assert next_output == "output of show interfaces"
+
+
+def test_streamed_output_consumer_error_on_an_early_chunk():
+    # Arrange
+    device = FakeDevice(responder=_responder, prompt=PROMPT, chunk_size=1024, chunk_delay=0.005)
+    client = SSHClient(hostname="tcr01", username="user", password="password")
+    client.shell = device.channel
+    client.is_connected = lambda: True
+
+    class FailingStream:
+        fed = 0
+
+        def feed(self, text):
+            self.fed += 1
+            raise ValueError(f"can't decipher {text[:10]!r}")
+
+    stream = FailingStream()
+
+    # Act
+    with pytest.raises(ValueError):
+        client.execute_shell_command("show system", shows_output=True, output_stream=stream)
+    time.sleep(0.05)
+    unread_output = device.channel.recv_ready()
+    next_output = client.execute_shell_command("show interfaces", shows_output=True)
+    device.close()
+
+    # Assert
+    # the stream is not fed after its error, but the whole output was read before raising it
+    assert stream.fed == 1
+    assert not unread_output
+    assert next_output == "output of show interfaces"
@@ -0,0 +1,133 @@
+import io
+import json
+import pickle
+
+import pytest
+
+from automation_utils.topology import topology_data
+from automation_utils.topology.topology_data import IpAddress
+
+LINK = {
+    "ipv4_subnet": "100.0.0.0/31",
+    "ipv6_subnet": "2001:db8:1::/127",
+    "type": "p2p",
+    "designed-distance": 1,
+    "bundle": False,
+    "member-ports": 1,
+    "member-speed": 100,
+    "a": "tcr01",
+    "a_interface": "bundle-1",
+    "z": "tcr02",
+    "z_interface": "bundle-1",
+    "a_site": "site-0",
+    "a_is_device": True,
+    "z_site": "site-0",
+    "z_is_device": True,
+    "key": "link-0",
+}
+
+LAG = {
+    "interface-type": "lag",
+    "interface-id": "bundle-1",
+    "members": ["ge100-0/0/0"],
+    "link": "link-0",
+    "link-type": "p2p",
+    "interface": "bundle-1",
+    "ipv4_address": "100.0.0.0/31",
+    "ipv6_address": "2001:db8:1::/127",
+}
+
+# not a link or a lag, their addresses are not converted
+PARTIAL_LINK = {
+    "a": "tcr01",
+    "a_interface": "bundle-2",
+    "z": "tcr03",
+    "z_interface": "bundle-1",
+    "ipv4_subnet": "100.0.0.2/31",
+    "ipv6_subnet": "",
+}
+EXTENDED_LAG = dict(LAG, description="to tcr03", ipv4_address="100.0.0.2/31")
+
+INVENTORY = {
+    "name": "test",
+    "type": "network",
+    "adjacent-networks": "",
+    "network": {
+        "name": "test",
+        "sites": [
+            {"name": "site-0", "devices": [{"name": "tcr01", "lags": [LAG, EXTENDED_LAG]}]}
+        ],
+        "topology-l2l3": [LINK, PARTIAL_LINK],
+    },
+}
+
+
+@pytest.mark.parametrize("use_fast_json", [True, False])
+def test_load_inventory_converts_the_addresses(use_fast_json):
+    # Arrange
+    reader = io.BytesIO(json.dumps(INVENTORY).encode())
+    expected = json.loads(
+        json.dumps(INVENTORY), object_hook=topology_data.deserialization_hook
+    )
+
+    # Act
+    inventory = topology_data.load_inventory(reader, use_fast_json=use_fast_json)
+
+    # Assert
+    link = inventory["network"]["topology-l2l3"][0]
+    lag = inventory["network"]["sites"][0]["devices"][0]["lags"][0]
+    assert link["ipv4_subnet"] == IpAddress(address="100.0.0.0/31")
+    assert lag["ipv6_address"].cidr_mask == 127
+    assert inventory["network"]["topology-l2l3"][1] == PARTIAL_LINK
+    assert inventory["network"]["sites"][0]["devices"][0]["lags"][1] == EXTENDED_LAG
+    assert inventory == expected
+
+
+def test_deserialization_hook_matches_exact_key_sets():
+    # Act
+    lag = topology_data.deserialization_hook(dict(LAG))
+    partial_lag = topology_data.deserialization_hook(
+        {"interface-id": "bundle-2", "ipv4_address": "10.0.0.0/31"}
+    )
+
+    # Assert
+    assert isinstance(lag["ipv4_address"], IpAddress)
+    assert partial_lag["ipv4_address"] == "10.0.0.0/31"
+    assert topology_data.is_instance_of(LINK, topology_data.TopologyL2L3)
+    assert not topology_data.is_instance_of(LAG, topology_data.TopologyL2L3)
+
+
+def test_ip_address_equality_and_containment():
+    # Arrange
+    subnet = IpAddress(address="100.0.0.0/31")
+    ipv6_subnet = IpAddress(address="2001:db8:1::/127")
+
+    # Act
+    same_ipv6 = IpAddress(address="2001:0db8:0001:0000::/127")
+
+    # Assert
+    assert (subnet.subnet, subnet.cidr_mask, subnet.version) == ("100.0.0.0", 31, 4)
+    assert ipv6_subnet == same_ipv6 and hash(ipv6_subnet) == hash(same_ipv6)
+    assert subnet != IpAddress(address="100.0.0.0/30")
+    assert IpAddress(address="100.0.0.1/31") in subnet
+    assert "100.0.0.2" not in subnet
+    assert "2001:db8:1::1" in ipv6_subnet and "2001:db8:1::1" not in subnet
+    assert ipv6_subnet.network.num_addresses == 2
+
+
+def test_ip_address_is_immutable_and_validated():
+    # Arrange
+    address = IpAddress(address="10.0.0.1/24")
+
+    # Act
+    copy = pickle.loads(pickle.dumps(address))
+
+    # Assert
+    assert copy == address and copy.address == "10.0.0.1/24"
+    with pytest.raises(AttributeError):
+        address.cidr_mask = 32
+    with pytest.raises(ValueError):
+        IpAddress(address="10.0.0.1")
+    for invalid in ("10.0.0.300/24", "10.0.0.1/33"):
+        with pytest.raises(ValueError):
+            IpAddress(address=invalid).packed
@@ -0,0 +1,108 @@
+import copy
+import json
+
+from automation_utils.topology.topology_diff import diff_inventories
+from automation_utils.topology.topology_manager import TopologyManager
+
+
+def _device(name, ports):
+    return {
+        "name": name,
+        "loopbacks": [{"id": "lo0", "ip_address": f"1.1.1.{name[-1]}/32"}],
+        "lags": [],
+        "ports": [{"interface-id": port} for port in ports],
+    }
+
+
+def _link(key, a, a_interface, z, z_interface):
+    return {
+        "key": key,
+        "a": a,
+        "a_interface": a_interface,
+        "z": z,
+        "z_interface": z_interface,
+    }
+
+
+INVENTORY = {
+    "name": "test",
+    "network": {
+        "sites": [
+            {
+                "name": "site-0",
+                "devices": [
+                    _device("tcr1", ["ge100-0/0/0", "ge100-0/0/1"]),
+                    _device("tcr2", ["ge100-0/0/0"]),
+                    _device("tcr3", ["ge100-0/0/0"]),
+                ],
+            }
+        ],
+        "topology-l2l3": [
+            _link("link-0", "tcr1", "ge100-0/0/0", "tcr2", "ge100-0/0/0"),
+            _link("link-1", "tcr1", "ge100-0/0/1", "tcr3", "ge100-0/0/0"),
+        ],
+    },
+}
+
+
+def _changed_inventory():
+    inventory = copy.deepcopy(INVENTORY)
+    devices = inventory["network"]["sites"][0]["devices"]
+    # tcr3 is removed, tcr4 is added and tcr2 gets a new port
+    devices.pop()
+    devices.append(_device("tcr4", ["ge100-0/0/0"]))
+    devices[1]["ports"].append({"interface-id": "ge100-0/0/1"})
+    links = inventory["network"]["topology-l2l3"]
+    links[1] = _link("link-1", "tcr1", "ge100-0/0/1", "tcr4", "ge100-0/0/0")
+    links.append(_link("link-2", "tcr2", "ge100-0/0/1", "tcr4", "ge100-0/0/1"))
+    return inventory
+
+
+def test_diff_inventories():
+    # Arrange
+    previous = copy.deepcopy(INVENTORY)
+    current = _changed_inventory()
+
+    # Act
+    diff = diff_inventories(previous, current)
+    unchanged = diff_inventories(previous, copy.deepcopy(INVENTORY))
+
+    # Assert
+    assert (diff.added_devices, diff.removed_devices, diff.changed_devices) == (
+        ["tcr4"],
+        ["tcr3"],
+        ["tcr2"],
+    )
+    assert [link["key"] for link in diff.added_links] == ["link-2"]
+    assert [new["z"] for _, new in diff.changed_links] == ["tcr4"]
+    assert diff.affected_devices == ["tcr1", "tcr2", "tcr4"]
+    # the unchanged device and link are the objects of the previous inventory
+    assert current["network"]["sites"][0]["devices"][0] is previous["network"]["sites"][0]["devices"][0]
+    assert current["network"]["topology-l2l3"][0] is previous["network"]["topology-l2l3"][0]
+    assert not unchanged.changed
+
+
+def test_reload_updates_the_indexes(tmp_path):
+    # Arrange
+    topology_file = tmp_path / "topology.json"
+    topology_file.write_text(json.dumps(INVENTORY))
+    manager = TopologyManager()
+    manager.load(str(topology_file))
+    tcr1 = manager.get_device("tcr1")
+    topology_file.write_text(json.dumps(_changed_inventory()))
+
+    # Act
+    diff = manager.reload()
+    unchanged = manager.reload()
+    # the index dicts updated by reload, _build_indexes builds new ones
+    incremental = (manager._device_index, manager._interface_index, manager._peer_index)
+    manager._build_indexes()
+
+    # Assert
+    assert diff.affected_devices == ["tcr1", "tcr2", "tcr4"]
+    assert not unchanged.changed
+    assert incremental == (manager._device_index, manager._interface_index, manager._peer_index)
+    assert manager.get_device("tcr1") is tcr1
+    assert manager.get_device("tcr3") is None
+    assert manager.get_peer_interface("tcr1", "ge100-0/0/1") == ("tcr4", "ge100-0/0/0")
+    assert manager.get_interface("tcr2", "ge100-0/0/1") == {"interface-id": "ge100-0/0/1"}
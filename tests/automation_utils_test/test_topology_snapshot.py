@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from automation_utils.topology import snapshot, topology_data
+from automation_utils.topology.topology_manager import TopologyManager
+
+from .test_topology_data import INVENTORY as ADDRESSED_INVENTORY
+
+INVENTORY = {
+    "name": "test",
+    "type": "network",
+    "adjacent-networks": "",
+    "network": {
+        "name": "test",
+        "sites": [
+            {
+                "name": "site-0",
+                "devices": [
+                    {
+                        "name": "tcr01",
+                        "loopbacks": [],
+                        "lags": [],
+                        "ports": [{"interface-id": "ge100-0/0/0"}],
+                    }
+                ],
+            }
+        ],
+        "topology-l2l3": [
+            {
+                "a": "tcr01",
+                "a_interface": "ge100-0/0/0",
+                "z": "tcr02",
+                "z_interface": "ge100-0/0/0",
+            }
+        ],
+    },
+}
+
+
+def write_inventory(path, inventory):
+    path.write_text(json.dumps(inventory))
+    return str(path)
+
+
+def test_load_reuses_the_snapshot_of_an_unchanged_topology(tmp_path, monkeypatch):
+    # Arrange
+    topology_file = write_inventory(tmp_path / "topology.json", INVENTORY)
+    manager = TopologyManager()
+    manager.load(topology_file, use_snapshot=True)
+    monkeypatch.setattr(
+        "automation_utils.topology.topology_data.loads_inventory",
+        lambda *args, **kwargs: None,
+    )
+
+    # Act
+    manager.load(topology_file, use_snapshot=True)
+
+    # Assert
+    assert manager.inventory_data == INVENTORY
+    assert manager.get_peer_interface("tcr01", "ge100-0/0/0") == ("tcr02", "ge100-0/0/0")
+    assert manager.get_device("tcr01") is manager._device_index["tcr01"][0]
+    assert manager.get_device("tcr01") is manager.inventory_data["network"]["sites"][0]["devices"][0]
+
+
+def test_load_ignores_stale_and_corrupt_snapshots(tmp_path):
+    # Arrange
+    topology_file = write_inventory(tmp_path / "topology.json", INVENTORY)
+    manager = TopologyManager()
+    manager.load(topology_file, use_snapshot=True)
+    changed = json.loads(json.dumps(INVENTORY))
+    changed["network"]["name"] = "changed"
+    write_inventory(tmp_path / "topology.json", changed)
+
+    # Act
+    manager.load(topology_file, use_snapshot=True)
+    changed_name = manager.inventory_data["network"]["name"]
+    (tmp_path / "topology.json.snapshot").write_bytes(b"corrupt")
+    manager.load(topology_file, use_snapshot=True)
+
+    # Assert
+    assert changed_name == "changed"
+    assert manager.inventory_data == changed
+    assert snapshot.read_snapshot(
+        topology_file, snapshot.digest((tmp_path / "topology.json").read_bytes())
+    ) is not None
+
+
+@pytest.mark.parametrize("use_fast_json", [True, False])
+def test_load_matches_the_deserialization_hook(tmp_path, use_fast_json):
+    # Arrange
+    topology_file = write_inventory(tmp_path / "topology.json", ADDRESSED_INVENTORY)
+    expected = json.loads(
+        json.dumps(ADDRESSED_INVENTORY), object_hook=topology_data.deserialization_hook
+    )
+    manager = TopologyManager()
+
+    # Act
+    manager.load(topology_file, use_fast_json=use_fast_json, use_snapshot=True)
+    parsed = manager.inventory_data
+    manager.load(topology_file, use_fast_json=use_fast_json, use_snapshot=True)
+    restored = manager.inventory_data
+
+    # Assert
+    assert restored is not parsed
+    assert parsed == expected
+    assert restored == expected
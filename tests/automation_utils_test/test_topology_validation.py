@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+
+from automation_utils.cli.cli_dnos import CliDnos
+from automation_utils.common.exceptions import TopologyValidationFailed
+from automation_utils.common.vendors import Vendors
+from automation_utils.device import Device
+from automation_utils.device_manager import DeviceManager
+from automation_utils.topology.topology_manager import TopologyManager
+from automation_utils.topology.topology_validators.topology_validation_report import (
+    TopologyValidationFailure,
+    TopologyValidationReport,
+)
+from automation_utils.topology.topology_validators.topology_validation_types import TopologyValidationType
+from automation_utils.topology.topology_validators.topology_validator import (
+    TopologyValidatorBase,
+    TopologyValidatorRegistry,
+)
+
+from .fakes import FakeDevice
+
+DEVICES = ["tcr01", "tcr02", "tcr03", "tcr04"]
+VALIDATION_TYPES = [
+    TopologyValidationType.SYSTEM_STATUS,
+    TopologyValidationType.INTERFACES_STATUS,
+    TopologyValidationType.LLDP_NEIGHBORS,
+]
+FAILING = [
+    ("tcr02", TopologyValidationType.INTERFACES_STATUS),
+    ("tcr02", TopologyValidationType.LLDP_NEIGHBORS),
+    ("tcr04", TopologyValidationType.LLDP_NEIGHBORS),
+]
+
+
+def _failure_message(device, validation_type):
+    return f"{device} - {validation_type.value} check failed"
+
+
+class RecordingDevice(FakeDevice):
+    """Records the commands it receives"""
+
+    def __init__(self):
+        self.commands = []
+        super().__init__(responder=self._respond)
+
+    def _respond(self, command):
+        self.commands.append(command)
+        return f"output of {command}"
+
+
+class Validations:
+    """
+    Registers a fake validator for each validation type, instead of the drivenets validators.
+    Each of them sends "show system" to the device, and fails on the (device, validation type) in `failing`.
+    """
+
+    def __init__(self, monkeypatch):
+        self.calls = []
+        self.failing = set()
+        self.delay = 0.0
+        self._lock = threading.Lock()
+        monkeypatch.setattr(TopologyValidatorRegistry, "_validators", {})
+        for validation_type in VALIDATION_TYPES:
+            TopologyValidatorRegistry.register_validator(validation_type, Vendors.DRIVENETS)(
+                self._validator(validation_type)
+            )
+
+    def _validator(self, validation_type):
+        validations = self
+
+        class FakeValidator(TopologyValidatorBase):
+            def validate(self, device, **kwargs):
+                with validations._lock:
+                    validations.calls.append((device, validation_type))
+                self.device_manager.cli_sessions[device].send_command("show system")
+                time.sleep(validations.delay)
+                if (device, validation_type) in validations.failing:
+                    raise AssertionError(_failure_message(device, validation_type))
+
+        return FakeValidator
+
+    def device_calls(self, device):
+        return [validation_type for called_device, validation_type in self.calls if called_device == device]
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    return Validations(monkeypatch)
+
+
+@pytest.fixture
+def devices(monkeypatch):
+    """the fake devices the sessions of the inventory devices are connected to"""
+    fake_devices = {device: RecordingDevice() for device in DEVICES}
+    sessions = {}
+    for device, fake_device in fake_devices.items():
+        sessions[device] = CliDnos(device, "user", "password")
+        sessions[device].ssh.shell = fake_device.channel
+        sessions[device].ssh.is_connected = lambda: True
+    inventory = {device: Device(device, "user", "password", Vendors.DRIVENETS.value) for device in DEVICES}
+    monkeypatch.setattr(TopologyManager().inventory_manager, "devices", inventory)
+    monkeypatch.setattr(DeviceManager(), "cli_sessions", sessions)
+    yield fake_devices
+    for fake_device in fake_devices.values():
+        fake_device.close()
+
+
+def test_validate_topology_runs_the_validations_after_a_failure(validations, devices):
+    # Arrange
+    validations.failing.add(("tcr02", TopologyValidationType.SYSTEM_STATUS))
+
+    # Act
+    with pytest.raises(TopologyValidationFailed) as failure:
+        TopologyManager().validate_topology(VALIDATION_TYPES)
+
+    # Assert
+    assert failure.value.report.failed_devices == ["tcr02"]
+    assert validations.device_calls("tcr02") == VALIDATION_TYPES
+    assert all(validations.device_calls(device) == VALIDATION_TYPES for device in DEVICES)
+
+
+def test_validate_topology_keeps_the_validations_order_of_each_device(validations, devices):
+    # Arrange
+    validations.delay = 0.01
+
+    # Act
+    report = TopologyManager().validate_topology(VALIDATION_TYPES, max_workers=len(DEVICES))
+
+    # Assert
+    assert report.passed
+    assert report.devices == DEVICES
+    # the devices were validated concurrently
+    assert len({device for device, _ in validations.calls[: len(DEVICES)]}) > 1
+    assert all(validations.device_calls(device) == VALIDATION_TYPES for device in DEVICES)
+
+
+def test_validate_topology_report(validations, devices):
+    # Arrange
+    validations.failing.update(FAILING)
+
+    # Act
+    with pytest.raises(TopologyValidationFailed) as failure:
+        TopologyManager().validate_topology(VALIDATION_TYPES, max_workers=2)
+
+    # Assert
+    report = failure.value.report
+    assert not report.passed
+    assert report.devices == DEVICES
+    assert report.failed_devices == ["tcr02", "tcr04"]
+    assert report.failures == [
+        TopologyValidationFailure(
+            device, validation_type, _failure_message(device, validation_type), exception=None
+        )
+        for device, validation_type in FAILING
+    ]
+    assert all(isinstance(failure.exception, AssertionError) for failure in report.failures)
+    assert str(failure.value) == str(report)
+    assert str(report).splitlines() == [
+        "Topology validation failed on 2 out of 4 devices:",
+        " - tcr02 [interfaces_status]: tcr02 - interfaces_status check failed",
+        " - tcr02 [lldp_neighbors]: tcr02 - lldp_neighbors check failed",
+        " - tcr04 [lldp_neighbors]: tcr04 - lldp_neighbors check failed",
+    ]
+    assert str(TopologyValidationReport(devices=DEVICES)) == "Topology validation passed on 4 devices"
+
+
+def test_validate_topology_returns_the_report_without_raising(validations, devices):
+    # Arrange
+    validations.failing.add(("tcr03", TopologyValidationType.SYSTEM_STATUS))
+
+    # Act
+    report = TopologyManager().validate_topology(VALIDATION_TYPES, raise_on_failure=False)
+
+    # Assert
+    assert report.failed_devices == ["tcr03"]
+    assert [failure.validation_type for failure in report.failures] == [TopologyValidationType.SYSTEM_STATUS]
+
+
+def test_validate_topology_of_some_devices(validations, devices):
+    # Act
+    report = TopologyManager().validate_topology(VALIDATION_TYPES, devices=["tcr03", "tcr99", "tcr01"])
+
+    # Assert
+    # the devices missing from the inventory are skipped
+    assert report.devices == ["tcr03", "tcr01"]
+    assert [device for device in DEVICES if validations.device_calls(device)] == ["tcr01", "tcr03"]
+    assert devices["tcr02"].commands == []
+
+
+@pytest.mark.parametrize("cache_commands, sent", [(True, 1), (False, len(VALIDATION_TYPES))])
+def test_validate_topology_caches_the_show_commands(validations, devices, cache_commands, sent):
+    # Act
+    TopologyManager().validate_topology(VALIDATION_TYPES, max_workers=2, cache_commands=cache_commands)
+
+    # Assert
+    # CliDnos disables the paging of show commands
+    assert [device.commands for device in devices.values()] == [["show system|no-more"] * sent] * len(DEVICES)
+    # the cache only lives during the validation
+    assert all(session.command_cache is None for session in DeviceManager().cli_sessions.values())